@@ -14,10 +14,15 @@
 import numpy
 import time
 
+from openfermion.hamiltonians import mean_field_dwave
 from openfermion.ops import (FermionOperator,
                              InteractionOperator,
                              normal_ordered)
-from openfermion.transforms import get_fermion_operator, jordan_wigner
+from openfermion.ops._quadratic_hamiltonian import (
+    antisymmetric_canonical_form)
+from openfermion.transforms import (get_fermion_operator,
+                                    get_quadratic_hamiltonian,
+                                    jordan_wigner)
 from openfermion.utils import jordan_wigner_sparse
 
 
@@ -179,6 +184,29 @@ def benchmark_jordan_wigner_sparse(n_qubits):
     return runtime
 
 
+def benchmark_antisymmetric_canonical_form(x_dimension, y_dimension):
+    """Benchmark the canonical form of the Majorana matrix of a BdG model.
+
+    Args:
+        x_dimension: The width of the mean-field d-wave lattice.
+        y_dimension: The height of the mean-field d-wave lattice. The
+            Majorana matrix has dimension 4 * x_dimension * y_dimension.
+
+    Returns:
+        runtime: The time in seconds that the benchmark took.
+    """
+    # Get the Majorana matrix of a mean-field d-wave Hamiltonian.
+    quadratic_hamiltonian = get_quadratic_hamiltonian(
+        mean_field_dwave(x_dimension, y_dimension, tunneling=1., sc_gap=1.))
+    majorana_matrix, majorana_constant = quadratic_hamiltonian.majorana_form()
+
+    # Compute the canonical form.
+    start_time = time.time()
+    antisymmetric_canonical_form(majorana_matrix)
+    runtime = time.time() - start_time
+    return runtime
+
+
 # Run benchmarks.
 if __name__ == '__main__':
 
@@ -208,3 +236,11 @@ if __name__ == '__main__':
     runtime = benchmark_jordan_wigner_sparse(n_qubits)
     print('Construction of SparseOperator took {} seconds.'.format(
         runtime))
+
+    # Run antisymmetric_canonical_form() benchmark.
+    print('\nStarting test on antisymmetric_canonical_form().')
+    for x_dimension, y_dimension in [(5, 5), (10, 10), (20, 10), (25, 20)]:
+        runtime = benchmark_antisymmetric_canonical_form(x_dimension,
+                                                         y_dimension)
+        print('Canonical form of a {0} x {0} Majorana matrix took {1} '
+              'seconds.'.format(4 * x_dimension * y_dimension, runtime))
@@ -43,9 +43,9 @@ x_dimension by y_dimension. They can have periodic boundary conditions or not.
 """
 from __future__ import absolute_import
 
-from openfermion.ops import (FermionOperator,
-                             hermitian_conjugated,
-                             number_operator)
+import numpy
+
+from openfermion.ops import FermionOperator
 
 
 # Function to return up-orbital index given orbital index.
@@ -90,18 +90,15 @@ def fermi_hubbard(x_dimension, y_dimension, tunneling, coulomb,
     Returns:
         hubbard_model: An instance of the FermionOperator class.
     """
-    # Initialize fermion operator class.
+    # Initialize the terms and coefficients of the model.
     n_sites = x_dimension * y_dimension
-    if spinless:
-        n_spin_orbitals = n_sites
-    else:
-        n_spin_orbitals = 2 * n_sites
-    hubbard_model = FermionOperator((), 0.0)
+    terms = [()]
+    coefficients = [0.0]
     # select particle-hole symmetry
     if particle_hole_symmetry:
-        coulomb_shift = FermionOperator((), 0.5)
+        coulomb_shift = 0.5
     else:
-        coulomb_shift = FermionOperator((), 0.0)
+        coulomb_shift = 0.0
 
     # Loop through sites and add terms.
     for site in range(n_sites):
@@ -112,30 +109,25 @@ def fermi_hubbard(x_dimension, y_dimension, tunneling, coulomb,
             y_index = (site - 1) // x_dimension
             sign = (-1.) ** (x_index + y_index)
             coefficient = sign * chemical_potential
-            hubbard_model += number_operator(
-                n_spin_orbitals, site, coefficient)
+            terms.append(_number_term(site))
+            coefficients.append(coefficient)
 
         if chemical_potential and not spinless:
             coefficient = -1. * chemical_potential
-            hubbard_model += number_operator(
-                n_spin_orbitals, up_index(site), coefficient)
-            hubbard_model += number_operator(
-                n_spin_orbitals, down_index(site), coefficient)
+            terms += [_number_term(up_index(site)),
+                      _number_term(down_index(site))]
+            coefficients += [coefficient, coefficient]
 
         if magnetic_field and not spinless:
             coefficient = magnetic_field
-            hubbard_model += number_operator(
-                n_spin_orbitals, up_index(site), -coefficient)
-            hubbard_model += number_operator(
-                n_spin_orbitals, down_index(site), coefficient)
+            terms += [_number_term(up_index(site)),
+                      _number_term(down_index(site))]
+            coefficients += [-coefficient, coefficient]
 
         # Add local pair interaction terms.
         if not spinless:
-            operator_1 = number_operator(
-                n_spin_orbitals, up_index(site), 1.0) - coulomb_shift
-            operator_2 = number_operator(
-                n_spin_orbitals, down_index(site), 1.0) - coulomb_shift
-            hubbard_model += coulomb * operator_1 * operator_2
+            _add_coulomb_terms(terms, coefficients, up_index(site),
+                               down_index(site), coulomb, coulomb_shift)
 
         # Index coupled orbitals.
         right_neighbor = site + 1
@@ -152,57 +144,57 @@ def fermi_hubbard(x_dimension, y_dimension, tunneling, coulomb,
         if (site + 1) % x_dimension or (periodic and x_dimension > 2):
             if spinless:
                 # Add Coulomb term.
-                operator_1 = number_operator(
-                    n_spin_orbitals, site, 1.0) - coulomb_shift
-                operator_2 = number_operator(
-                    n_spin_orbitals, right_neighbor, 1.0) - coulomb_shift
-                hubbard_model += coulomb * operator_1 * operator_2
+                _add_coulomb_terms(terms, coefficients, site, right_neighbor,
+                                   coulomb, coulomb_shift)
 
                 # Add hopping term.
-                operators = ((site, 1), (right_neighbor, 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
+                _add_hopping_terms(terms, coefficients, site, right_neighbor,
+                                   tunneling)
             else:
                 # Add hopping term.
-                operators = ((up_index(site), 1),
-                             (up_index(right_neighbor), 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
-                operators = ((down_index(site), 1),
-                             (down_index(right_neighbor), 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
+                _add_hopping_terms(terms, coefficients, up_index(site),
+                                   up_index(right_neighbor), tunneling)
+                _add_hopping_terms(terms, coefficients, down_index(site),
+                                   down_index(right_neighbor), tunneling)
 
         # Add transition to neighbor below.
         if site + x_dimension + 1 <= n_sites or (periodic and y_dimension > 2):
             if spinless:
                 # Add Coulomb term.
-                operator_1 = number_operator(
-                    n_spin_orbitals, site, 1.0) - coulomb_shift
-                operator_2 = number_operator(
-                    n_spin_orbitals, bottom_neighbor, 1.0) - coulomb_shift
-                hubbard_model += coulomb * operator_1 * operator_2
+                _add_coulomb_terms(terms, coefficients, site, bottom_neighbor,
+                                   coulomb, coulomb_shift)
 
                 # Add hopping term.
-                operators = ((site, 1), (bottom_neighbor, 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
+                _add_hopping_terms(terms, coefficients, site, bottom_neighbor,
+                                   tunneling)
             else:
                 # Add hopping term.
-                operators = ((up_index(site), 1),
-                             (up_index(bottom_neighbor), 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
-                operators = ((down_index(site), 1),
-                             (down_index(bottom_neighbor), 0))
-                hopping_term = FermionOperator(operators, -tunneling)
-                hubbard_model += hopping_term
-                hubbard_model += hermitian_conjugated(hopping_term)
+                _add_hopping_terms(terms, coefficients, up_index(site),
+                                   up_index(bottom_neighbor), tunneling)
+                _add_hopping_terms(terms, coefficients, down_index(site),
+                                   down_index(bottom_neighbor), tunneling)
 
     # Return.
-    return hubbard_model
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
+
+
+def _number_term(orbital):
+    """Return the term a^dagger_orbital a_orbital."""
+    return (orbital, 1), (orbital, 0)
+
+
+def _add_coulomb_terms(terms, coefficients, orbital_1, orbital_2, coulomb,
+                       coulomb_shift):
+    """Append the expansion of
+    coulomb (n_orbital_1 - coulomb_shift) (n_orbital_2 - coulomb_shift)."""
+    terms += [_number_term(orbital_1) + _number_term(orbital_2),
+              _number_term(orbital_1), _number_term(orbital_2), ()]
+    coefficients += [coulomb, -coulomb * coulomb_shift,
+                     -coulomb * coulomb_shift, coulomb * coulomb_shift ** 2]
+
+
+def _add_hopping_terms(terms, coefficients, orbital_1, orbital_2, tunneling):
+    """Append -tunneling a^dagger_orbital_1 a_orbital_2 + h.c."""
+    terms += [((orbital_1, 1), (orbital_2, 0)),
+              ((orbital_2, 1), (orbital_1, 0))]
+    coefficients += [-tunneling, numpy.conjugate(-tunneling)]
@@ -151,7 +151,8 @@ def plane_wave_kinetic(grid, spinless=False):
         FermionOperator: The kinetic momentum operator.
     """
     # Initialize.
-    operator = FermionOperator()
+    terms = []
+    coefficients = []
     spins = [None] if spinless else [0, 1]
 
     # Loop once through all plane waves.
@@ -164,10 +165,10 @@ def plane_wave_kinetic(grid, spinless=False):
             orbital = orbital_id(grid, momenta_indices, spin)
 
             # Add interaction term.
-            operators = ((orbital, 1), (orbital, 0))
-            operator += FermionOperator(operators, coefficient)
+            terms.append(((orbital, 1), (orbital, 0)))
+            coefficients.append(coefficient)
 
-    return operator
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
 
 
 def plane_wave_potential(grid, spinless=False):
@@ -182,7 +183,8 @@ def plane_wave_potential(grid, spinless=False):
     """
     # Initialize.
     prefactor = 2. * numpy.pi / grid.volume_scale()
-    operator = FermionOperator((), 0.0)
+    terms = [()]
+    coefficients = [0.0]
     spins = [None] if spinless else [0, 1]
 
     # Pre-Computations.
@@ -238,12 +240,12 @@ def plane_wave_potential(grid, spinless=False):
                         # Add interaction term.
                         if ((orbital_a != orbital_b) and
                                 (orbital_c != orbital_d)):
-                            operators = ((orbital_a, 1), (orbital_b, 1),
-                                         (orbital_c, 0), (orbital_d, 0))
-                            operator += FermionOperator(operators, coefficient)
+                            terms.append(((orbital_a, 1), (orbital_b, 1),
+                                          (orbital_c, 0), (orbital_d, 0)))
+                            coefficients.append(coefficient)
 
     # Return.
-    return operator
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
 
 
 def dual_basis_jellium_model(grid, spinless=False,
@@ -264,7 +266,8 @@ def dual_basis_jellium_model(grid, spinless=False,
     # Initialize.
     n_points = grid.num_points()
     position_prefactor = 2. * numpy.pi / grid.volume_scale()
-    operator = FermionOperator()
+    terms = []
+    coefficients = []
     spins = [None] if spinless else [0, 1]
 
     # Pre-Computations.
@@ -313,24 +316,24 @@ def dual_basis_jellium_model(grid, spinless=False,
                 orbital_b[spin] = orbital_ids[grid_indices_b][spin]
             if kinetic:
                 for spin in spins:
-                    operators = ((orbital_a[spin], 1), (orbital_b[spin], 0))
-                    operator += FermionOperator(operators, kinetic_coefficient)
+                    terms.append(((orbital_a[spin], 1), (orbital_b[spin], 0)))
+                    coefficients.append(kinetic_coefficient)
             if potential:
                 for sa in spins:
                     for sb in spins:
                         if orbital_a[sa] == orbital_b[sb]:
                             continue
-                        operators = ((orbital_a[sa], 1), (orbital_a[sa], 0),
-                                     (orbital_b[sb], 1), (orbital_b[sb], 0))
-                        operator += FermionOperator(operators,
-                                                    potential_coefficient)
+                        terms.append(((orbital_a[sa], 1), (orbital_a[sa], 0),
+                                      (orbital_b[sb], 1), (orbital_b[sb], 0)))
+                        coefficients.append(potential_coefficient)
 
     # Include the Madelung constant if requested.
     if include_constant:
-        operator += FermionOperator.identity() * (2.8372 / grid.scale)
+        terms.append(())
+        coefficients.append(2.8372 / grid.scale)
 
     # Return.
-    return operator
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
 
 
 def dual_basis_kinetic(grid, spinless=False):
@@ -403,7 +406,8 @@ def jordan_wigner_dual_basis_jellium(grid, spinless=False,
         n_qubits = n_orbitals
     else:
         n_qubits = 2 * n_orbitals
-    hamiltonian = QubitOperator()
+    terms = []
+    coefficients = []
 
     # Compute vectors.
     momentum_vectors = {}
@@ -429,13 +433,13 @@ def jordan_wigner_dual_basis_jellium(grid, spinless=False,
         identity_coefficient /= 2.
 
     # Add identity term.
-    identity_term = QubitOperator((), identity_coefficient)
-    hamiltonian += identity_term
+    terms.append(())
+    coefficients.append(identity_coefficient)
 
     # Add local Z terms.
     for qubit in range(n_qubits):
-        qubit_term = QubitOperator(((qubit, 'Z'),), z_coefficient)
-        hamiltonian += qubit_term
+        terms.append(((qubit, 'Z'),))
+        coefficients.append(z_coefficient)
 
     # Add ZZ terms and XZX + YZY terms.
     zz_prefactor = numpy.pi / volume
@@ -470,8 +474,8 @@ def jordan_wigner_dual_basis_jellium(grid, spinless=False,
                                      momenta_squared)
 
             # Add ZZ term.
-            qubit_term = QubitOperator(((p, 'Z'), (q, 'Z')), zpzq_coefficient)
-            hamiltonian += qubit_term
+            terms.append(((p, 'Z'), (q, 'Z')))
+            coefficients.append(zpzq_coefficient)
 
             # Add XZX + YZY term.
             if skip_xzx_yzy:
@@ -479,12 +483,13 @@ def jordan_wigner_dual_basis_jellium(grid, spinless=False,
             z_string = tuple((i, 'Z') for i in range(p + 1, q))
             xzx_operators = ((p, 'X'),) + z_string + ((q, 'X'),)
             yzy_operators = ((p, 'Y'),) + z_string + ((q, 'Y'),)
-            hamiltonian += QubitOperator(xzx_operators, term_coefficient)
-            hamiltonian += QubitOperator(yzy_operators, term_coefficient)
+            terms += [xzx_operators, yzy_operators]
+            coefficients += [term_coefficient, term_coefficient]
 
     # Include the Madelung constant if requested.
     if include_constant:
-        hamiltonian += QubitOperator((),) * (2.8372 / grid.scale)
+        terms.append(())
+        coefficients.append(2.8372 / grid.scale)
 
     # Return Hamiltonian.
-    return hamiltonian
+    return QubitOperator.from_terms(terms, coefficients, validate=False)
@@ -13,12 +13,14 @@
 """Class and functions to store quantum chemistry data."""
 
 import h5py
+import hashlib
 import numpy
 import os
 import uuid
 
 from openfermion.config import *
-from openfermion.ops import InteractionOperator, InteractionRDM
+from openfermion.ops import (FermionOperator, InteractionOperator,
+                             InteractionRDM)
 
 
 """NOTE ON PQRS CONVENTION:
@@ -189,6 +191,106 @@ def geometry_from_file(file_name):
     return geometry
 
 
+# Names of the MolecularData properties loaded from file only upon demand.
+_LAZY_PROPERTIES = ('canonical_orbitals',
+                    'overlap_integrals',
+                    'one_body_integrals',
+                    'two_body_integrals',
+                    'cisd_one_rdm',
+                    'cisd_two_rdm',
+                    'fci_one_rdm',
+                    'fci_two_rdm',
+                    'ccsd_single_amps',
+                    'ccsd_double_amps')
+
+
+def _content_hash(data):
+    """Return a hash of the shape, type and contents of an array."""
+    data = numpy.ascontiguousarray(data)
+    return (data.shape, data.dtype.str, hashlib.sha1(data).hexdigest())
+
+
+def _dataset_names(f):
+    """Return the names of all datasets in an HDF5 file."""
+    names = []
+    f.visititems(lambda name, item: names.append(name) if
+                 isinstance(item, h5py.Dataset) else None)
+    return names
+
+
+def _same_layout(dataset, other_dataset):
+    """Return whether two datasets have the same shape and type."""
+    return (dataset.shape == other_dataset.shape and
+            dataset.dtype == other_dataset.dtype)
+
+
+def _is_placeholder(dataset):
+    """Return whether a dataset is the placeholder of an unset property."""
+    return dataset.shape == () and dataset.dtype.num == 0
+
+
+def _stored_value(data):
+    """Return the data read from a file, or None for a placeholder."""
+    if data.dtype.num == 0 or (data.dtype.kind == 'f' and data.shape == () and
+                               numpy.isnan(data)):
+        return None
+    return data
+
+
+def _escape_key(key):
+    """Turn a general calculation key into a valid dataset name."""
+    return key.replace('%', '%25').replace('/', '%2F')
+
+
+def _unescape_key(name):
+    """Recover the general calculation key from its dataset name."""
+    return name.replace('%2F', '/').replace('%25', '%')
+
+
+def _copy_dataset(source_file, destination_file, name):
+    """Copy a dataset between HDF5 files, creating its groups."""
+    group_name = os.path.dirname(name)
+    group = (destination_file.require_group(group_name) if group_name else
+             destination_file)
+    source_file.copy(source_file[name], group, name=os.path.basename(name))
+
+
+def _zero_same_orbital_pairs(two_body_integrals):
+    """Zero, in place, all entries [p, q, r, s] with p == q or r == s."""
+    diagonal = numpy.arange(two_body_integrals.shape[0])
+    two_body_integrals[diagonal, diagonal] = 0.
+    two_body_integrals[:, :, diagonal, diagonal] = 0.
+
+
+def _spin_orbital_fermion_operator(constant, one_body_integrals,
+                                   two_body_integrals):
+    """Build the spin-orbital Hamiltonian directly as a FermionOperator.
+
+    The terms are the same as those of the dense InteractionOperator
+    returned by MolecularData.get_molecular_hamiltonian, but only the
+    nonzero spatial integrals are visited.
+    """
+    mixed_spin_integrals = two_body_integrals / 2.
+    same_spin_integrals = mixed_spin_integrals.copy()
+    _zero_same_orbital_pairs(same_spin_integrals)
+    blocks = ((one_body_integrals, ((0, 0), (1, 1))),
+              (mixed_spin_integrals, ((0, 1, 1, 0), (1, 0, 0, 1))),
+              (same_spin_integrals, ((0, 0, 0, 0), (1, 1, 1, 1))))
+
+    terms = [()]
+    coefficients = [constant]
+    for integrals, spin_blocks in blocks:
+        indices = numpy.nonzero(numpy.absolute(integrals) >= EQ_TOLERANCE)
+        values = integrals[indices].tolist()
+        actions = (1, 0) if integrals.ndim == 2 else (1, 1, 0, 0)
+        for spins in spin_blocks:
+            modes = numpy.transpose([2 * index + spin for
+                                     index, spin in zip(indices, spins)])
+            terms.extend(tuple(zip(term, actions)) for term in modes.tolist())
+            coefficients.extend(values)
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
+
+
 class MolecularData(object):
 
     """Class for storing molecule data from a fixed basis set at a fixed
@@ -258,6 +360,9 @@ class MolecularData(object):
             data_directory: Optional data directory to change from default
                 data directory specified in config file.
         """
+        # Name of the file the data was last saved to or loaded from.
+        self._synced_filename = None
+
         # Check appropriate data as been provided and autoload if requested.
         if ((geometry is None) or
                 (basis is None) or
@@ -341,6 +446,9 @@ class MolecularData(object):
     def init_lazy_properties(self):
         """Initializes properties loaded on demand to None"""
 
+        # Content hashes of the properties as stored in the synced file
+        self._file_hashes = {}
+
         # Molecular orbitals
         self._canonical_orbitals = None
 
@@ -489,159 +597,218 @@ class MolecularData(object):
     def ccsd_double_amps(self, value):
         self._ccsd_double_amps = value
 
-    def save(self):
-        """Method to save the class under a systematic name."""
-        # Create a temporary file and swap it to the original name in case
-        # data needs to be loaded while saving
+    def save(self, incremental=False):
+        """Method to save the class under a systematic name.
+
+        With incremental=True, if the molecule was last saved to or loaded
+        from the same file, only the metadata and the lazily loaded arrays
+        whose contents differ from the file are written. Changes are
+        detected by comparing content hashes, so arrays modified in place
+        are saved as well. Arrays held in memory since the last full save
+        have no hash yet and are written by the first incremental save.
+        The changes are first written to a journal file which is moved into
+        place atomically and then applied to the data file, so that an
+        interrupted save is completed by the next load.
+
+        Args:
+            incremental(bool): Whether to update only the modified datasets
+                of an existing file. If False, the whole file is rewritten.
+        """
+        if (incremental and self._synced_filename == self.filename and
+                os.path.isfile("{}.hdf5".format(self.filename))):
+            self._file_hashes.update(self._write_journal())
+            self._apply_journal()
+        else:
+            # Create a temporary file and swap it to the original name in
+            # case data needs to be loaded while saving
+            tmp_name = uuid.uuid4()
+            with h5py.File("{}.hdf5".format(tmp_name), "w") as f:
+                self._save_datasets(f, _LAZY_PROPERTIES)
+
+            # Remove old file first for compatibility with systems that don't
+            # allow rename replacement.  Catching OSError for when file does
+            # not exist yet
+            try:
+                os.remove("{}.hdf5".format(self.filename))
+            except OSError:
+                pass
+
+            os.rename("{}.hdf5".format(tmp_name),
+                      "{}.hdf5".format(self.filename))
+            self._file_hashes = {}
+        self._synced_filename = self.filename
+
+    def _save_datasets(self, f, lazy_properties):
+        """Write the metadata and the requested lazy properties to a file.
+
+        Args:
+            f(h5py.File): Open HDF5 file to create the datasets in.
+            lazy_properties(iterable): Names of the properties loaded on
+                demand which should be written as well.
+        """
+        # Save geometry (atoms and positions need to be separate):
+        d_geom = f.create_group("geometry")
+        if not isinstance(self.geometry, basestring):
+            atoms = [numpy.string_(item[0]) for item in self.geometry]
+            positions = numpy.array([list(item[1])
+                                     for item in self.geometry])
+        else:
+            atoms = numpy.string_(self.geometry)
+            positions = None
+        d_geom.create_dataset("atoms", data=(atoms if atoms is not None
+                                             else False))
+        d_geom.create_dataset("positions", data=(positions if positions
+                                                 is not None else False))
+        # Save basis:
+        f.create_dataset("basis", data=numpy.string_(self.basis))
+        # Save multiplicity:
+        f.create_dataset("multiplicity", data=self.multiplicity)
+        # Save charge:
+        f.create_dataset("charge", data=self.charge)
+        # Save description:
+        f.create_dataset("description",
+                         data=numpy.string_(self.description))
+        # Save name:
+        f.create_dataset("name", data=numpy.string_(self.name))
+        # Save n_atoms:
+        f.create_dataset("n_atoms", data=self.n_atoms)
+        # Save atoms:
+        f.create_dataset("atoms", data=numpy.string_(self.atoms))
+        # Save protons:
+        f.create_dataset("protons", data=self.protons)
+        # Save n_electrons:
+        f.create_dataset("n_electrons", data=self.n_electrons)
+        # Save generic attributes from calculations:
+        f.create_dataset("n_orbitals",
+                         data=(self.n_orbitals if self.n_orbitals
+                               is not None else False))
+        f.create_dataset("n_qubits",
+                         data=(self.n_qubits if
+                               self.n_qubits is not None else False))
+        f.create_dataset("nuclear_repulsion",
+                         data=(self.nuclear_repulsion if
+                               self.nuclear_repulsion is not None else
+                               numpy.nan))
+        # Save attributes generated from SCF calculation.
+        f.create_dataset("hf_energy", data=(self.hf_energy if
+                                            self.hf_energy is not None
+                                            else numpy.nan))
+        f.create_dataset("orbital_energies",
+                         data=(self.orbital_energies if
+                               self.orbital_energies is not None else
+                               False))
+        # Save attributes generated from MP2 calculation.
+        f.create_dataset("mp2_energy",
+                         data=(self.mp2_energy if
+                               self.mp2_energy is not None else numpy.nan))
+        # Save attributes generated from CISD calculation.
+        f.create_dataset("cisd_energy",
+                         data=(self.cisd_energy if
+                               self.cisd_energy is not None else numpy.nan))
+        # Save attributes generated from exact diagonalization.
+        f.create_dataset("fci_energy",
+                         data=(self.fci_energy if
+                               self.fci_energy is not None else numpy.nan))
+        # Save attributes generated from CCSD calculation.
+        f.create_dataset("ccsd_energy",
+                         data=(self.ccsd_energy if
+                               self.ccsd_energy is not None else numpy.nan))
+
+        # Save general calculation data
+        d_general = f.create_group("general_calculations")
+        for key, value in self.general_calculations.items():
+            d_general.create_dataset(_escape_key(key), data=value)
+
+        # Save orbitals, integrals, RDMs and amplitudes.
+        for property_name in lazy_properties:
+            data = getattr(self, property_name)
+            f.create_dataset(property_name,
+                             data=(data if data is not None else False),
+                             compression=("gzip" if data is not None
+                                          else None))
+
+    def _write_journal(self):
+        """Write the changes since the last save or load to a journal file.
+
+        The journal is only moved to its final name once it is complete so
+        that its presence guarantees it can be applied.
+
+        Returns:
+            hashes(dict): The content hashes of the lazy properties in
+                memory, keyed by property name.
+        """
+        # Properties which are not in memory keep the data in the file.
+        hashes = {}
+        lazy_properties = []
+        for property_name in _LAZY_PROPERTIES:
+            data = getattr(self, '_' + property_name)
+            if data is not None:
+                hashes[property_name] = _content_hash(data)
+                if hashes[property_name] != self._file_hashes.get(
+                        property_name):
+                    lazy_properties.append(property_name)
+
         tmp_name = uuid.uuid4()
         with h5py.File("{}.hdf5".format(tmp_name), "w") as f:
-            # Save geometry (atoms and positions need to be separate):
-            d_geom = f.create_group("geometry")
-            if not isinstance(self.geometry, basestring):
-                atoms = [numpy.string_(item[0]) for item in self.geometry]
-                positions = numpy.array([list(item[1])
-                                         for item in self.geometry])
-            else:
-                atoms = numpy.string_(self.geometry)
-                positions = None
-            d_geom.create_dataset("atoms", data=(atoms if atoms is not None
-                                                 else False))
-            d_geom.create_dataset("positions", data=(positions if positions
-                                                     is not None else False))
-            # Save basis:
-            f.create_dataset("basis", data=numpy.string_(self.basis))
-            # Save multiplicity:
-            f.create_dataset("multiplicity", data=self.multiplicity)
-            # Save charge:
-            f.create_dataset("charge", data=self.charge)
-            # Save description:
-            f.create_dataset("description",
-                             data=numpy.string_(self.description))
-            # Save name:
-            f.create_dataset("name", data=numpy.string_(self.name))
-            # Save n_atoms:
-            f.create_dataset("n_atoms", data=self.n_atoms)
-            # Save atoms:
-            f.create_dataset("atoms", data=numpy.string_(self.atoms))
-            # Save protons:
-            f.create_dataset("protons", data=self.protons)
-            # Save n_electrons:
-            f.create_dataset("n_electrons", data=self.n_electrons)
-            # Save generic attributes from calculations:
-            f.create_dataset("n_orbitals",
-                             data=(self.n_orbitals if self.n_orbitals
-                                   is not None else False))
-            f.create_dataset("n_qubits",
-                             data=(self.n_qubits if
-                                   self.n_qubits is not None else False))
-            f.create_dataset("nuclear_repulsion",
-                             data=(self.nuclear_repulsion if
-                                   self.nuclear_repulsion is not None else
-                                   False))
-            # Save attributes generated from SCF calculation.
-            f.create_dataset("hf_energy", data=(self.hf_energy if
-                                                self.hf_energy is not None
-                                                else False))
-            f.create_dataset("canonical_orbitals",
-                             data=(self.canonical_orbitals if
-                                   self.canonical_orbitals is
-                                   not None else False),
-                             compression=("gzip" if self.canonical_orbitals
-                                          is not None else None))
-            f.create_dataset("overlap_integrals",
-                             data=(self.overlap_integrals if
-                                   self.overlap_integrals is
-                                   not None else False),
-                             compression=("gzip" if self.overlap_integrals
-                                          is not None else None))
-            f.create_dataset("orbital_energies",
-                             data=(self.orbital_energies if
-                                   self.orbital_energies is not None else
-                                   False))
-            # Save attributes generated from integrals.
-            f.create_dataset("one_body_integrals",
-                             data=(self.one_body_integrals if
-                                   self.one_body_integrals is
-                                   not None else False),
-                             compression=("gzip" if self.one_body_integrals
-                                          is not None else None))
-            f.create_dataset("two_body_integrals",
-                             data=(self.two_body_integrals if
-                                   self.two_body_integrals is
-                                   not None else False),
-                             compression=("gzip" if self.two_body_integrals
-                                          is not None else None))
-            # Save attributes generated from MP2 calculation.
-            f.create_dataset("mp2_energy",
-                             data=(self.mp2_energy if
-                                   self.mp2_energy is not None else False))
-            # Save attributes generated from CISD calculation.
-            f.create_dataset("cisd_energy",
-                             data=(self.cisd_energy if
-                                   self.cisd_energy is not None else False))
-            f.create_dataset("cisd_one_rdm",
-                             data=(self.cisd_one_rdm if
-                                   self.cisd_one_rdm is not None else False),
-                             compression=("gzip" if self.cisd_one_rdm
-                                          is not None else None))
-            f.create_dataset("cisd_two_rdm",
-                             data=(self.cisd_two_rdm if
-                                   self.cisd_two_rdm is not None else False),
-                             compression=("gzip" if self.cisd_two_rdm
-                                          is not None else None))
-            # Save attributes generated from exact diagonalization.
-            f.create_dataset("fci_energy",
-                             data=(self.fci_energy if
-                                   self.fci_energy is not None else False))
-            f.create_dataset("fci_one_rdm",
-                             data=(self.fci_one_rdm if
-                                   self.fci_one_rdm is not None else False),
-                             compression=("gzip" if self.fci_one_rdm
-                                          is not None else None))
-            f.create_dataset("fci_two_rdm",
-                             data=(self.fci_two_rdm if
-                                   self.fci_two_rdm is not None else False),
-                             compression=("gzip" if self.fci_two_rdm is not
-                                          None else None))
-            # Save attributes generated from CCSD calculation.
-            f.create_dataset("ccsd_energy",
-                             data=(self.ccsd_energy if
-                                   self.ccsd_energy is not None else False))
-            f.create_dataset("ccsd_single_amps",
-                             data=(self.ccsd_single_amps
-                                   if self.ccsd_single_amps is not None else
-                                   False),
-                             compression=("gzip" if self.ccsd_single_amps
-                                          is not None else None))
-            f.create_dataset("ccsd_double_amps",
-                             data=(self.ccsd_double_amps
-                                   if self.ccsd_double_amps is
-                                   not None else False),
-                             compression=("gzip" if self.ccsd_double_amps
-                                          is not None else None))
-
-            # Save general calculation data
-            key_list = list(self.general_calculations.keys())
-            f.create_dataset("general_calculations_keys",
-                             data=([numpy.string_(key) for key in key_list] if
-                                   len(key_list) > 0 else False))
-            f.create_dataset("general_calculations_values",
-                             data=([self.general_calculations[key] for
-                                   key in key_list] if
-                                   len(key_list) > 0 else False))
-
-        # Remove old file first for compatibility with systems that don't allow
-        # rename replacement.  Catching OSError for when file does not exist
-        # yet
-        try:
-            os.remove("{}.hdf5".format(self.filename))
-        except OSError:
-            pass
-
+            self._save_datasets(f, lazy_properties)
         os.rename("{}.hdf5".format(tmp_name),
-                  "{}.hdf5".format(self.filename))
+                  "{}.journal.hdf5".format(self.filename))
+        return hashes
+
+    def _apply_journal(self):
+        """Copy the datasets in a pending journal file into the data file.
+
+        Datasets whose shape and type are unchanged are overwritten in
+        place, the others are deleted and created again, as are the general
+        calculations which were added or removed. Since HDF5 does not
+        reclaim the space of deleted datasets, the data file is instead
+        rewritten if the shape or type of a stored lazy property changes.
+        The journal is removed only after all datasets have been written.
+        """
+        journal_name = "{}.journal.hdf5".format(self.filename)
+        if not os.path.isfile(journal_name):
+            return
+        file_name = "{}.hdf5".format(self.filename)
+
+        with h5py.File(journal_name, "r") as journal:
+            journal_names = _dataset_names(journal)
+            with h5py.File(file_name, "r+") as f:
+                # Includes the datasets of files saved before the general
+                # calculations were stored one dataset per key.
+                stale_names = [name for name in _dataset_names(f) if
+                               name.startswith("general_calculations") and
+                               name not in journal_names]
+                rewrite = any(
+                    name in _LAZY_PROPERTIES and name in f and
+                    not _is_placeholder(f[name]) and
+                    not _same_layout(f[name], journal[name])
+                    for name in journal_names)
+                if not rewrite:
+                    for name in stale_names:
+                        del f[name]
+                    for name in journal_names:
+                        if name in f and _same_layout(f[name], journal[name]):
+                            f[name][...] = journal[name][...]
+                        else:
+                            if name in f:
+                                del f[name]
+                            _copy_dataset(journal, f, name)
+                else:
+                    tmp_name = "{}.hdf5".format(uuid.uuid4())
+                    with h5py.File(tmp_name, "w") as new_file:
+                        for name in _dataset_names(f):
+                            if (name not in journal_names and
+                                    name not in stale_names):
+                                _copy_dataset(f, new_file, name)
+                        for name in journal_names:
+                            _copy_dataset(journal, new_file, name)
+            if rewrite:
+                os.remove(file_name)
+                os.rename(tmp_name, file_name)
+        os.remove(journal_name)
 
     def load(self):
+        self._apply_journal()
         geometry = []
 
         with h5py.File("{}.hdf5".format(self.filename), "r") as f:
@@ -678,28 +845,25 @@ class MolecularData(object):
             self.n_orbitals = int(data) if data.dtype.num != 0 else None
             data = f["n_qubits"][...]
             self.n_qubits = int(data) if data.dtype.num != 0 else None
-            data = f["nuclear_repulsion"][...]
-            self.nuclear_repulsion = (float(data) if data.dtype.num != 0 else
-                                      None)
+            data = _stored_value(f["nuclear_repulsion"][...])
+            self.nuclear_repulsion = float(data) if data is not None else None
             # Load attributes generated from SCF calculation.
-            data = f["hf_energy"][...]
-            self.hf_energy = data if data.dtype.num != 0 else None
-            data = f["orbital_energies"][...]
-            self.orbital_energies = data if data.dtype.num != 0 else None
+            self.hf_energy = _stored_value(f["hf_energy"][...])
+            self.orbital_energies = _stored_value(f["orbital_energies"][...])
             # Load attributes generated from MP2 calculation.
-            data = f["mp2_energy"][...]
-            self.mp2_energy = data if data.dtype.num != 0 else None
+            self.mp2_energy = _stored_value(f["mp2_energy"][...])
             # Load attributes generated from CISD calculation.
-            data = f["cisd_energy"][...]
-            self.cisd_energy = data if data.dtype.num != 0 else None
+            self.cisd_energy = _stored_value(f["cisd_energy"][...])
             # Load attributes generated from exact diagonalization.
-            data = f["fci_energy"][...]
-            self.fci_energy = data if data.dtype.num != 0 else None
+            self.fci_energy = _stored_value(f["fci_energy"][...])
             # Load attributes generated from CCSD calculation.
-            data = f["ccsd_energy"][...]
-            self.ccsd_energy = data if data.dtype.num != 0 else None
+            self.ccsd_energy = _stored_value(f["ccsd_energy"][...])
             # Load general calculations
-            if ("general_calculations_keys" in f and
+            self.general_calculations = {}
+            if "general_calculations" in f:
+                for name, data in f["general_calculations"].items():
+                    self.general_calculations[_unescape_key(name)] = data[()]
+            elif ("general_calculations_keys" in f and
                     "general_calculations_values" in f):
                 keys = f["general_calculations_keys"]
                 values = f["general_calculations_values"]
@@ -709,6 +873,8 @@ class MolecularData(object):
                         in zip(keys[...], values[...])}
             else:
                 self.general_calculations = None
+        self._synced_filename = self.filename
+        self._file_hashes = {}
 
     def get_from_file(self, property_name):
         """Helper routine to re-open HDF5 file and pull out single property
@@ -722,12 +888,16 @@ class MolecularData(object):
                 file.
         """
         try:
+            self._apply_journal()
             with h5py.File("{}.hdf5".format(self.filename), "r") as f:
                 data = f[property_name][...]
         except KeyError:
             data = None
         except IOError:
             data = None
+        if (property_name in _LAZY_PROPERTIES and data is not None and
+                self._synced_filename == self.filename):
+            self._file_hashes[property_name] = _content_hash(data)
         return data
 
     def get_n_alpha_electrons(self):
@@ -767,11 +937,16 @@ class MolecularData(object):
             two_body_integrals must be defined
             n an orthonormal basis set.
 
+        Several active spaces sharing the same doubly occupied orbitals can
+        be reduced at once by passing a list of lists of active indices. The
+        contraction over the occupied orbitals is then computed only once.
+
         Args:
             occupied_indices(list): A list of spatial orbital indices
                 indicating which orbitals should be considered doubly occupied.
             active_indices(list): A list of spatial orbital indices indicating
-                which orbitals should be considered active.
+                which orbitals should be considered active, or a list of such
+                lists.
 
         Returns:
             tuple: Tuple with the following entries:
@@ -784,56 +959,72 @@ class MolecularData(object):
 
             **two_body_integrals_new**: two-electron integrals over active
             space.
+
+            If a list of active spaces is given, a list with one such tuple
+            per active space is returned instead.
         """
         # Fix data type for a few edge cases
         occupied_indices = [] if occupied_indices is None else occupied_indices
-        if (len(active_indices) < 1):
+        if active_indices is None or len(active_indices) < 1:
+            raise ValueError('Some active indices required for reduction.')
+        batch = isinstance(active_indices[0],
+                           (list, tuple, numpy.ndarray))
+        active_spaces = active_indices if batch else [active_indices]
+        if any(len(active_space) < 1 for active_space in active_spaces):
             raise ValueError('Some active indices required for reduction.')
 
         # Get integrals.
         one_body_integrals, two_body_integrals = self.get_integrals()
+        occupied = numpy.array(occupied_indices, dtype=int)
+        orbitals = numpy.arange(one_body_integrals.shape[0])
 
         # Determine core constant
-        core_constant = 0.0
-        for i in occupied_indices:
-            core_constant += 2 * one_body_integrals[i, i]
-            for j in occupied_indices:
-                core_constant += (2 * two_body_integrals[i, j, j, i] -
-                                  two_body_integrals[i, j, i, j])
+        core_integrals = two_body_integrals[numpy.ix_(
+            occupied, occupied, occupied, occupied)]
+        core_constant = (
+            2 * numpy.trace(one_body_integrals[numpy.ix_(occupied,
+                                                         occupied)]) +
+            2 * numpy.einsum('ijji', core_integrals) -
+            numpy.einsum('ijij', core_integrals))
 
         # Modified one electron integrals
-        one_body_integrals_new = numpy.copy(one_body_integrals)
-        for u in active_indices:
-            for v in active_indices:
-                for i in occupied_indices:
-                    one_body_integrals_new[u, v] += (
-                        2 * two_body_integrals[i, u, v, i] -
-                        two_body_integrals[i, u, i, v])
+        one_body_integrals_new = (
+            one_body_integrals +
+            2 * numpy.einsum('iuvi->uv', two_body_integrals[numpy.ix_(
+                occupied, orbitals, orbitals, occupied)]) -
+            numpy.einsum('iuiv->uv', two_body_integrals[numpy.ix_(
+                occupied, orbitals, occupied, orbitals)]))
 
         # Restrict integral ranges and change M appropriately
-        return (core_constant,
-                one_body_integrals_new[numpy.ix_(active_indices,
-                                                 active_indices)],
-                two_body_integrals[numpy.ix_(active_indices,
-                                             active_indices,
-                                             active_indices,
-                                             active_indices)])
+        reduced_integrals = [
+            (core_constant,
+             one_body_integrals_new[numpy.ix_(active_space, active_space)],
+             two_body_integrals[numpy.ix_(active_space,
+                                          active_space,
+                                          active_space,
+                                          active_space)])
+            for active_space in active_spaces]
+        return reduced_integrals if batch else reduced_integrals[0]
 
     def get_molecular_hamiltonian(self,
                                   occupied_indices=None,
-                                  active_indices=None):
+                                  active_indices=None,
+                                  dense=True):
         """Output arrays of the second quantized Hamiltonian coefficients.
 
         Args:
-            rotation_matrix: A square numpy array or matrix having dimensions
-                of n_orbitals by n_orbitals. Assumed real and invertible.
             occupied_indices(list): A list of spatial orbital indices
                 indicating which orbitals should be considered doubly occupied.
             active_indices(list): A list of spatial orbital indices indicating
                 which orbitals should be considered active.
+            dense(bool): If False, the spin-orbital coefficient tensors are
+                never allocated and the Hamiltonian is instead returned as a
+                FermionOperator built from the nonzero spatial integrals.
+                This avoids the (2n)^4 array for large active spaces.
 
         Returns:
-            molecular_hamiltonian: An instance of the MolecularOperator class.
+            molecular_hamiltonian: An instance of the MolecularOperator class,
+                or a FermionOperator if dense is False.
         """
         # Get active space integrals.
         if occupied_indices is None and active_indices is None:
@@ -844,43 +1035,30 @@ class MolecularData(object):
                 get_active_space_integrals(occupied_indices, active_indices)
             constant = self.nuclear_repulsion + core_adjustment
 
+        if not dense:
+            return _spin_orbital_fermion_operator(
+                constant, one_body_integrals, two_body_integrals)
+
         n_qubits = 2 * one_body_integrals.shape[0]
 
-        # Initialize Hamiltonian coefficients.
+        # Populate 1-body coefficients. Require p and q have same spin.
         one_body_coefficients = numpy.zeros((n_qubits, n_qubits))
+        one_body_coefficients[::2, ::2] = one_body_integrals
+        one_body_coefficients[1::2, 1::2] = one_body_integrals
+
+        # Populate 2-body coefficients. Require p,s and q,r to have same spin.
         two_body_coefficients = numpy.zeros((n_qubits, n_qubits,
                                              n_qubits, n_qubits))
-        # Loop through integrals.
-        for p in range(n_qubits // 2):
-            for q in range(n_qubits // 2):
-
-                # Populate 1-body coefficients. Require p and q have same spin.
-                one_body_coefficients[2 * p, 2 * q] = one_body_integrals[p, q]
-                one_body_coefficients[2 * p + 1, 2 *
-                                      q + 1] = one_body_integrals[p, q]
-
-                # Continue looping to prepare 2-body coefficients.
-                for r in range(n_qubits // 2):
-                    for s in range(n_qubits // 2):
-
-                        # Require p,s and q,r to have same spin. Handle mixed
-                        # spins.
-                        two_body_coefficients[2 * p, 2 * q + 1, 2 * r + 1,
-                                              2 * s] = (
-                            two_body_integrals[p, q, r, s] / 2.)
-                        two_body_coefficients[2 * p + 1, 2 * q, 2 * r,
-                                              2 * s + 1] = (
-                            two_body_integrals[p, q, r, s] / 2.)
-
-                        # Avoid having two electrons in same orbital. Handle
-                        # same spins.
-                        if p != q and r != s:
-                            two_body_coefficients[2 * p, 2 * q, 2 * r,
-                                                  2 * s] = (
-                                two_body_integrals[p, q, r, s] / 2.)
-                            two_body_coefficients[2 * p + 1, 2 * q + 1,
-                                                  2 * r + 1, 2 * s + 1] = (
-                                two_body_integrals[p, q, r, s] / 2.)
+        halved_integrals = two_body_integrals / 2.
+
+        # Handle mixed spins.
+        two_body_coefficients[::2, 1::2, 1::2, ::2] = halved_integrals
+        two_body_coefficients[1::2, ::2, ::2, 1::2] = halved_integrals
+
+        # Avoid having two electrons in same orbital. Handle same spins.
+        _zero_same_orbital_pairs(halved_integrals)
+        two_body_coefficients[::2, ::2, ::2, ::2] = halved_integrals
+        two_body_coefficients[1::2, 1::2, 1::2, 1::2] = halved_integrals
 
         # Truncate.
         one_body_coefficients[
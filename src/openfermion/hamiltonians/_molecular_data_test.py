@@ -12,6 +12,7 @@
 
 """Tests for molecular_data."""
 
+import itertools
 import numpy.random
 import scipy.linalg
 import unittest
@@ -19,7 +20,8 @@ import unittest
 from openfermion.config import *
 from openfermion.hamiltonians import jellium_model, make_atom
 from openfermion.hamiltonians._molecular_data import *
-from openfermion.transforms import (get_interaction_operator,
+from openfermion.transforms import (get_fermion_operator,
+                                    get_interaction_operator,
                                     get_molecular_data)
 from openfermion.utils import *
 
@@ -195,6 +197,76 @@ class MolecularDataTest(unittest.TestCase):
         finally:
             os.remove(filename + '.hdf5')
 
+    def test_incremental_save(self):
+        filename = os.path.join(THIS_DIRECTORY, 'data', 'dummy_molecule')
+        molecule = MolecularData(self.geometry, self.basis, self.multiplicity,
+                                 filename=filename)
+        molecule.one_body_integrals = numpy.arange(4.).reshape((2, 2))
+        molecule.two_body_integrals = numpy.arange(16.).reshape((2, 2, 2, 2))
+        molecule.save()
+
+        try:
+            # Metadata, reassigned and in-place modified arrays are saved.
+            molecule.hf_energy = -1.5
+            molecule.general_calculations['Fake CI'] = 1.2345
+            molecule.one_body_integrals = numpy.ones((2, 2))
+            molecule.two_body_integrals[0, 0, 0, 0] = 7.
+            molecule.save(incremental=True)
+            self.assertFalse(os.path.isfile(filename + '.journal.hdf5'))
+
+            new_molecule = MolecularData(filename=filename)
+            self.assertAlmostEqual(new_molecule.hf_energy, -1.5)
+            self.assertAlmostEqual(
+                new_molecule.general_calculations['Fake CI'], 1.2345)
+            self.assertTrue(numpy.allclose(new_molecule.one_body_integrals,
+                                           numpy.ones((2, 2))))
+            two_body_integrals = numpy.arange(16.).reshape((2, 2, 2, 2))
+            two_body_integrals[0, 0, 0, 0] = 7.
+            self.assertTrue(numpy.allclose(new_molecule.two_body_integrals,
+                                           two_body_integrals))
+
+            # In-place modifications of loaded arrays are saved.
+            new_molecule.one_body_integrals[1, 1] = 5.
+            new_molecule.save(incremental=True)
+            self.assertAlmostEqual(
+                MolecularData(filename=filename).one_body_integrals[1, 1], 5.)
+
+            # New and removed general calculations, energies and arrays set
+            # for the first time do not rewrite the file.
+            inode = os.stat(filename + '.hdf5').st_ino
+            new_molecule.general_calculations['Fake CI 2'] = [1., 2.]
+            new_molecule.general_calculations['a/b'] = 3.
+            del new_molecule.general_calculations['Fake CI']
+            new_molecule.fci_energy = -1.
+            new_molecule.fci_one_rdm = numpy.eye(2)
+            new_molecule.save(incremental=True)
+            self.assertEqual(os.stat(filename + '.hdf5').st_ino, inode)
+            loaded_molecule = MolecularData(filename=filename)
+            self.assertEqual(sorted(loaded_molecule.general_calculations),
+                             ['Fake CI 2', 'a/b'])
+            self.assertTrue(numpy.allclose(
+                loaded_molecule.general_calculations['Fake CI 2'], [1., 2.]))
+            self.assertAlmostEqual(loaded_molecule.fci_energy, -1.)
+            self.assertIsNone(loaded_molecule.cisd_energy)
+            self.assertTrue(numpy.allclose(loaded_molecule.fci_one_rdm,
+                                           numpy.eye(2)))
+
+            # Datasets changing shape do not make the file grow.
+            file_size = os.path.getsize(filename + '.hdf5')
+            for size in [3, 2, 3, 2]:
+                new_molecule.two_body_integrals = numpy.zeros((size,) * 4)
+                new_molecule.save(incremental=True)
+            self.assertTrue(numpy.allclose(
+                MolecularData(filename=filename).two_body_integrals,
+                numpy.zeros((2, 2, 2, 2))))
+            self.assertTrue(numpy.allclose(
+                MolecularData(filename=filename).one_body_integrals,
+                [[1., 1.], [1., 5.]]))
+            self.assertLessEqual(os.path.getsize(filename + '.hdf5'),
+                                 file_size)
+        finally:
+            os.remove(filename + '.hdf5')
+
     def test_file_loads(self):
         """Test different filename specs"""
         data_directory = os.path.join(THIS_DIRECTORY, 'data')
@@ -228,6 +300,78 @@ class MolecularDataTest(unittest.TestCase):
         self.assertAlmostEqual(scipy.linalg.norm(two_body_integrals -
                                self.molecule.two_body_integrals), 0.0)
 
+    def test_active_space_batch(self):
+        filename = os.path.join(THIS_DIRECTORY, 'data',
+                                'H1-Li1_sto-3g_singlet_1.45')
+        molecule = MolecularData(filename=filename)
+        active_spaces = [[1, 2], [1, 2, 3, 4], (2, 5)]
+        reduced_integrals = molecule.get_active_space_integrals(
+            [0], active_spaces)
+        self.assertEqual(len(reduced_integrals), len(active_spaces))
+        one_body_integrals, two_body_integrals = molecule.get_integrals()
+        self.assertAlmostEqual(reduced_integrals[0][0],
+                               2 * one_body_integrals[0, 0] +
+                               two_body_integrals[0, 0, 0, 0])
+        self.assertAlmostEqual(reduced_integrals[0][1][0, 1],
+                               one_body_integrals[1, 2] +
+                               2 * two_body_integrals[0, 1, 2, 0] -
+                               two_body_integrals[0, 1, 0, 2])
+        for active_space, (core_constant, one_body_integrals,
+                           two_body_integrals) in zip(active_spaces,
+                                                      reduced_integrals):
+            correct = molecule.get_active_space_integrals([0], active_space)
+            self.assertAlmostEqual(core_constant, correct[0])
+            self.assertTrue(numpy.allclose(one_body_integrals, correct[1]))
+            self.assertTrue(numpy.allclose(two_body_integrals, correct[2]))
+
+        with self.assertRaises(ValueError):
+            molecule.get_active_space_integrals([0], [[1, 2], []])
+
+    def test_molecular_hamiltonian_spin_blocks(self):
+        n_orbitals = 3
+        one_body_integrals = numpy.random.randn(n_orbitals, n_orbitals)
+        two_body_integrals = numpy.random.randn(
+            n_orbitals, n_orbitals, n_orbitals, n_orbitals)
+        self.molecule.one_body_integrals = one_body_integrals
+        self.molecule.two_body_integrals = two_body_integrals
+        hamiltonian = self.molecule.get_molecular_hamiltonian()
+
+        for p, q in itertools.product(range(n_orbitals), repeat=2):
+            for spin in range(2):
+                self.assertEqual(
+                    hamiltonian.one_body_tensor[2 * p + spin, 2 * q + spin],
+                    one_body_integrals[p, q])
+                self.assertEqual(
+                    hamiltonian.one_body_tensor[2 * p + spin,
+                                                2 * q + 1 - spin], 0.)
+        for p, q, r, s in itertools.product(range(n_orbitals), repeat=4):
+            value = two_body_integrals[p, q, r, s] / 2.
+            same_spin_value = value if p != q and r != s else 0.
+            self.assertEqual(hamiltonian.two_body_tensor[
+                2 * p, 2 * q + 1, 2 * r + 1, 2 * s], value)
+            self.assertEqual(hamiltonian.two_body_tensor[
+                2 * p + 1, 2 * q, 2 * r, 2 * s + 1], value)
+            self.assertEqual(hamiltonian.two_body_tensor[
+                2 * p, 2 * q, 2 * r, 2 * s], same_spin_value)
+            self.assertEqual(hamiltonian.two_body_tensor[
+                2 * p + 1, 2 * q + 1, 2 * r + 1, 2 * s + 1], same_spin_value)
+            self.assertEqual(hamiltonian.two_body_tensor[
+                2 * p, 2 * q + 1, 2 * r, 2 * s + 1], 0.)
+
+    def test_molecular_hamiltonian_not_dense(self):
+        hamiltonian = self.molecule.get_molecular_hamiltonian()
+        fermion_hamiltonian = self.molecule.get_molecular_hamiltonian(
+            dense=False)
+        self.assertTrue(fermion_hamiltonian.isclose(
+            get_fermion_operator(hamiltonian)))
+
+        hamiltonian = self.molecule.get_molecular_hamiltonian(
+            occupied_indices=[0], active_indices=[1])
+        fermion_hamiltonian = self.molecule.get_molecular_hamiltonian(
+            occupied_indices=[0], active_indices=[1], dense=False)
+        self.assertTrue(fermion_hamiltonian.isclose(
+            get_fermion_operator(hamiltonian)))
+
     def test_energies(self):
         self.assertAlmostEqual(self.molecule.hf_energy, -1.1167, places=4)
         self.assertAlmostEqual(self.molecule.mp2_energy, -1.1299, places=4)
@@ -11,13 +11,21 @@
 #   limitations under the License.
 
 """Module to reduce operator variance using equality RDM constraints."""
+import itertools
 import numpy
+import os
 import scipy
+import scipy.optimize
+import scipy.sparse
 
+from openfermion.config import DATA_DIRECTORY
 from openfermion.ops import FermionOperator, hermitian_conjugated
 from openfermion.utils import count_qubits
 
-from ._rdm_equality_constraints import two_body_fermion_constraints
+
+# Version of the cached constraint matrices, to be increased whenever the
+# order or the values of the constraints change.
+_CONSTRAINT_MATRIX_VERSION = 1
 
 
 def linearize_term(term, n_orbitals):
@@ -93,32 +101,138 @@ def unlinearize_term(index, n_orbitals):
         return ((p, 1), (q, 1), (r, 0), (s, 0))
 
 
-def constraint_matrix(n_orbitals, n_fermions):
-    """Function to generate matrix of constraints.
+def _one_body_indices(p, q, n_orbitals):
+    """Vectorized linearize_term for one-body terms p^ q."""
+    return 1 + p + q * n_orbitals
+
+
+def _two_body_indices(p, q, r, s, n_orbitals):
+    """Vectorized linearize_term for two-body terms p^ q^ r s."""
+    return (1 + n_orbitals ** 2 +
+            p +
+            q * n_orbitals +
+            r * n_orbitals ** 2 +
+            s * n_orbitals ** 3)
+
+
+def _constraint_entries(n_orbitals, n_fermions):
+    """Compute the nonzero entries of the constraint matrix.
+
+    The constraints are those of two_body_fermion_constraints, in the same
+    order, but their terms are computed in closed form.
 
     Args:
         n_orbitals(int): The number of orbitals in the simulation.
         n_fermions(int): The number of particles in the simulation.
 
     Returns:
-        constraint_matrix(scipy.sparse.coo_matrix): The matrix of constraints.
+        rows, columns, values(numpy.ndarray): The nonzero entries.
+        n_constraints(int): The number of constraints.
     """
-    # Very inefficiently count constraints.
+    orbitals = numpy.arange(n_orbitals)
+    pairs = numpy.arange(n_orbitals ** 2)
+    rows = []
+    columns = []
+    values = []
     n_constraints = 0
-    for constraint in two_body_fermion_constraints(n_orbitals, n_fermions):
-        n_constraints += 1
 
-    # Initialize constraint matrix.
+    def add_constraints(constraint_rows, constraint_columns,
+                        constraint_values, n_new_constraints):
+        keep = constraint_values != 0
+        rows.append(n_constraints + constraint_rows[keep])
+        columns.append(constraint_columns[keep])
+        values.append(constraint_values[keep])
+        return n_constraints + n_new_constraints
+
+    # Two-body trace condition.
+    if n_orbitals:
+        i, j = numpy.divmod(pairs, n_orbitals)
+        n_constraints = add_constraints(
+            numpy.zeros(n_orbitals ** 2 + 1, int),
+            numpy.append(_two_body_indices(i, j, j, i, n_orbitals), 0),
+            numpy.append(numpy.ones(n_orbitals ** 2),
+                         -n_fermions * (n_fermions - 1.)), 1)
+
+    # Two-body Hermiticity condition.
+    ij, kl = numpy.triu_indices(n_orbitals ** 2, 1)
+    i, j = numpy.divmod(ij, n_orbitals)
+    k, l = numpy.divmod(kl, n_orbitals)
+    constraint_rows = numpy.arange(len(ij))
+    n_constraints = add_constraints(
+        numpy.repeat(constraint_rows, 2),
+        numpy.column_stack([_two_body_indices(i, j, l, k, n_orbitals),
+                            _two_body_indices(k, l, j, i, n_orbitals)]
+                           ).ravel(),
+        numpy.tile([1., -1.], len(ij)), len(ij))
+
+    # Contraction to One-RDM from Two-RDM.
+    i, j = numpy.divmod(pairs, n_orbitals)
+    two_body = _two_body_indices(i[:, None], orbitals, orbitals,
+                                 j[:, None], n_orbitals)
+    one_body = _one_body_indices(i, j, n_orbitals)
+    n_constraints = add_constraints(
+        numpy.repeat(pairs, n_orbitals + 1),
+        numpy.column_stack([two_body, one_body]).ravel(),
+        numpy.tile(numpy.append(numpy.ones(n_orbitals),
+                                -(n_fermions - 1.)), n_orbitals ** 2),
+        n_orbitals ** 2)
+
+    # Linear relations between two-particle matrices. The one-body terms
+    # of the G-matrix condition cancel and the two two-body terms coincide
+    # when k == j.
+    ij, kl = numpy.triu_indices(n_orbitals ** 2)
+    i, j = numpy.divmod(ij, n_orbitals)
+    k, l = numpy.divmod(kl, n_orbitals)
+    coincide = k == j
+    n_constraints = add_constraints(
+        numpy.repeat(numpy.arange(len(ij)), 2),
+        numpy.column_stack([_two_body_indices(i, l, k, j, n_orbitals),
+                            _two_body_indices(i, l, j, k, n_orbitals)]
+                           ).ravel(),
+        numpy.column_stack([1. + coincide, 1. - coincide]).ravel(),
+        len(ij))
+
+    return (numpy.concatenate(rows), numpy.concatenate(columns),
+            numpy.concatenate(values), n_constraints)
+
+
+def constraint_matrix(n_orbitals, n_fermions, data_directory=None):
+    """Function to generate matrix of constraints.
+
+    Args:
+        n_orbitals(int): The number of orbitals in the simulation.
+        n_fermions(int): The number of particles in the simulation.
+        data_directory(str): Optional directory in which to cache the
+            matrix. If given, the matrix is loaded from this directory when
+            it has been saved there before, and saved there otherwise.
+
+    Returns:
+        constraint_matrix(scipy.sparse.coo_matrix): The matrix of constraints.
+    """
     n_terms = 1 + n_orbitals ** 2 + n_orbitals ** 4
-    constraint_matrix = scipy.sparse.dok_matrix((n_constraints, n_terms))
-
-    # Populate constraint matrix.
-    constraint_number = 0
-    for constraint in two_body_fermion_constraints(n_orbitals, n_fermions):
-        for term, coefficient in constraint.terms.items():
-            term_index = linearize_term(term, n_orbitals)
-            constraint_matrix[constraint_number, term_index] = coefficient
-        constraint_number += 1
+    if data_directory is not None:
+        file_path = os.path.join(
+            data_directory, 'constraint_matrix_v{}_{}_{}.npz'.format(
+                _CONSTRAINT_MATRIX_VERSION, n_orbitals, n_fermions))
+        if os.path.isfile(file_path):
+            with numpy.load(file_path) as data:
+                return scipy.sparse.coo_matrix(
+                    (data['values'], (data['rows'], data['columns'])),
+                    shape=(int(data['n_constraints']), n_terms))
+
+    rows, columns, values, n_constraints = _constraint_entries(n_orbitals,
+                                                               n_fermions)
+    constraint_matrix = scipy.sparse.coo_matrix(
+        (values, (rows, columns)), shape=(n_constraints, n_terms))
+
+    if data_directory is not None:
+        # The cache is optional, so a directory without write access only
+        # means the matrix is computed again next time.
+        try:
+            numpy.savez(file_path, rows=rows, columns=columns, values=values,
+                        n_constraints=n_constraints)
+        except (IOError, OSError):
+            pass
     return constraint_matrix
 
 
@@ -151,14 +265,19 @@ def vector_to_operator(vector, n_orbitals):
         operator(FermionOperator): FermionOperator with only 1- and 2-body
             terms that we wish to vectorize.
     """
-    operator = FermionOperator()
-    for index, coefficient in enumerate(vector):
-        term = unlinearize_term(index, n_orbitals)
-        operator += FermionOperator(term, coefficient)
-    return operator
-
-
-def apply_constraints(operator, n_fermions, use_scipy=True):
+    # Enumerate the terms in the order of their indices.
+    orbitals = range(n_orbitals)
+    terms = [()]
+    terms += [((p, 1), (q, 0))
+              for q, p in itertools.product(orbitals, repeat=2)]
+    terms += [((p, 1), (q, 1), (r, 0), (s, 0))
+              for s, r, q, p in itertools.product(orbitals, repeat=4)]
+    return FermionOperator.from_terms(terms[:len(vector)],
+                                      numpy.asarray(vector), validate=False)
+
+
+def apply_constraints(operator, n_fermions, use_scipy=True,
+                      data_directory=None):
     """Function to use linear programming to apply constraints.
 
     Args:
@@ -166,6 +285,8 @@ def apply_constraints(operator, n_fermions, use_scipy=True):
             terms that we wish to vectorize.
         n_fermions(int): The number of particles in the simulation.
         use_scipy(bool): Whether to use scipy (True) or cvxopt (False).
+        data_directory(str): Directory in which the constraint matrix is
+            cached. Default is DATA_DIRECTORY.
 
     Returns:
         modified_operator(FermionOperator): The operator with reduced norm
@@ -173,8 +294,10 @@ def apply_constraints(operator, n_fermions, use_scipy=True):
     """
     # Get constraint matrix.
     n_orbitals = count_qubits(operator)
-    constraints = constraint_matrix(n_orbitals, n_fermions)
-    n_constraints, n_terms = constraints.get_shape()
+    if data_directory is None:
+        data_directory = DATA_DIRECTORY
+    constraints = constraint_matrix(n_orbitals, n_fermions, data_directory)
+    n_constraints, n_terms = constraints.shape
 
     # Get vectorized operator.
     vectorized_operator = operator_to_vector(operator)
@@ -186,15 +309,17 @@ def apply_constraints(operator, n_fermions, use_scipy=True):
     lp_vector = numpy.zeros(n_variables, float)
     lp_vector[-n_terms:] = 1.
 
-    # Get linear programming constraint matrix.
-    lp_constraint_matrix = scipy.sparse.dok_matrix((2 * n_terms, n_variables))
-    for (i, j), value in constraints.items():
-        if j:
-            lp_constraint_matrix[j, i] = value
-            lp_constraint_matrix[n_terms + j, i] = -value
-    for i in range(n_terms):
-        lp_constraint_matrix[i, n_constraints + i] = -1.
-        lp_constraint_matrix[n_terms + i, n_constraints + i] = -1.
+    # Get linear programming constraint matrix. The identity term is not
+    # constrained, so the first row of the transposed constraints is dropped.
+    keep = constraints.col != 0
+    transposed_constraints = scipy.sparse.coo_matrix(
+        (constraints.data[keep],
+         (constraints.col[keep], constraints.row[keep])),
+        shape=(n_terms, n_constraints))
+    identity = scipy.sparse.identity(n_terms)
+    lp_constraint_matrix = scipy.sparse.bmat(
+        [[transposed_constraints, -identity],
+         [-transposed_constraints, -identity]], format='coo')
 
     # Get linear programming constraint vector.
     lp_constraint_vector = numpy.zeros(2 * n_terms, float)
@@ -204,12 +329,27 @@ def apply_constraints(operator, n_fermions, use_scipy=True):
     # Perform linear programming.
     print('Starting linear programming.')
     if use_scipy:
+        # HiGHS needs scipy 1.6 and the sparse interior-point method
+        # scipy 1.0. Older versions only solve the dense problem.
         options = {'maxiter': int(1e6)}
+        scipy_version = tuple(int(part) for part in
+                              scipy.__version__.split('.')[:2])
+        if scipy_version >= (1, 6):
+            method = 'highs'
+            lp_constraint_matrix = lp_constraint_matrix.tocsr()
+        elif scipy_version >= (1, 0):
+            method = 'interior-point'
+            options['sparse'] = True
+            lp_constraint_matrix = lp_constraint_matrix.tocsr()
+        else:
+            method = 'simplex'
+            lp_constraint_matrix = lp_constraint_matrix.toarray()
         bound = n_constraints * [(None, None)] + n_terms * [(0, None)]
         solution = scipy.optimize.linprog(c=lp_vector,
-                                          A_ub=lp_constraint_matrix.toarray(),
+                                          A_ub=lp_constraint_matrix,
                                           b_ub=lp_constraint_vector,
                                           bounds=bound,
+                                          method=method,
                                           options=options)
 
         # Analyze results.
@@ -223,10 +363,10 @@ def apply_constraints(operator, n_fermions, use_scipy=True):
         # Convert to CVXOpt sparse matrix.
         from cvxopt import matrix, solvers, spmatrix
         lp_vector = matrix(lp_vector)
-        lp_constraint_matrix = lp_constraint_matrix.tocoo()
-        lp_constraint_matrix = spmatrix(lp_constraint_matrix.data,
+        lp_constraint_matrix = spmatrix(lp_constraint_matrix.data.tolist(),
                                         lp_constraint_matrix.row.tolist(),
-                                        lp_constraint_matrix.col.tolist())
+                                        lp_constraint_matrix.col.tolist(),
+                                        lp_constraint_matrix.shape)
         lp_constraint_vector = matrix(lp_constraint_vector)
 
         # Run linear programming.
@@ -13,6 +13,8 @@
 """Tests for _variance_reduction.py"""
 import numpy
 import os
+import shutil
+import tempfile
 import unittest
 
 from ._equality_constraint_projection import (apply_constraints,
@@ -21,6 +23,7 @@ from ._equality_constraint_projection import (apply_constraints,
                                               operator_to_vector,
                                               unlinearize_term,
                                               vector_to_operator)
+from ._rdm_equality_constraints import two_body_fermion_constraints
 
 from openfermion.config import THIS_DIRECTORY
 from openfermion.hamiltonians import MolecularData
@@ -53,6 +56,12 @@ class EqualityConstraintProjectionTest(unittest.TestCase):
         molecular_hamiltonian = molecule.get_molecular_hamiltonian()
         self.fermion_hamiltonian = get_fermion_operator(molecular_hamiltonian)
 
+        # Cache constraint matrices outside of the package data.
+        self.data_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_directory)
+
     def test_linearize_term(self):
         past_terms = set()
         for term, coefficient in self.fermion_hamiltonian.terms.items():
@@ -100,6 +109,33 @@ class EqualityConstraintProjectionTest(unittest.TestCase):
         modified_energy = expectation(sparse_modified, wavefunction)
         self.assertAlmostEqual(modified_energy, energy)
 
+    def test_constraint_matrix_terms(self):
+        for n_orbitals in range(1, 5):
+            for n_fermions in range(4):
+                constraints = constraint_matrix(
+                    n_orbitals, n_fermions).toarray()
+                n_terms = 1 + n_orbitals ** 2 + n_orbitals ** 4
+                expected = []
+                for constraint in two_body_fermion_constraints(
+                        n_orbitals, n_fermions):
+                    row = numpy.zeros(n_terms)
+                    for term, coefficient in constraint.terms.items():
+                        row[linearize_term(term, n_orbitals)] = coefficient
+                    expected.append(row)
+                self.assertTrue(numpy.array_equal(constraints,
+                                                  numpy.array(expected)))
+
+    def test_constraint_matrix_cache(self):
+        constraints = constraint_matrix(
+            self.n_orbitals, self.n_fermions, self.data_directory)
+        self.assertEqual(['constraint_matrix_v1_4_2.npz'],
+                         os.listdir(self.data_directory))
+        cached_constraints = constraint_matrix(
+            self.n_orbitals, self.n_fermions, self.data_directory)
+        self.assertEqual(constraints.shape, cached_constraints.shape)
+        self.assertTrue(numpy.array_equal(constraints.toarray(),
+                                          cached_constraints.toarray()))
+
     def test_apply_constraints(self):
 
         # Get norm of original operator.
@@ -110,8 +146,11 @@ class EqualityConstraintProjectionTest(unittest.TestCase):
 
         # Get modified operator.
         modified_operator = apply_constraints(
-            self.fermion_hamiltonian, self.n_fermions)
+            self.fermion_hamiltonian, self.n_fermions,
+            data_directory=self.data_directory)
         modified_operator.compress()
+        self.assertEqual(['constraint_matrix_v1_4_2.npz'],
+                         os.listdir(self.data_directory))
 
         # Get norm of modified operator.
         modified_norm = 0.
@@ -142,7 +181,8 @@ class EqualityConstraintProjectionTest(unittest.TestCase):
 
         # Test consistency with cvxopt.
         scipy_operator = apply_constraints(
-            self.fermion_hamiltonian, self.n_fermions, use_scipy=False)
+            self.fermion_hamiltonian, self.n_fermions, use_scipy=False,
+            data_directory=self.data_directory)
 
         # Get norm.
         scipy_norm = 0.
@@ -16,6 +16,8 @@ from openfermion.config import *
 from future.utils import iteritems
 import numpy
 
+from openfermion.ops._operator_utils import coefficient_list, sum_terms
+
 
 class FermionOperatorError(Exception):
     pass
@@ -196,7 +198,8 @@ class FermionOperator(object):
         The init function only allows to initialize a FermionOperator
         consisting of a single term. If one desires to initialize a
         FermionOperator consisting of many terms, one must add those terms
-        together by using either += (which is fast) or using +.
+        together by using either += (which is fast) or using +, or build
+        them all at once with FermionOperator.from_terms (which is fastest).
 
         Example:
             .. code-block:: python
@@ -263,6 +266,67 @@ class FermionOperator(object):
                         'Invalid action in FermionOperator: '
                         'Must be 0 (lowering) or 1 (raising).')
 
+    @staticmethod
+    def from_terms(terms, coefficients=None, validate=True):
+        """Build a FermionOperator from many terms at once.
+
+        This gives the same result as adding FermionOperator(term,
+        coefficient) for every pair with +=, but all terms are checked
+        in one vectorized pass and stored without intermediate operators.
+
+        Example:
+            .. code-block:: python
+
+                ham = FermionOperator.from_terms(
+                    [((0, 1), (3, 0)), ((3, 1), (0, 0))], [.5, .5])
+
+        Args:
+            terms: An iterable of terms, each a tuple of (mode, action)
+                tuples, or an integer array of shape
+                (n_terms, n_ladder_operators, 2) for terms of equal length.
+            coefficients: An iterable or array with the coefficient of each
+                term. Default is 1.0 for every term.
+            validate(bool): Whether to check the terms and coefficients.
+                Disable only for input which is known to be valid.
+
+        Returns:
+            operator (FermionOperator)
+
+        Raises:
+            FermionOperatorError: Invalid tensor factor.
+            ValueError: Invalid action, term or coefficients.
+        """
+        if isinstance(terms, numpy.ndarray):
+            ladder_operators = terms
+            terms = [tuple(map(tuple, term)) for term in terms.tolist()]
+        else:
+            terms = list(terms)
+            if validate:
+                ladder_operators = numpy.array(
+                    [ladder_operator for term in terms
+                     for ladder_operator in term])
+        coefficients = coefficient_list(coefficients, len(terms), validate)
+
+        # Check type.
+        if validate and ladder_operators.size:
+            if ladder_operators.shape[-1] != 2:
+                raise ValueError('Operators specified incorrectly.')
+            ladder_operators = ladder_operators.reshape((-1, 2))
+            if not (ladder_operators.dtype.kind in 'iu' and
+                    numpy.all(ladder_operators[:, 0] >= 0)):
+                raise FermionOperatorError(
+                    'Invalid tensor factor in FermionOperator:'
+                    'must be a non-negative int.')
+            if not numpy.all((ladder_operators[:, 1] == 0) |
+                             (ladder_operators[:, 1] == 1)):
+                raise ValueError(
+                    'Invalid action in FermionOperator: '
+                    'Must be 0 (lowering) or 1 (raising).')
+
+        operator = FermionOperator()
+        operator.terms = sum_terms(terms, coefficients, EQ_TOLERANCE)
+        return operator
+
     @staticmethod
     def zero():
         """
@@ -56,6 +56,53 @@ class FermionOperatorTest(unittest.TestCase):
         self.assertEqual(len(fermion_op.terms), 1)
         self.assertEqual(fermion_op.terms[loc_op], coefficient)
 
+    def test_from_terms(self):
+        terms = [((0, 1), (5, 0)), (), ((0, 1), (5, 0)), ((2, 0),)]
+        fermion_op = FermionOperator.from_terms(terms, [0.5, 2., 0.25j, 1.])
+        correct = (FermionOperator('0^ 5', 0.5 + 0.25j) +
+                   FermionOperator('', 2.) + FermionOperator('2'))
+        self.assertEqual(fermion_op.terms, correct.terms)
+
+    def test_from_terms_cancellation(self):
+        fermion_op = FermionOperator.from_terms(
+            [((1, 1),), ((1, 1),), ((2, 0),)], [1., -1., 3.])
+        self.assertEqual(fermion_op.terms, {((2, 0),): 3.})
+
+    def test_from_terms_default_coefficients(self):
+        fermion_op = FermionOperator.from_terms([((3, 1),), ((4, 0),)])
+        self.assertTrue(fermion_op.isclose(FermionOperator('3^') +
+                                           FermionOperator('4')))
+
+    def test_from_terms_array(self):
+        terms = numpy.array([[[0, 1], [1, 0]], [[3, 1], [2, 0]]])
+        coefficients = numpy.array([0.5, -1.5j])
+        fermion_op = FermionOperator.from_terms(terms, coefficients)
+        self.assertTrue(fermion_op.isclose(FermionOperator('0^ 1', 0.5) +
+                                           FermionOperator('3^ 2', -1.5j)))
+
+    def test_from_terms_no_validation(self):
+        fermion_op = FermionOperator.from_terms(
+            [((0, 1),)], [1.], validate=False)
+        self.assertTrue(fermion_op.isclose(FermionOperator('0^')))
+
+    def test_from_terms_bad_mode(self):
+        with self.assertRaises(FermionOperatorError):
+            FermionOperator.from_terms([((-1, 1),)])
+
+    def test_from_terms_bad_action(self):
+        with self.assertRaises(ValueError):
+            FermionOperator.from_terms([((1, 2),)])
+
+    def test_from_terms_bad_term_shape(self):
+        with self.assertRaises(ValueError):
+            FermionOperator.from_terms(numpy.zeros((2, 2, 3), int))
+
+    def test_from_terms_bad_coefficients(self):
+        with self.assertRaises(ValueError):
+            FermionOperator.from_terms([((1, 1),)], [1., 2.])
+        with self.assertRaises(ValueError):
+            FermionOperator.from_terms([((1, 1),)], ['a'])
+
     def test_identity_is_multiplicative_identity(self):
         u = FermionOperator.identity()
         f = FermionOperator(((0, 1), (5, 0), (6, 1)), 0.6j)
@@ -13,9 +13,10 @@
 """Class and functions to store interaction operators."""
 from __future__ import absolute_import
 
-import itertools
+import numpy
 
 from openfermion.ops import PolynomialTensor
+from openfermion.ops._polynomial_tensor import _nonzero_indices
 
 
 class InteractionOperatorError(Exception):
@@ -89,17 +90,17 @@ class InteractionOperator(PolynomialTensor):
             yield ()
 
         # One-body terms.
-        for p in range(self.n_qubits):
-            for q in range(p + 1):
-                if self.one_body_tensor[p, q]:
-                    yield (p, 1), (q, 0)
+        for p, q in _nonzero_indices(self.one_body_tensor).tolist():
+            if q <= p:
+                yield (p, 1), (q, 0)
 
-        # Two-body terms.
-        seen = set()
-        for quad in itertools.product(range(self.n_qubits), repeat=4):
-            if self.two_body_tensor[quad] and quad not in seen:
-                seen |= set(_symmetric_two_body_terms(quad, complex_valued))
-                yield tuple(zip(quad, (1, 1, 0, 0)))
+        # Two-body terms. Yield the first nonzero quad of each symmetry
+        # class, which the canonical keys identify.
+        quads = _nonzero_indices(self.two_body_tensor)
+        keys = _canonical_two_body_keys(quads, self.n_qubits, complex_valued)
+        first_indices = numpy.sort(numpy.unique(keys, return_index=True)[1])
+        for quad in quads[first_indices].tolist():
+            yield tuple(zip(quad, (1, 1, 0, 0)))
 
 
 def _symmetric_two_body_terms(quad, complex_valued):
@@ -113,3 +114,17 @@ def _symmetric_two_body_terms(quad, complex_valued):
         yield q, r, s, p
         yield s, p, q, r
         yield r, q, p, s
+
+
+def _canonical_two_body_keys(quads, n_qubits, complex_valued):
+    """Label the symmetry class of each quad in an (n_quads, 4) array.
+
+    The label is the flattened tensor position of the lexicographically
+    smallest quad in the class, so two quads get the same label exactly
+    when they are related by the symmetries of unique_iter.
+    """
+    images = numpy.array(list(_symmetric_two_body_terms(quads.T,
+                                                        complex_valued)))
+    positions = numpy.ravel_multi_index(tuple(images.transpose(1, 0, 2)),
+                                        (n_qubits,) * 4)
+    return numpy.amin(positions, axis=0)
@@ -16,7 +16,7 @@ from __future__ import absolute_import
 import numpy
 import unittest
 
-from openfermion.ops import InteractionOperator
+from openfermion.ops import InteractionOperator, SparseTensor
 
 
 class InteractionOperatorTest(unittest.TestCase):
@@ -76,3 +76,31 @@ class InteractionOperatorTest(unittest.TestCase):
         for key in interaction_operator.unique_iter():
             got_str += '{}\n'.format(interaction_operator[key])
         self.assertEqual(want_str, got_str)
+
+    def test_unique_iter_representatives(self):
+        one_body = numpy.zeros((self.n_qubits, self.n_qubits), float)
+        two_body = numpy.zeros((self.n_qubits, self.n_qubits,
+                                self.n_qubits, self.n_qubits), float)
+        one_body[3, 1] = 1.0
+        one_body[0, 4] = 2.0
+        two_body[4, 3, 2, 1] = 3.0
+        two_body[3, 4, 1, 2] = 3.0
+        two_body[3, 2, 1, 4] = 4.0
+        two_body[0, 0, 1, 1] = 5.0
+        want_keys = [((3, 1), (1, 0)),
+                     ((0, 1), (0, 1), (1, 0), (1, 0)),
+                     ((3, 1), (2, 1), (1, 0), (4, 0)),
+                     ((3, 1), (4, 1), (1, 0), (2, 0))]
+        want_keys_eight_point = want_keys[:3]
+
+        for one_body_tensor, two_body_tensor in (
+                (one_body, two_body),
+                (SparseTensor.from_dense(one_body),
+                 SparseTensor.from_dense(two_body))):
+            interaction_operator = InteractionOperator(
+                0., one_body_tensor, two_body_tensor)
+            self.assertEqual(
+                list(interaction_operator.unique_iter(complex_valued=True)),
+                want_keys)
+            self.assertEqual(list(interaction_operator.unique_iter()),
+                             want_keys_eight_point)
@@ -13,20 +13,107 @@
 """Class and functions to store reduced density matrices."""
 from __future__ import absolute_import
 
-import copy
+import collections
+
 import numpy
+import scipy.sparse
 
 from openfermion.ops import (FermionOperator,
                              PolynomialTensor,
                              InteractionOperator,
                              normal_ordered,
                              QubitOperator)
+from openfermion.ops._polynomial_tensor import _dense
 
 
 class InteractionRDMError(Exception):
     pass
 
 
+# Rows of the map from Pauli strings to RDM elements, keyed by the number of
+# qubits and the packed Pauli string. None marks a Pauli string which is not
+# contained in the 1-RDM and 2-RDM. Only the most recently used rows are kept.
+_QUBIT_TERM_ROWS = collections.OrderedDict()
+_MAX_QUBIT_TERM_ROWS = 100000
+_PAULI_CODES = {'X': 1, 'Y': 2, 'Z': 3}
+
+
+def _packed_pauli_key(qubit_term):
+    """Pack a Pauli string into an int holding 2 bits per qubit."""
+    key = 0
+    for qubit, pauli in qubit_term:
+        key |= _PAULI_CODES[pauli] << (2 * qubit)
+    return key
+
+
+def _cache_qubit_term_row(cache_key, row):
+    """Cache a row, dropping the least recently used ones if full."""
+    _QUBIT_TERM_ROWS[cache_key] = row
+    while len(_QUBIT_TERM_ROWS) > _MAX_QUBIT_TERM_ROWS:
+        _QUBIT_TERM_ROWS.popitem(last=False)
+
+
+def _qubit_term_row(qubit_term, n_qubits):
+    """Express the expectation of a Pauli string through RDM elements.
+
+    Returns:
+        columns: The positions of the RDM elements in the vector holding 1,
+            the flattened 1-RDM and the flattened 2-RDM.
+        coefficients: The coefficient of each element.
+
+    Raises:
+        InteractionRDMError: Observable not contained in 1-RDM or 2-RDM.
+    """
+    cache_key = n_qubits, _packed_pauli_key(qubit_term)
+    if cache_key in _QUBIT_TERM_ROWS:
+        # Reinsert to mark the row as most recently used.
+        row = _QUBIT_TERM_ROWS.pop(cache_key)
+        _QUBIT_TERM_ROWS[cache_key] = row
+        if row is None:
+            raise InteractionRDMError('Observable not contained '
+                                      'in 1-RDM or 2-RDM.')
+        return row
+
+    # Map qubits back to fermions.
+    from openfermion.transforms import reverse_jordan_wigner
+    reversed_fermion_operators = normal_ordered(reverse_jordan_wigner(
+        QubitOperator(qubit_term)))
+
+    # Loop through fermion terms.
+    columns, coefficients = [], []
+    for fermion_term, coefficient in reversed_fermion_operators.terms.items():
+        indices = [operator[0] for operator in fermion_term]
+
+        # Handle non-molecular terms.
+        if not FermionOperator(fermion_term).is_molecular_term():
+            if len(fermion_term) > 4:
+                _cache_qubit_term_row(cache_key, None)
+                raise InteractionRDMError('Observable not contained '
+                                          'in 1-RDM or 2-RDM.')
+        elif any(index >= n_qubits for index in indices):
+            _cache_qubit_term_row(cache_key, None)
+            raise InteractionRDMError('Observable not contained '
+                                      'in 1-RDM or 2-RDM.')
+
+        # Handle molecular term.
+        elif not indices:
+            columns.append(0)
+            coefficients.append(coefficient)
+        elif len(indices) == 2:
+            columns.append(1 + numpy.ravel_multi_index(indices,
+                                                       (n_qubits,) * 2))
+            coefficients.append(coefficient)
+        else:
+            columns.append(1 + n_qubits ** 2 + numpy.ravel_multi_index(
+                indices, (n_qubits,) * 4))
+            coefficients.append(coefficient)
+
+    row = (numpy.array(columns, dtype=int),
+           numpy.array(coefficients, dtype=complex))
+    _cache_qubit_term_row(cache_key, row)
+    return row
+
+
 class InteractionRDM(PolynomialTensor):
     """Class for storing 1- and 2-body reduced density matrices.
 
@@ -62,11 +149,12 @@ class InteractionRDM(PolynomialTensor):
             InteractionRDMError: Invalid operator provided.
         """
         if isinstance(operator, QubitOperator):
-            expectation_op = self.get_qubit_expectations(operator)
-            expectation = 0.0
-            for qubit_term in operator.terms:
-                expectation += (operator.terms[qubit_term] *
-                                expectation_op.terms[qubit_term])
+            qubit_terms = list(operator.terms)
+            coefficients = numpy.array([operator.terms[qubit_term] for
+                                        qubit_term in qubit_terms])
+            expectation = coefficients.dot(
+                self._qubit_expectation_map(qubit_terms).dot(
+                    self._rdm_vector()))
         elif isinstance(operator, InteractionOperator):
             expectation = operator.constant
             expectation += numpy.sum(self.one_body_tensor *
@@ -91,39 +179,37 @@ class InteractionRDM(PolynomialTensor):
         Raises:
             InteractionRDMError: Observable not contained in 1-RDM or 2-RDM.
         """
-        from openfermion.transforms import reverse_jordan_wigner
-        qubit_operator_expectations = copy.deepcopy(qubit_operator)
-        for qubit_term in qubit_operator_expectations.terms:
-            expectation = 0.
-
-            # Map qubits back to fermions.
-            reversed_fermion_operators = reverse_jordan_wigner(
-                QubitOperator(qubit_term))
-            reversed_fermion_operators = normal_ordered(
-                reversed_fermion_operators)
-
-            # Loop through fermion terms.
-            for fermion_term in reversed_fermion_operators.terms:
-                coefficient = reversed_fermion_operators.terms[fermion_term]
-
-                # Handle molecular term.
-                if FermionOperator(fermion_term).is_molecular_term():
-                    if not fermion_term:
-                        expectation += coefficient
-                    else:
-                        indices = [operator[0] for operator in fermion_term]
-                        if len(indices) == 2:
-                            # One-body term
-                            indices = tuple(zip(indices, (1, 0)))
-                        else:
-                            # Two-body term
-                            indices = tuple(zip(indices, (1, 1, 0, 0)))
-                        rdm_element = self[indices]
-                        expectation += rdm_element * coefficient
-
-                # Handle non-molecular terms.
-                elif len(fermion_term) > 4:
-                    raise InteractionRDMError('Observable not contained '
-                                              'in 1-RDM or 2-RDM.')
-            qubit_operator_expectations.terms[qubit_term] = expectation
+        qubit_terms = list(qubit_operator.terms)
+        expectations = self._qubit_expectation_map(qubit_terms).dot(
+            self._rdm_vector())
+        qubit_operator_expectations = QubitOperator()
+        qubit_operator_expectations.terms = dict(zip(qubit_terms,
+                                                     expectations.tolist()))
         return qubit_operator_expectations
+
+    def _rdm_vector(self):
+        """Return 1 followed by the flattened 1-RDM and 2-RDM."""
+        return numpy.concatenate((numpy.ones(1),
+                                  numpy.ravel(_dense(self.one_body_tensor)),
+                                  numpy.ravel(_dense(self.two_body_tensor))))
+
+    def _qubit_expectation_map(self, qubit_terms):
+        """Return the sparse matrix taking _rdm_vector to the expectations
+        of the given Pauli strings.
+
+        The row of each Pauli string is computed once per number of qubits
+        and cached across InteractionRDM instances.
+        """
+        rows = [_qubit_term_row(qubit_term, self.n_qubits) for
+                qubit_term in qubit_terms]
+        row_lengths = [len(columns) for columns, _ in rows]
+        indptr = numpy.concatenate(([0], numpy.cumsum(row_lengths)))
+        columns = numpy.concatenate(
+            [columns for columns, _ in rows] + [numpy.zeros(0, int)])
+        coefficients = numpy.concatenate(
+            [coefficients for _, coefficients in rows] +
+            [numpy.zeros(0, complex)])
+        return scipy.sparse.csr_matrix(
+            (coefficients, columns, indptr),
+            shape=(len(qubit_terms),
+                   1 + self.n_qubits ** 2 + self.n_qubits ** 4))
@@ -13,11 +13,13 @@
 """Tests for interaction_rdms.py."""
 from __future__ import absolute_import
 
+import numpy
 import unittest
 
 from openfermion.config import *
 from openfermion.hamiltonians import MolecularData
-from openfermion.ops import QubitOperator
+from openfermion.ops import InteractionRDM, QubitOperator, SparseTensor
+from openfermion.ops import _interaction_rdm
 from openfermion.ops._interaction_rdm import InteractionRDMError
 from openfermion.transforms import jordan_wigner
 
@@ -48,10 +50,56 @@ class InteractionRDMTest(unittest.TestCase):
                             qubit_expectations.terms[qubit_term])
         self.assertLess(abs(test_energy - self.cisd_energy), EQ_TOLERANCE)
 
+    def test_get_qubit_expectations_sparse(self):
+        qubit_operator = jordan_wigner(self.hamiltonian)
+        sparse_rdm = InteractionRDM(
+            SparseTensor.from_dense(self.rdm.one_body_tensor),
+            SparseTensor.from_dense(self.rdm.two_body_tensor))
+        qubit_expectations = self.rdm.get_qubit_expectations(qubit_operator)
+        sparse_expectations = sparse_rdm.get_qubit_expectations(
+            qubit_operator)
+        self.assertTrue(qubit_expectations.isclose(sparse_expectations))
+
     def test_get_qubit_expectations_nonmolecular_term(self):
         with self.assertRaises(InteractionRDMError):
             self.rdm.get_qubit_expectations(QubitOperator('X1 X2 X3 X4 Y6'))
 
+    def test_get_qubit_expectations_many_rdms(self):
+        qubit_operator = (QubitOperator('Z0', 2.) +
+                          QubitOperator('X0 Z1 X2', 3.))
+        for i in range(3):
+            one_body = numpy.random.randn(3, 3)
+            two_body = numpy.random.randn(3, 3, 3, 3)
+            rdm = InteractionRDM(one_body, two_body)
+            qubit_expectations = rdm.get_qubit_expectations(qubit_operator)
+            self.assertAlmostEqual(qubit_expectations.terms[((0, 'Z'),)],
+                                   1. - 2. * one_body[0, 0])
+            self.assertAlmostEqual(
+                qubit_expectations.terms[((0, 'X'), (1, 'Z'), (2, 'X'))],
+                one_body[0, 2] + one_body[2, 0])
+            self.assertAlmostEqual(
+                rdm.expectation(qubit_operator),
+                2. * (1. - 2. * one_body[0, 0]) +
+                3. * (one_body[0, 2] + one_body[2, 0]))
+
+    def test_get_qubit_expectations_qubit_out_of_range(self):
+        with self.assertRaises(InteractionRDMError):
+            self.rdm.get_qubit_expectations(QubitOperator('Z5'))
+
+    def test_qubit_term_row_cache_size(self):
+        max_rows = _interaction_rdm._MAX_QUBIT_TERM_ROWS
+        _interaction_rdm._MAX_QUBIT_TERM_ROWS = 3
+        _interaction_rdm._QUBIT_TERM_ROWS.clear()
+        try:
+            qubit_operator = jordan_wigner(self.hamiltonian)
+            qubit_expectations = self.rdm.get_qubit_expectations(
+                qubit_operator)
+            self.assertEqual(len(_interaction_rdm._QUBIT_TERM_ROWS), 3)
+            self.assertTrue(qubit_expectations.isclose(
+                self.rdm.get_qubit_expectations(qubit_operator)))
+        finally:
+            _interaction_rdm._MAX_QUBIT_TERM_ROWS = max_rows
+
     def test_get_qubit_expectations_through_expectation_method(self):
         qubit_operator = jordan_wigner(self.hamiltonian)
         test_energy = self.rdm.expectation(qubit_operator)
@@ -0,0 +1,70 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Helpers shared by the bulk constructors of the operator classes."""
+import numpy
+
+
+def coefficient_list(coefficients, n_terms, validate):
+    """Return the coefficients of a bulk-constructed operator as a list.
+
+    Args:
+        coefficients: An iterable or array of coefficients, or None for a
+            coefficient of 1.0 on every term.
+        n_terms(int): The number of terms.
+        validate(bool): Whether to check the coefficients.
+
+    Raises:
+        ValueError: Coefficients are not scalars or do not match the terms.
+    """
+    if coefficients is None:
+        return [1.] * n_terms
+    if isinstance(coefficients, numpy.ndarray):
+        coefficient_array = coefficients
+        coefficients = coefficients.tolist()
+    else:
+        coefficients = list(coefficients)
+        coefficient_array = numpy.asarray(coefficients) if validate else None
+    if validate:
+        if len(coefficients) != n_terms:
+            raise ValueError('Number of terms and coefficients must match.')
+        if n_terms and (coefficient_array.ndim != 1 or
+                        coefficient_array.dtype.kind not in 'iufc'):
+            raise ValueError('Coefficient must be scalar.')
+    return coefficients
+
+
+def sum_terms(terms, coefficients, tolerance):
+    """Return the terms dictionary of a sum of single-term operators.
+
+    Repeated terms are summed exactly as repeated += would sum them, so
+    tolerance must match the one used by += of the operator class.
+
+    Args:
+        terms(list): The terms, which may repeat.
+        coefficients(list): The coefficient of each term.
+        tolerance(float): A term is dropped once the sum of its
+            coefficients is zero or smaller in magnitude than tolerance.
+    """
+    summed_terms = dict(zip(terms, coefficients))
+    if len(summed_terms) < len(terms):
+        summed_terms = {}
+        for term, coefficient in zip(terms, coefficients):
+            if term in summed_terms:
+                coefficient += summed_terms[term]
+                if coefficient == 0. or abs(coefficient) < tolerance:
+                    del summed_terms[term]
+                else:
+                    summed_terms[term] = coefficient
+            else:
+                summed_terms[term] = coefficient
+    return summed_terms
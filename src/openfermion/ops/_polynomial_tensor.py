@@ -15,8 +15,8 @@ fermionic ladder operators."""
 from __future__ import absolute_import
 
 import copy
-import itertools
 import numpy
+import scipy.sparse
 
 from openfermion.config import *
 
@@ -25,7 +25,266 @@ class PolynomialTensorError(Exception):
     pass
 
 
-def one_body_basis_change(one_body_tensor, rotation_matrix):
+class SparseTensor(object):
+    """A tensor which stores only its nonzero entries.
+
+    SparseTensor can be used instead of a dense numpy array for the n-body
+    tensors of a PolynomialTensor. This makes it possible to represent
+    operators such as lattice Hamiltonians on many sites, whose tensors
+    have few nonzero entries but would not fit in memory as dense arrays.
+    It supports indexing with tuples of integers, elementwise addition,
+    subtraction and multiplication, and negation.
+
+    Attributes:
+        shape(tuple): The shape of the tensor.
+        keys(ndarray): The positions of the stored entries in the flattened
+            (C-ordered) tensor, in increasing order.
+        values(ndarray): The stored entries, in the order of keys. None of
+            them are zero.
+    """
+    __array_ufunc__ = None
+
+    def __init__(self, shape, indices=(), values=()):
+        """Initialize a SparseTensor.
+
+        Args:
+            shape(tuple): The shape of the tensor.
+            indices: An array of shape (n_entries, len(shape)) containing
+                the index of each entry. Entries with the same index are
+                summed.
+            values: An array with the value of each entry.
+
+        Raises:
+            ValueError: Indices out of bounds or not matching the values.
+        """
+        shape = tuple(int(dimension) for dimension in shape)
+        indices = numpy.asarray(indices, dtype=int).reshape(-1, len(shape))
+        values = numpy.asarray(values).reshape(-1)
+        if len(indices) != len(values):
+            raise ValueError('Number of indices and values do not match.')
+        keys = numpy.ravel_multi_index(tuple(indices.T), shape)
+        self.shape = shape
+        self.keys, self.values = _canonical_entries(keys, values)
+
+    @staticmethod
+    def from_dense(array):
+        """Build a SparseTensor holding the nonzero entries of an array."""
+        array = numpy.asarray(array)
+        keys = numpy.flatnonzero(array)
+        return SparseTensor._from_keys(array.shape, keys,
+                                       array.reshape(-1)[keys])
+
+    @staticmethod
+    def _from_keys(shape, keys, values, canonical=False):
+        sparse_tensor = SparseTensor(shape)
+        if canonical:
+            sparse_tensor.keys, sparse_tensor.values = keys, values
+        else:
+            sparse_tensor.keys, sparse_tensor.values = _canonical_entries(
+                keys, values)
+        return sparse_tensor
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def nnz(self):
+        """The number of stored entries."""
+        return len(self.keys)
+
+    @property
+    def indices(self):
+        """The indices of the stored entries as an (nnz, ndim) array."""
+        return numpy.array(numpy.unravel_index(self.keys, self.shape),
+                           dtype=int).reshape(self.ndim, -1).T
+
+    def todense(self):
+        """Return the tensor as a dense numpy array."""
+        array = numpy.zeros(self.shape, self.dtype)
+        array.reshape(-1)[self.keys] = self.values
+        return array
+
+    def __getitem__(self, index):
+        """Look up entries by a tuple of integers or of integer arrays."""
+        keys = numpy.ravel_multi_index(index, self.shape)
+        if not self.nnz:
+            return numpy.zeros(numpy.shape(keys), self.dtype)[()]
+        positions = numpy.minimum(numpy.searchsorted(self.keys, keys),
+                                  self.nnz - 1)
+        found = self.keys[positions] == keys
+        return numpy.where(found, self.values[positions], 0)[()]
+
+    def __setitem__(self, index, value):
+        """Set the entry at a tuple of integers."""
+        key = numpy.ravel_multi_index(index, self.shape)
+        position = numpy.searchsorted(self.keys, key)
+        present = position < self.nnz and self.keys[position] == key
+        if present and value == 0:
+            self.keys = numpy.delete(self.keys, position)
+            self.values = numpy.delete(self.values, position)
+        elif present:
+            self.values = self.values.astype(
+                numpy.result_type(self.values, value))
+            self.values[position] = value
+        elif value != 0:
+            self.keys = numpy.insert(self.keys, position, key)
+            self.values = numpy.insert(
+                self.values.astype(numpy.result_type(self.values, value)),
+                position, value)
+
+    def _combine(self, other, sign):
+        if not isinstance(other, SparseTensor):
+            return self.todense() + sign * other
+        if self.shape != other.shape:
+            raise ValueError('Invalid tensor shape.')
+        return SparseTensor._from_keys(
+            self.shape, numpy.concatenate((self.keys, other.keys)),
+            numpy.concatenate((self.values, sign * other.values)))
+
+    def __add__(self, addend):
+        return self._combine(addend, 1)
+
+    def __radd__(self, addend):
+        return self._combine(addend, 1)
+
+    def __sub__(self, subtrahend):
+        return self._combine(subtrahend, -1)
+
+    def __rsub__(self, minuend):
+        return (-self)._combine(minuend, 1)
+
+    def __neg__(self):
+        return SparseTensor._from_keys(self.shape, self.keys, -self.values,
+                                       canonical=True)
+
+    def __mul__(self, multiplier):
+        if isinstance(multiplier, SparseTensor):
+            if self.shape != multiplier.shape:
+                raise ValueError('Invalid tensor shape.')
+            keys, self_positions, other_positions = numpy.intersect1d(
+                self.keys, multiplier.keys, assume_unique=True,
+                return_indices=True)
+            values = (self.values[self_positions] *
+                      multiplier.values[other_positions])
+        elif numpy.ndim(multiplier) == 0:
+            keys, values = self.keys, self.values * multiplier
+        else:
+            multiplier = numpy.broadcast_to(multiplier, self.shape)
+            keys = self.keys
+            values = self.values * multiplier[
+                numpy.unravel_index(keys, self.shape)]
+        nonzero = values != 0
+        return SparseTensor._from_keys(self.shape, keys[nonzero],
+                                       values[nonzero], canonical=True)
+
+    def __rmul__(self, multiplier):
+        return self * multiplier
+
+    def __repr__(self):
+        return 'SparseTensor(shape={}, nnz={})'.format(self.shape, self.nnz)
+
+
+def _canonical_entries(keys, values):
+    """Sort entries by key, summing duplicates and dropping zeros."""
+    keys = numpy.asarray(keys, dtype=numpy.int64)
+    if not numpy.all(keys[1:] > keys[:-1]):
+        keys, inverse = numpy.unique(keys, return_inverse=True)
+        summed_values = numpy.zeros(len(keys), values.dtype)
+        numpy.add.at(summed_values, inverse, values)
+        values = summed_values
+    nonzero = values != 0
+    return keys[nonzero], values[nonzero]
+
+
+def _nonzero_indices(tensor):
+    """Return the indices of the nonzero entries of a dense or sparse tensor.
+
+    The indices are returned as an (n_nonzero, ndim) array, in
+    lexicographic order.
+    """
+    if isinstance(tensor, SparseTensor):
+        return tensor.indices
+    return numpy.argwhere(tensor)
+
+
+def _dense(tensor):
+    """Return a dense or sparse tensor as a numpy array."""
+    if isinstance(tensor, SparseTensor):
+        return tensor.todense()
+    return numpy.asarray(tensor)
+
+
+def _sparse_basis_change(sparse_tensor, rotation_matrix):
+    """Rotate all axes of a SparseTensor, cycling axes like _basis_change."""
+    n_modes = rotation_matrix.shape[0]
+    n_rest = n_modes ** (sparse_tensor.ndim - 1)
+    rotation_matrix = scipy.sparse.csr_matrix(rotation_matrix)
+    keys, values = sparse_tensor.keys, sparse_tensor.values
+    for step in range(sparse_tensor.ndim):
+        matrix = scipy.sparse.csr_matrix(
+            (values, (keys % n_rest, keys // n_rest)),
+            shape=(n_rest, n_modes))
+        product = matrix.dot(rotation_matrix).tocoo()
+        keys = product.row.astype(numpy.int64) * n_modes + product.col
+        values = product.data
+    return SparseTensor._from_keys(sparse_tensor.shape, keys, values)
+
+
+def _basis_change(tensor, rotation_matrix, rank, in_place):
+    """Rotate the last rank axes of tensor by rotation_matrix.
+
+    Every step contracts the leading tensor axis with the rotation matrix
+    through a single matrix multiplication and appends the rotated axis at
+    the end. After rank steps the axes are back in their original order, so
+    no transposed copies of the tensor are ever made. Leading axes beyond
+    the last rank ones index a stack of tensors rotated together.
+
+    The steps write alternately into two buffers. If in_place is True and
+    the tensor can hold the result, the tensor itself is one of them and
+    receives the result, since rank is even.
+
+    A SparseTensor is rotated into a new SparseTensor.
+    """
+    rotation_matrix = numpy.asarray(rotation_matrix)
+
+    # If operator acts on spin degrees of freedom, enlarge rotation matrix.
+    n_orbitals = rotation_matrix.shape[0]
+    if tensor.shape[-1] == 2 * n_orbitals:
+        rotation_matrix = numpy.kron(rotation_matrix, numpy.eye(2))
+    n_modes = rotation_matrix.shape[0]
+
+    if isinstance(tensor, SparseTensor):
+        return _sparse_basis_change(tensor, rotation_matrix)
+    tensor = numpy.asarray(tensor)
+
+    dtype = numpy.result_type(tensor, rotation_matrix)
+    n_tensors = int(numpy.prod(tensor.shape[:-rank]))
+    step_shape = (n_tensors, n_modes, n_modes ** (rank - 1))
+    scratch = numpy.empty(tensor.shape, dtype)
+    if (in_place and tensor.dtype == dtype and
+            tensor.flags.c_contiguous and tensor.flags.writeable):
+        buffers = (scratch, tensor)
+    else:
+        buffers = (scratch, numpy.empty(tensor.shape, dtype))
+
+    # Effect transformation and return.
+    source = tensor
+    for step in range(rank):
+        target = buffers[step % 2]
+        numpy.matmul(source.reshape(step_shape).transpose(0, 2, 1),
+                     rotation_matrix,
+                     out=target.reshape(step_shape[0], step_shape[2],
+                                        step_shape[1]))
+        source = target
+    return source
+
+
+def one_body_basis_change(one_body_tensor, rotation_matrix, in_place=False):
     """Change the basis of an 1-body interaction tensor such as the 1-RDM.
 
     M' = R^T.M.R where R is the rotation matrix, M is the 1-body tensor
@@ -33,56 +292,44 @@ def one_body_basis_change(one_body_tensor, rotation_matrix):
 
     Args:
         one_body_tensor: A square numpy array or matrix containing information
-            about a 1-body interaction tensor such as the 1-RDM.
+            about a 1-body interaction tensor such as the 1-RDM, or an array
+            of such tensors stacked along the leading axes, all of which are
+            rotated together.
         rotation_matrix: A square numpy array or matrix having dimensions of
             n_qubits by n_qubits. Assumed to be real and invertible.
+        in_place(bool): Whether the result may overwrite one_body_tensor.
+            This only happens if it is a C-contiguous array of the result
+            dtype; otherwise a new array is returned.
 
     Returns:
         transformed_one_body_tensor: one_body_tensor in the rotated basis.
     """
-    # If operator acts on spin degrees of freedom, enlarge rotation matrix.
-    n_orbitals = rotation_matrix.shape[0]
-    if one_body_tensor.shape[0] == 2 * n_orbitals:
-        rotation_matrix = numpy.kron(rotation_matrix, numpy.eye(2))
-
-    # Effect transformation and return.
-    transformed_one_body_tensor = numpy.einsum('qp, qr, rs',
-                                               rotation_matrix,
-                                               one_body_tensor,
-                                               rotation_matrix)
-    return transformed_one_body_tensor
+    return _basis_change(one_body_tensor, rotation_matrix, 2, in_place)
 
 
-def two_body_basis_change(two_body_tensor, rotation_matrix):
+def two_body_basis_change(two_body_tensor, rotation_matrix, in_place=False):
     """Change the basis of 2-body interaction tensor such as 2-RDM.
 
     Procedure we use is an N^5 transformation which can be expressed as
     (pq|rs) = \sum_a R^p_a
     (\sum_b R^q_b (\sum_c R^r_c (\sum_d R^s_d (ab|cd)))).
 
+    Each of the four sums is a single BLAS matrix multiplication.
+
     Args:
-        two_body_tensor: a square rank 4 interaction tensor.
+        two_body_tensor: a square rank 4 interaction tensor, or an array of
+            such tensors stacked along the leading axes, all of which are
+            rotated together.
         rotation_matrix: A square numpy array or matrix having dimensions of
             n_qubits by n_qubits. Assumed to be real and invertible.
+        in_place(bool): Whether the result may overwrite two_body_tensor.
+            This only happens if it is a C-contiguous array of the result
+            dtype; otherwise a new array is returned.
 
     Returns:
         transformed_two_body_tensor: two_body_tensor matrix in rotated basis.
     """
-    # If operator acts on spin degrees of freedom, enlarge rotation matrix.
-    n_orbitals = rotation_matrix.shape[0]
-    if two_body_tensor.shape[0] == 2 * n_orbitals:
-        rotation_matrix = numpy.kron(rotation_matrix, numpy.eye(2))
-
-    # Effect transformation and return.
-    two_body_tensor = numpy.einsum('prsq', two_body_tensor)
-    first_sum = numpy.einsum('ds, abcd', rotation_matrix, two_body_tensor)
-    second_sum = numpy.einsum('cr, abcs', rotation_matrix, first_sum)
-    third_sum = numpy.einsum('bq, abrs', rotation_matrix, second_sum)
-    transformed_two_body_tensor = numpy.einsum('ap, aqrs',
-                                               rotation_matrix, third_sum)
-    transformed_two_body_tensor = numpy.einsum('psqr',
-                                               transformed_two_body_tensor)
-    return transformed_two_body_tensor
+    return _basis_change(two_body_tensor, rotation_matrix, 4, in_place)
 
 
 class PolynomialTensor(object):
@@ -107,7 +354,8 @@ class PolynomialTensor(object):
             and it could represent the coefficients of terms of the form
             a^\dagger_i a_j, whereas n_body_tensors[(0, 1)] would be
             an array of the same shape, but instead representing terms
-            of the form a_i a^\dagger_j.
+            of the form a_i a^\dagger_j. The tensors may also be
+            SparseTensor instances, which store only the nonzero entries.
     """
 
     def __init__(self, n_body_tensors):
@@ -174,8 +422,10 @@ class PolynomialTensor(object):
         for key in self.n_body_tensors:
             self_tensor = self.n_body_tensors[key]
             other_tensor = other_operator.n_body_tensors[key]
-            discrepancy = numpy.amax(
-                              numpy.absolute(self_tensor - other_tensor))
+            difference = self_tensor - other_tensor
+            if isinstance(difference, SparseTensor):
+                difference = difference.values
+            discrepancy = numpy.amax(numpy.absolute(difference), initial=0.)
             diff = max(diff, discrepancy)
         return diff < EQ_TOLERANCE
 
@@ -193,8 +443,8 @@ class PolynomialTensor(object):
             raise TypeError('Invalid tensor type.')
 
         for key in self.n_body_tensors:
-            self.n_body_tensors[key] = numpy.add(self.n_body_tensors[key],
-                                                 addend.n_body_tensors[key])
+            self.n_body_tensors[key] = (self.n_body_tensors[key] +
+                                        addend.n_body_tensors[key])
         return self
 
     def __add__(self, addend):
@@ -205,7 +455,7 @@ class PolynomialTensor(object):
     def __neg__(self):
         neg_n_body_tensors = dict()
         for key in self.n_body_tensors:
-            neg_n_body_tensors[key] = numpy.negative(self.n_body_tensors[key])
+            neg_n_body_tensors[key] = -self.n_body_tensors[key]
         return PolynomialTensor(neg_n_body_tensors)
 
     def __isub__(self, subtrahend):
@@ -219,8 +469,8 @@ class PolynomialTensor(object):
             raise TypeError('Invalid tensor type.')
 
         for key in self.n_body_tensors:
-            self.n_body_tensors[key] = numpy.subtract(
-                    self.n_body_tensors[key], subtrahend.n_body_tensors[key])
+            self.n_body_tensors[key] = (self.n_body_tensors[key] -
+                                        subtrahend.n_body_tensors[key])
         return self
 
     def __sub__(self, subtrahend):
@@ -239,8 +489,8 @@ class PolynomialTensor(object):
             raise TypeError('Invalid tensor type.')
 
         for key in self.n_body_tensors:
-            self.n_body_tensors[key] = numpy.multiply(
-                    self.n_body_tensors[key], multiplier.n_body_tensors[key])
+            self.n_body_tensors[key] = (self.n_body_tensors[key] *
+                                        multiplier.n_body_tensors[key])
         return self
 
     def __mul__(self, multiplier):
@@ -264,11 +514,9 @@ class PolynomialTensor(object):
             if key == ():
                 yield ()
             else:
-                n_body_tensor = self.n_body_tensors[key]
-                for index in itertools.product(
-                        range(self.n_qubits), repeat=len(key)):
-                    if n_body_tensor[index]:
-                        yield tuple(zip(index, key))
+                for index in _nonzero_indices(
+                        self.n_body_tensors[key]).tolist():
+                    yield tuple(zip(index, key))
 
     def __str__(self):
         """Print out the non-zero elements of PolynomialTensor."""
@@ -277,7 +525,7 @@ class PolynomialTensor(object):
             strings.append('{} {}\n'.format(key, self[key]))
         return ''.join(strings) if strings else '0'
 
-    def rotate_basis(self, rotation_matrix):
+    def rotate_basis(self, rotation_matrix, in_place=False):
         """
         Rotate the orbital basis of the PolynomialTensor.
 
@@ -285,13 +533,16 @@ class PolynomialTensor(object):
             rotation_matrix: A square numpy array or matrix having
                 dimensions of n_qubits by n_qubits. Assumed to be real and
                 invertible.
+            in_place(bool): Whether the rotated tensors may overwrite the
+                current tensor arrays instead of being allocated anew. Only
+                use this if the arrays are not shared with other objects.
         """
         if (1, 0) in self.n_body_tensors:
             self.n_body_tensors[1, 0] = one_body_basis_change(
-                self.n_body_tensors[1, 0], rotation_matrix)
+                self.n_body_tensors[1, 0], rotation_matrix, in_place)
         if (1, 1, 0, 0) in self.n_body_tensors:
             self.n_body_tensors[1, 1, 0, 0] = two_body_basis_change(
-                self.n_body_tensors[1, 1, 0, 0], rotation_matrix)
+                self.n_body_tensors[1, 1, 0, 0], rotation_matrix, in_place)
 
     def __repr__(self):
         return str(self)
@@ -18,7 +18,8 @@ import unittest
 import copy
 import numpy
 
-from openfermion.ops import PolynomialTensor
+from openfermion.ops import (PolynomialTensor, SparseTensor,
+                             one_body_basis_change, two_body_basis_change)
 
 
 class PolynomialTensorTest(unittest.TestCase):
@@ -358,3 +359,172 @@ class PolynomialTensorTest(unittest.TestCase):
                  (1, 1, 0, 0): two_body_reverse})
         polynomial_tensor.rotate_basis(rotation_matrix_reverse)
         self.assertEqual(polynomial_tensor, want_polynomial_tensor)
+
+    def test_basis_change_random(self):
+        n_orbitals = 3
+        rotation_matrix = numpy.linalg.qr(
+            numpy.random.randn(n_orbitals, n_orbitals))[0]
+        one_body = numpy.random.randn(n_orbitals, n_orbitals)
+        two_body = numpy.random.randn(n_orbitals, n_orbitals,
+                                      n_orbitals, n_orbitals)
+
+        self.assertTrue(numpy.allclose(
+            one_body_basis_change(one_body, rotation_matrix),
+            rotation_matrix.T.dot(one_body).dot(rotation_matrix)))
+        self.assertTrue(numpy.allclose(
+            two_body_basis_change(two_body, rotation_matrix),
+            numpy.einsum('ap, bq, cr, ds, abcd', rotation_matrix,
+                         rotation_matrix, rotation_matrix, rotation_matrix,
+                         two_body)))
+
+    def test_basis_change_stack(self):
+        n_orbitals = 3
+        rotation_matrix = numpy.linalg.qr(
+            numpy.random.randn(n_orbitals, n_orbitals))[0]
+        one_bodies = numpy.random.randn(4, n_orbitals, n_orbitals)
+        two_bodies = numpy.random.randn(4, 2 * n_orbitals, 2 * n_orbitals,
+                                        2 * n_orbitals, 2 * n_orbitals)
+
+        rotated_one_bodies = one_body_basis_change(one_bodies,
+                                                   rotation_matrix)
+        rotated_two_bodies = two_body_basis_change(two_bodies,
+                                                   rotation_matrix)
+        for i in range(4):
+            self.assertTrue(numpy.allclose(
+                rotated_one_bodies[i],
+                one_body_basis_change(one_bodies[i], rotation_matrix)))
+            self.assertTrue(numpy.allclose(
+                rotated_two_bodies[i],
+                two_body_basis_change(two_bodies[i], rotation_matrix)))
+
+    def test_basis_change_in_place(self):
+        rotation_matrix = numpy.array([[0., 1.], [1., 0.]])
+        two_body = numpy.random.randn(2, 2, 2, 2)
+        want_two_body = two_body_basis_change(two_body, rotation_matrix)
+
+        rotated_two_body = two_body_basis_change(two_body, rotation_matrix,
+                                                 in_place=True)
+        self.assertIs(rotated_two_body, two_body)
+        self.assertTrue(numpy.allclose(rotated_two_body, want_two_body))
+
+        # A complex rotation cannot be stored in a real tensor.
+        two_body = numpy.random.randn(2, 2, 2, 2)
+        rotated_two_body = two_body_basis_change(
+            two_body, 1.j * rotation_matrix, in_place=True)
+        self.assertIsNot(rotated_two_body, two_body)
+        self.assertTrue(numpy.allclose(
+            rotated_two_body,
+            two_body_basis_change(two_body, rotation_matrix)))
+
+    def test_rotate_basis_in_place(self):
+        rotation_matrix = numpy.linalg.qr(
+            numpy.random.randn(self.n_qubits, self.n_qubits))[0]
+        want_polynomial_tensor = copy.deepcopy(self.polynomial_tensor_a)
+        want_polynomial_tensor.rotate_basis(rotation_matrix)
+        one_body = self.polynomial_tensor_a.n_body_tensors[1, 0]
+
+        self.polynomial_tensor_a.rotate_basis(rotation_matrix, in_place=True)
+        self.assertEqual(self.polynomial_tensor_a, want_polynomial_tensor)
+        self.assertIs(self.polynomial_tensor_a.n_body_tensors[1, 0], one_body)
+
+
+class SparseTensorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.n_qubits = 3
+        self.dense = numpy.zeros((self.n_qubits,) * 4)
+        self.dense[0, 1, 2, 0] = 1.5
+        self.dense[2, 2, 1, 1] = -2.
+        self.dense[1, 0, 0, 2] = 0.5
+        self.sparse = SparseTensor.from_dense(self.dense)
+
+    def test_init(self):
+        sparse = SparseTensor((2, 2), [[1, 1], [0, 1], [1, 1], [1, 0]],
+                              [1., 2., 3., 0.])
+        self.assertEqual(sparse.nnz, 2)
+        self.assertTrue(numpy.array_equal(sparse.indices, [[0, 1], [1, 1]]))
+        self.assertTrue(numpy.array_equal(sparse.todense(),
+                                          [[0., 2.], [0., 4.]]))
+
+    def test_init_bad_input(self):
+        with self.assertRaises(ValueError):
+            SparseTensor((2, 2), [[0, 1]], [1., 2.])
+        with self.assertRaises(ValueError):
+            SparseTensor((2, 2), [[0, 2]], [1.])
+
+    def test_from_dense(self):
+        self.assertEqual(self.sparse.nnz, 3)
+        self.assertEqual(self.sparse.shape, (self.n_qubits,) * 4)
+        self.assertTrue(numpy.array_equal(self.sparse.todense(), self.dense))
+
+    def test_getitem(self):
+        self.assertEqual(self.sparse[0, 1, 2, 0], 1.5)
+        self.assertEqual(self.sparse[0, 0, 0, 0], 0.)
+        self.assertTrue(numpy.array_equal(
+            self.sparse[[2, 0], [2, 0], [1, 0], [1, 0]], [-2., 0.]))
+        self.assertEqual(SparseTensor((2, 2))[1, 0], 0.)
+
+    def test_setitem(self):
+        self.sparse[0, 0, 0, 0] = 1.j
+        self.sparse[2, 2, 1, 1] = 0.
+        self.sparse[1, 0, 0, 2] = 3.
+        self.dense = self.dense.astype(complex)
+        self.dense[0, 0, 0, 0] = 1.j
+        self.dense[2, 2, 1, 1] = 0.
+        self.dense[1, 0, 0, 2] = 3.
+        self.assertEqual(self.sparse.nnz, 3)
+        self.assertTrue(numpy.array_equal(self.sparse.todense(), self.dense))
+
+    def test_arithmetic(self):
+        other_dense = numpy.zeros((self.n_qubits,) * 4)
+        other_dense[0, 1, 2, 0] = -1.5
+        other_dense[1, 1, 1, 1] = 2.
+        other_sparse = SparseTensor.from_dense(other_dense)
+
+        self.assertTrue(numpy.array_equal(
+            (self.sparse + other_sparse).todense(), self.dense + other_dense))
+        self.assertEqual((self.sparse + other_sparse).nnz, 3)
+        self.assertTrue(numpy.array_equal(
+            (self.sparse - other_sparse).todense(), self.dense - other_dense))
+        self.assertTrue(numpy.array_equal(
+            (self.sparse * other_sparse).todense(), self.dense * other_dense))
+        self.assertTrue(numpy.array_equal((-self.sparse).todense(),
+                                          -self.dense))
+        self.assertTrue(numpy.array_equal((2. * self.sparse).todense(),
+                                          2. * self.dense))
+        self.assertTrue(numpy.array_equal(self.sparse + other_dense,
+                                          self.dense + other_dense))
+        self.assertTrue(numpy.array_equal(other_dense - self.sparse,
+                                          other_dense - self.dense))
+        with self.assertRaises(ValueError):
+            self.sparse + SparseTensor((2, 2))
+
+    def test_polynomial_tensor(self):
+        one_body = numpy.zeros((self.n_qubits, self.n_qubits))
+        one_body[0, 2] = 1.
+        dense_tensor = PolynomialTensor(
+            {(): 1., (1, 0): one_body, (1, 1, 0, 0): self.dense})
+        sparse_tensor = PolynomialTensor(
+            {(): 1., (1, 0): SparseTensor.from_dense(one_body),
+             (1, 1, 0, 0): self.sparse})
+
+        self.assertEqual(sparse_tensor.n_qubits, self.n_qubits)
+        self.assertEqual(sparse_tensor, dense_tensor)
+        self.assertEqual(list(sparse_tensor), list(dense_tensor))
+        self.assertEqual(str(sparse_tensor), str(dense_tensor))
+        self.assertEqual(sparse_tensor[(0, 1), (1, 1), (2, 0), (0, 0)], 1.5)
+        self.assertEqual(sparse_tensor + sparse_tensor,
+                         dense_tensor + dense_tensor)
+        self.assertEqual(sparse_tensor - dense_tensor,
+                         dense_tensor - dense_tensor)
+        self.assertEqual(sparse_tensor * sparse_tensor,
+                         dense_tensor * dense_tensor)
+        self.assertEqual(-sparse_tensor, -dense_tensor)
+
+        rotation_matrix = numpy.linalg.qr(
+            numpy.random.randn(self.n_qubits, self.n_qubits))[0]
+        sparse_tensor.rotate_basis(rotation_matrix)
+        dense_tensor.rotate_basis(rotation_matrix)
+        self.assertIsInstance(sparse_tensor.n_body_tensors[1, 1, 0, 0],
+                              SparseTensor)
+        self.assertEqual(sparse_tensor, dense_tensor)
@@ -15,7 +15,7 @@ in the fermionic ladder operators."""
 from __future__ import absolute_import
 
 import numpy
-from scipy.linalg import schur
+from scipy.linalg import hessenberg
 
 from openfermion.config import EQ_TOLERANCE
 from openfermion.ops import FermionOperator, PolynomialTensor
@@ -42,6 +42,10 @@ class QuadraticHamiltonian(PolynomialTensor):
     We separate the chemical potential \mu from M so that we can use it
     to adjust the expectation value of the total number of particles.
 
+    The Majorana form, its canonical form, the orbital energies and the
+    diagonalizing unitary are computed once and reused until the tensors
+    change.
+
     Attributes:
         constant(float): A constant term in the operator.
         chemical_potential(float): The chemical potential \mu.
@@ -120,6 +124,32 @@ class QuadraticHamiltonian(PolynomialTensor):
         self.n_body_tensors[1, 0] -= (chemical_potential *
                                       numpy.eye(self.n_qubits))
         self.chemical_potential += chemical_potential
+        self._diagonalization_cache = None
+
+    def _cached(self, name, compute):
+        """Return compute(), reusing its value from an earlier call as long
+        as the tensors have not been changed since."""
+        tensors = self.n_body_tensors
+        cache = getattr(self, '_diagonalization_cache', None)
+        if (cache is None or set(cache['tensors']) != set(tensors) or
+                not all(numpy.array_equal(cache['tensors'][key], tensors[key])
+                        for key in tensors)):
+            cache = {'tensors': {key: numpy.copy(tensor) for
+                                 key, tensor in tensors.items()}}
+            self._diagonalization_cache = cache
+        if name not in cache:
+            cache[name] = compute()
+        return cache[name]
+
+    def _hermitian_eigh(self):
+        """Return the eigendecomposition of the combined Hermitian part."""
+        return self._cached('hermitian_eigh', lambda: numpy.linalg.eigh(
+                self.combined_hermitian_part))
+
+    def _canonical_form(self):
+        """Return the canonical form of the Majorana matrix."""
+        return self._cached('canonical_form', lambda: (
+                antisymmetric_canonical_form(self.majorana_form()[0])))
 
     def orbital_energies(self):
         """Return the orbital energies.
@@ -138,15 +168,18 @@ class QuadraticHamiltonian(PolynomialTensor):
                 the \epsilon_j
             constant(float): the constant
         """
+        orbital_energies, constant = self._cached(
+                'orbital_energies', self._orbital_energies)
+        return orbital_energies.copy(), constant
+
+    def _orbital_energies(self):
+        """Compute the orbital energies and the constant."""
         if self.conserves_particle_number:
-            hermitian_matrix = self.combined_hermitian_part
-            orbital_energies, diagonalizing_unitary = numpy.linalg.eigh(
-                    hermitian_matrix)
+            orbital_energies, diagonalizing_unitary = self._hermitian_eigh()
             constant = self.constant
         else:
             majorana_matrix, majorana_constant = self.majorana_form()
-            canonical, orthogonal = antisymmetric_canonical_form(
-                    majorana_matrix)
+            canonical, orthogonal = self._canonical_form()
             orbital_energies = canonical[
                     range(self.n_qubits),
                     range(self.n_qubits, 2 * self.n_qubits)]
@@ -154,6 +187,26 @@ class QuadraticHamiltonian(PolynomialTensor):
 
         return orbital_energies, constant
 
+    def diagonalizing_unitary(self):
+        """Return the unitary that diagonalizes the Hamiltonian.
+
+        If the Hamiltonian conserves particle number, this is the
+        n_qubits x n_qubits unitary whose columns are the eigenvectors of
+        the combined Hermitian part, in the order of the orbital energies.
+        Otherwise it is the (2 * n_qubits) x (2 * n_qubits) unitary
+        returned by diagonalizing_fermionic_unitary for the Majorana form.
+
+        Returns:
+            diagonalizing_unitary(ndarray)
+        """
+        if self.conserves_particle_number:
+            energies, diagonalizing_unitary = self._hermitian_eigh()
+        else:
+            diagonalizing_unitary = self._cached(
+                    'fermionic_unitary', lambda: _fermionic_unitary(
+                        self._canonical_form()[1]))
+        return diagonalizing_unitary.copy()
+
     def majorana_form(self):
         """Return the Majorana represention of the Hamiltonian.
 
@@ -169,6 +222,12 @@ class QuadraticHamiltonian(PolynomialTensor):
         and A is a (2 * n_qubits) x (2 * n_qubits) real antisymmetric matrix.
         This function returns the matrix A and the constant.
         """
+        majorana_matrix, majorana_constant = self._cached(
+                'majorana_form', self._majorana_form)
+        return majorana_matrix.copy(), majorana_constant
+
+    def _majorana_form(self):
+        """Compute the Majorana matrix and constant."""
         hermitian_part = self.combined_hermitian_part
         antisymmetric_part = self.antisymmetric_part
 
@@ -263,21 +322,17 @@ def diagonalizing_fermionic_unitary(antisymmetric_matrix):
             unitary matrix representing a transformation of the fermionic
             ladder operators.
     """
-    m, n = antisymmetric_matrix.shape
-    n_qubits = n // 2
-
     # Get the orthogonal transformation that puts antisymmetric_matrix
     # into canonical form
     canonical, orthogonal = antisymmetric_canonical_form(antisymmetric_matrix)
 
-    # Create the matrix that converts between fermionic ladder and
-    # Majorana bases
-    normalized_identity = numpy.eye(n_qubits, dtype=complex) / numpy.sqrt(2.)
-    majorana_basis_change = numpy.eye(
-            2 * n_qubits, dtype=complex) / numpy.sqrt(2.)
-    majorana_basis_change[n_qubits:, n_qubits:] *= -1.j
-    majorana_basis_change[:n_qubits, n_qubits:] = normalized_identity
-    majorana_basis_change[n_qubits:, :n_qubits] = 1.j * normalized_identity
+    return _fermionic_unitary(orthogonal)
+
+
+def _fermionic_unitary(orthogonal):
+    """Express an orthogonal transformation of the Majorana operators as
+    a unitary mixing the fermionic ladder operators."""
+    majorana_basis_change = _majorana_basis_change(orthogonal.shape[0] // 2)
 
     # Compute the unitary and return
     diagonalizing_unitary = majorana_basis_change.T.conj().dot(
@@ -286,7 +341,23 @@ def diagonalizing_fermionic_unitary(antisymmetric_matrix):
     return diagonalizing_unitary
 
 
-def antisymmetric_canonical_form(antisymmetric_matrix):
+def _majorana_basis_change(n_qubits):
+    """Return the matrix that converts between fermionic ladder and
+    Majorana bases.
+
+    It maps the ladder operators, with the creation operators listed
+    first, to the Majorana operators in the order of majorana_form.
+    """
+    normalized_identity = numpy.eye(n_qubits, dtype=complex) / numpy.sqrt(2.)
+    majorana_basis_change = numpy.eye(
+            2 * n_qubits, dtype=complex) / numpy.sqrt(2.)
+    majorana_basis_change[n_qubits:, n_qubits:] *= -1.j
+    majorana_basis_change[:n_qubits, n_qubits:] = normalized_identity
+    majorana_basis_change[n_qubits:, :n_qubits] = 1.j * normalized_identity
+    return majorana_basis_change
+
+
+def antisymmetric_canonical_form(antisymmetric_matrix, debug=False):
     """Compute the canonical form of an antisymmetric matrix.
 
     The input is a real, antisymmetric n x n matrix A, where n is even.
@@ -301,9 +372,16 @@ def antisymmetric_canonical_form(antisymmetric_matrix):
 
     where D is a diagonal matrix with nonnegative entries.
 
+    A is first reduced to an antisymmetric tridiagonal matrix T = Q^T A Q.
+    The entries of T couple even and odd indices only, so T is determined
+    by the bidiagonal block B of its even rows and odd columns, and the
+    singular value decomposition of B yields C and R.
+
     Args:
         antisymmetric_matrix(ndarray): An antisymmetric matrix with even
             dimension.
+        debug(bool): Whether to verify that the result is a canonical form
+            of the input.
 
     Returns:
         canonical(ndarray): The canonical form C of antisymmetric_matrix
@@ -321,48 +399,36 @@ def antisymmetric_canonical_form(antisymmetric_matrix):
     if maxval > EQ_TOLERANCE:
         raise ValueError('The input matrix must be antisymmetric.')
 
-    # Compute Schur decomposition
-    canonical, orthogonal = schur(antisymmetric_matrix, output='real')
-
-    # The returned form is block diagonal; we need to permute rows and columns
-    # to put it into the form we want
+    # Reduce to tridiagonal form
     n = p // 2
-    for i in range(1, n, 2):
-        swap_rows(canonical, i, n + i - 1)
-        swap_columns(canonical, i, n + i - 1)
-        swap_columns(orthogonal, i, n + i - 1)
-        if n % 2 != 0:
-            swap_rows(canonical, n - 1, n + i)
-            swap_columns(canonical, n - 1, n + i)
-            swap_columns(orthogonal, n - 1, n + i)
-
-    # Now we permute so that the upper right block is non-negative
-    for i in range(n):
-        if canonical[i, n + i] < -EQ_TOLERANCE:
-            swap_rows(canonical, i, n + i)
-            swap_columns(canonical, i, n + i)
-            swap_columns(orthogonal, i, n + i)
-
-    # Now we permute so that the nonzero entries are ordered by magnitude
-    # We use insertion sort
-    diagonal = canonical[range(n), range(n, 2 * n)]
-    for i in range(n):
-        # Insert the smallest element from the unsorted part of the list into
-        # index i
-        arg_min = numpy.argmin(diagonal[i:]) + i
-        if arg_min != i:
-            # Permute the upper right block
-            swap_rows(canonical, i, arg_min)
-            swap_columns(canonical, n + i, n + arg_min)
-            swap_columns(orthogonal, n + i, n + arg_min)
-            # Permute the lower left block
-            swap_rows(canonical, n + i, n + arg_min)
-            swap_columns(canonical, i, arg_min)
-            swap_columns(orthogonal, i, arg_min)
-            # Update diagonal
-            swap_rows(diagonal, i, arg_min)
-
-    return canonical, orthogonal.T
+    tridiagonal, transformation = hessenberg(antisymmetric_matrix,
+                                             calc_q=True)
+    superdiagonal = (numpy.diag(tridiagonal, 1) -
+                     numpy.diag(tridiagonal, -1)) / 2.
+    bidiagonal = numpy.zeros((n, n))
+    bidiagonal[range(n), range(n)] = superdiagonal[::2]
+    bidiagonal[range(1, n), range(n - 1)] = -superdiagonal[1::2]
+
+    # With B = U D V^T, U acts on the even and V on the odd indices.
+    # The singular values come in decreasing order, so reverse them
+    left_vectors, singular_values, right_vectors = numpy.linalg.svd(
+            bidiagonal)
+    diagonal = singular_values[::-1]
+    orthogonal = numpy.empty((p, p))
+    orthogonal[:n] = left_vectors[:, ::-1].T.dot(transformation[:, ::2].T)
+    orthogonal[n:] = right_vectors[::-1].dot(transformation[:, 1::2].T)
+
+    canonical = numpy.zeros((p, p))
+    canonical[range(n), range(n, p)] = diagonal
+    canonical[range(n, p), range(n)] = -diagonal
+
+    if debug:
+        if not (numpy.allclose(orthogonal.dot(orthogonal.T), numpy.eye(p)) and
+                numpy.allclose(orthogonal.dot(antisymmetric_matrix).dot(
+                    orthogonal.T), canonical)):
+            raise ValueError('Failed to compute the canonical form.')
+
+    return canonical, orthogonal
 
 
 def swap_rows(M, i, j):
@@ -20,7 +20,8 @@ from openfermion.config import EQ_TOLERANCE
 from openfermion.ops import (FermionOperator,
                              QuadraticHamiltonian,
                              normal_ordered)
-from openfermion.ops._quadratic_hamiltonian import majorana_operator
+from openfermion.ops._quadratic_hamiltonian import (
+        diagonalizing_fermionic_unitary, majorana_operator)
 from openfermion.transforms import get_fermion_operator, get_sparse_operator
 from openfermion.utils import get_ground_state
 
@@ -150,6 +151,55 @@ class QuadraticHamiltoniansTest(unittest.TestCase):
         self.assertTrue(
                 normal_ordered(majorana_op).isclose(fermion_operator))
 
+    def test_diagonalizing_unitary(self):
+        """Test getting the diagonalizing unitary."""
+        # Test the particle-number-conserving case
+        orbital_energies, constant = self.quad_ham_pc.orbital_energies()
+        unitary = self.quad_ham_pc.diagonalizing_unitary()
+        self.assertTrue(numpy.allclose(
+                unitary.T.conj().dot(self.hermitian_mat).dot(unitary),
+                numpy.diag(orbital_energies)))
+
+        # Test the non-particle-number-conserving case
+        majorana_matrix, majorana_constant = self.quad_ham_npc.majorana_form()
+        unitary = self.quad_ham_npc.diagonalizing_unitary()
+        self.assertTrue(numpy.allclose(
+                unitary, diagonalizing_fermionic_unitary(majorana_matrix)))
+
+    def test_diagonalization_cached(self):
+        """Test that results are reused and returned as copies."""
+        majorana_matrix, majorana_constant = self.quad_ham_npc.majorana_form()
+        majorana_matrix[0, 1] += 1.
+        orbital_energies, constant = self.quad_ham_npc.orbital_energies()
+        orbital_energies[0] += 1.
+        unitary = self.quad_ham_npc.diagonalizing_unitary()
+        unitary[0, 0] += 1.
+
+        self.assertFalse(numpy.allclose(
+                majorana_matrix, self.quad_ham_npc.majorana_form()[0]))
+        self.assertFalse(numpy.allclose(
+                orbital_energies, self.quad_ham_npc.orbital_energies()[0]))
+        self.assertFalse(numpy.allclose(
+                unitary, self.quad_ham_npc.diagonalizing_unitary()))
+
+    def test_diagonalization_cache_invalidated(self):
+        """Test that changing the tensors invalidates cached results."""
+        orbital_energies, constant = self.quad_ham_pc.orbital_energies()
+
+        self.quad_ham_pc.add_chemical_potential(1.)
+        shifted_energies, constant = self.quad_ham_pc.orbital_energies()
+        self.assertTrue(numpy.allclose(shifted_energies,
+                                       orbital_energies - 1.))
+
+        self.quad_ham_pc.combined_hermitian_part[:] = numpy.diag(
+                numpy.arange(self.n_qubits))
+        orbital_energies, constant = self.quad_ham_pc.orbital_energies()
+        self.assertTrue(numpy.allclose(orbital_energies,
+                                       numpy.arange(self.n_qubits)))
+        self.assertTrue(numpy.allclose(
+                numpy.abs(self.quad_ham_pc.diagonalizing_unitary()),
+                numpy.eye(self.n_qubits)))
+
 
 class MajoranaOperatorTest(unittest.TestCase):
 
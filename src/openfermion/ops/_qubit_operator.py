@@ -16,6 +16,7 @@ import itertools
 
 import numpy
 
+from openfermion.ops._operator_utils import coefficient_list, sum_terms
 
 EQ_TOLERANCE = 1e-12
 
@@ -88,7 +89,8 @@ class QubitOperator(object):
 
         The init function only allows to initialize one term. Additional terms
         have to be added using += (which is fast) or using + of two
-        QubitOperator objects:
+        QubitOperator objects, or built all at once with
+        QubitOperator.from_terms (which is fastest):
 
         Example:
             .. code-block:: python
@@ -176,6 +178,74 @@ class QubitOperator(object):
         else:
             raise ValueError('term specified incorrectly.')
 
+    @staticmethod
+    def from_terms(terms, coefficients=None, validate=True):
+        """Build a QubitOperator from many terms at once.
+
+        This gives the same result as adding QubitOperator(term,
+        coefficient) for every pair with +=, but all terms are checked
+        in one vectorized pass and stored without intermediate operators.
+
+        Example:
+            .. code-block:: python
+
+                ham = QubitOperator.from_terms(
+                    [((0, 'X'), (5, 'X')), ((0, 'Z'),)], [0.5, 0.3])
+
+        Args:
+            terms: An iterable of terms, each a tuple of (qubit, action)
+                tuples as accepted by the constructor.
+            coefficients: An iterable or array with the coefficient of each
+                term. Default is 1.0 for every term.
+            validate(bool): Whether to check the terms and coefficients and
+                sort the local operators of each term by qubit. Disable only
+                for input which is known to be valid and sorted.
+
+        Returns:
+            operator (QubitOperator)
+
+        Raises:
+            QubitOperatorError: Invalid qubit number.
+            ValueError: Invalid action, term or coefficients.
+        """
+        terms = list(terms)
+        coefficients = coefficient_list(coefficients, len(terms), validate)
+
+        local_operators = [local_operator for term in terms
+                           for local_operator in term] if validate else ()
+        if local_operators:
+            if not all(isinstance(local_operator, tuple) and
+                       len(local_operator) == 2 for
+                       local_operator in local_operators):
+                raise ValueError("term specified incorrectly.")
+            qubits = numpy.array([qubit for qubit, action in
+                                  local_operators])
+            actions = numpy.array([action for qubit, action in
+                                   local_operators], dtype=object)
+            if not numpy.all((actions == 'X') | (actions == 'Y') |
+                             (actions == 'Z')):
+                raise ValueError("Invalid action provided: must be "
+                                 "string 'X', 'Y', or 'Z'.")
+            if not (qubits.dtype.kind in 'iu' and numpy.all(qubits >= 0)):
+                raise QubitOperatorError("Invalid qubit number "
+                                         "provided to QubitTerm: "
+                                         "must be a non-negative "
+                                         "int.")
+
+            # Sort the terms whose qubits are not in increasing order.
+            ends = numpy.cumsum([len(term) for term in terms])
+            descents = numpy.flatnonzero(numpy.diff(qubits) < 0) + 1
+            descents = descents[~numpy.isin(descents, ends)]
+            for index in numpy.unique(
+                    numpy.searchsorted(ends, descents, side='right')):
+                terms[index] = tuple(sorted(
+                    terms[index], key=lambda loc_operator: loc_operator[0]))
+
+        # Like +=, only drop the terms whose coefficients sum to zero.
+        operator = QubitOperator()
+        operator.terms = sum_terms(terms, coefficients, 0.)
+        return operator
+
     def compress(self, abs_tol=1e-12):
         """
         Eliminates all terms with coefficients close to zero and removes
@@ -109,6 +109,52 @@ def test_init_bad_qubit_num():
         qubit_op = QubitOperator('X-1')
 
 
+def test_from_terms():
+    terms = [((0, 'X'), (5, 'Y')), (), ((0, 'X'), (5, 'Y')), ((2, 'Z'),)]
+    qubit_op = QubitOperator.from_terms(terms, [0.5, 2., 0.25j, 1.])
+    correct = (QubitOperator('X0 Y5', 0.5 + 0.25j) + QubitOperator('', 2.) +
+               QubitOperator('Z2'))
+    assert qubit_op.terms == correct.terms
+
+
+def test_from_terms_sorts_qubits():
+    qubit_op = QubitOperator.from_terms(
+        [((3, 'X'), (1, 'Z')), ((0, 'Y'), (2, 'X')), ((4, 'Z'), (0, 'X'))])
+    assert qubit_op.isclose(QubitOperator('Z1 X3') + QubitOperator('Y0 X2') +
+                            QubitOperator('X0 Z4'))
+
+
+def test_from_terms_cancellation():
+    qubit_op = QubitOperator.from_terms(
+        [((1, 'X'),), ((1, 'X'),), ((2, 'Y'),)], numpy.array([1., -1., 3.]))
+    assert qubit_op.terms == {((2, 'Y'),): 3.}
+
+
+def test_from_terms_keeps_small_sums():
+    terms = [((0, 'X'),), ((0, 'X'),)]
+    coefficients = [1., -1. + 1e-13]
+    qubit_op = QubitOperator.from_terms(terms, coefficients)
+    correct = QubitOperator('X0', 1.)
+    correct += QubitOperator('X0', -1. + 1e-13)
+    assert qubit_op.terms == correct.terms
+    assert len(qubit_op.terms) == 1
+
+
+@pytest.mark.parametrize("terms, error", [
+    ([((1, 'Q'),)], ValueError),
+    ([((-1, 'X'),)], QubitOperatorError),
+    ([(('1', 'X'),)], QubitOperatorError),
+    ([((0, 1, 'X'),)], ValueError)])
+def test_from_terms_bad_term(terms, error):
+    with pytest.raises(error):
+        QubitOperator.from_terms(terms)
+
+
+def test_from_terms_bad_coefficients():
+    with pytest.raises(ValueError):
+        QubitOperator.from_terms([((1, 'X'),)], [1., 2.])
+
+
 def test_isclose_abs_tol():
     a = QubitOperator('X0', -1.)
     b = QubitOperator('X0', -1.05)
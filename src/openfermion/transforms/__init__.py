@@ -19,5 +19,7 @@ from ._conversion import (get_fermion_operator,
                           get_molecular_data,
                           get_sparse_operator,
                           get_sparse_polynomial_tensor)
+from ._encoding import encode_fermion_operator
 from ._jordan_wigner import jordan_wigner
+from ._operator_stream import transform_operator_stream
 from ._reverse_jordan_wigner import reverse_jordan_wigner
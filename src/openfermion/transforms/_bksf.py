@@ -17,6 +17,7 @@ import networkx
 import numpy
 
 from openfermion.ops import InteractionOperator, QubitOperator
+from openfermion.ops._polynomial_tensor import _nonzero_indices
 from openfermion.utils import count_qubits
 
 
@@ -77,46 +78,59 @@ def bravyi_kitaev_fast_interaction_op(iop):
     Returns:
         qubit_operator: An instance of the QubitOperator class.
     """
-    n_qubits = count_qubits(iop)
-
     # Initialize qubit operator as constant.
-    qubit_operator = QubitOperator((), iop.constant)
+    terms = [()]
+    coefficients = [iop.constant]
     edge_matrix = bravyi_kitaev_fast_edge_matrix(iop)
     edge_matrix_indices = numpy.array(numpy.nonzero(numpy.triu(edge_matrix) -
                                       numpy.diag(numpy.diag(edge_matrix))))
-    # Loop through all indices.
-    for p in range(n_qubits):
-        for q in range(n_qubits):
-
-            # Handle one-body terms.
-            coefficient = complex(iop[(p, 1), (q, 0)])
-            if coefficient and p >= q:
-                qubit_operator += (coefficient *
-                                   one_body(edge_matrix_indices, p, q))
-
-            # Keep looping for the two-body terms.
-            for r in range(n_qubits):
-                for s in range(n_qubits):
-                    coefficient = complex(iop[(p, 1), (q, 1), (r, 0), (s, 0)])
-
-                    # Skip zero terms.
-                    if (not coefficient) or (p == q) or (r == s):
-                        continue
-
-                    # Identify and skip one of the complex conjugates.
-                    if [p, q, r, s] != [s, r, q, p]:
-                        if len(set([p, q, r, s])) == 4:
-                            if min(r, s) < min(p, q):
-                                continue
-                        elif p != r and q < p:
-                                continue
-
-                    # Handle the two-body terms.
-                    transformed_term = two_body(edge_matrix_indices,
-                                                p, q, r, s)
-                    transformed_term *= coefficient
-                    qubit_operator += transformed_term
-    return qubit_operator
+    edge_operators = _EdgeOperators(edge_matrix_indices)
+
+    # Collect the transformed terms.
+    def add_terms(transformed_term, coefficient):
+        for term, term_coefficient in transformed_term.terms.items():
+            terms.append(term)
+            coefficients.append(coefficient * term_coefficient)
+
+    # Handle one-body terms.
+    pairs = _one_body_indices(iop)
+    for (p, q), coefficient in zip(pairs.tolist(), _coefficients(
+            iop.one_body_tensor, pairs)):
+        add_terms(_one_body(edge_operators, p, q), coefficient)
+
+    # Handle the two-body terms.
+    quads = _two_body_indices(iop)
+    for (p, q, r, s), coefficient in zip(quads.tolist(), _coefficients(
+            iop.two_body_tensor, quads)):
+        add_terms(_two_body(edge_operators, p, q, r, s), coefficient)
+
+    return QubitOperator.from_terms(terms, coefficients, validate=False)
+
+
+def _coefficients(tensor, indices):
+    """Return the entries of tensor at the rows of indices as complex."""
+    return numpy.asarray(tensor[tuple(indices.T)], dtype=complex).tolist()
+
+
+def _one_body_indices(iop):
+    """Return the nonzero one-body index pairs p >= q."""
+    pairs = _nonzero_indices(iop.one_body_tensor)
+    return pairs[pairs[:, 0] >= pairs[:, 1]]
+
+
+def _two_body_indices(iop):
+    """Return the nonzero two-body index quads with p != q and r != s,
+    keeping only one term of each pair of complex conjugates."""
+    quads = _nonzero_indices(iop.two_body_tensor)
+    p, q, r, s = quads.T
+    n_unique = 4 - numpy.sum([p == r, p == s, q == r, q == s], axis=0)
+
+    # Identify and skip one of the complex conjugates.
+    self_conjugate = (p == s) & (q == r)
+    conjugate = numpy.where(n_unique == 4,
+                            numpy.minimum(r, s) < numpy.minimum(p, q),
+                            (p != r) & (q < p))
+    return quads[(p != q) & (r != s) & (self_conjugate | ~conjugate)]
 
 
 def bravyi_kitaev_fast_edge_matrix(iop, n_qubits=None):
@@ -135,74 +149,30 @@ def bravyi_kitaev_fast_edge_matrix(iop, n_qubits=None):
     """
     n_qubits = count_qubits(iop)
     edge_matrix = 1j*numpy.zeros((n_qubits, n_qubits))
-    # Loop through all indices.
-    for p in range(n_qubits):
-        for q in range(n_qubits):
-
-            # Handle one-body terms.
-            coefficient = complex(iop[(p, 1), (q, 0)])
-            if coefficient and p >= q:
-                edge_matrix[p, q] = bool(complex(iop[(p, 1), (q, 0)]))
-
-            # Keep looping for the two-body terms.
-            for r in range(n_qubits):
-                for s in range(n_qubits):
-                    coefficient2 = complex(iop[(p, 1), (q, 1), (r, 0), (s, 0)])
-
-                    # Skip zero terms.
-                    if (not coefficient2) or (p == q) or (r == s):
-                        continue
-
-                    # Identify and skip one of the complex conjugates.
-                    if [p, q, r, s] != [s, r, q, p]:
-                        if len(set([p, q, r, s])) == 4:
-                            if min(r, s) < min(p, q):
-                                continue
-                        elif p != r and q < p:
-                                continue
-
-                    # Handle case of four unique indices.
-                    if len(set([p, q, r, s])) == 4:
-
-                        if coefficient2 and p >= q:
-                            edge_matrix[p, q] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-                            a, b = sorted([r, s])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-
-                    # Handle case of three unique indices.
-                    elif len(set([p, q, r, s])) == 3:
-
-                        # Identify equal tensor factors.
-                        if p == r:
-                            a, b = sorted([q, s])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-                        elif p == s:
-                            a, b = sorted([q, r])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-                        elif q == r:
-                            a, b = sorted([p, s])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-                        elif q == s:
-                            a, b = sorted([p, r])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-
-                    # Handle case of two unique indices.
-                    elif len(set([p, q, r, s])) == 2:
-                        if p == s:
-                            a, b = sorted([p, q])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
-
-                        else:
-                            a, b = sorted([p, q])
-                            edge_matrix[b, a] = bool(complex(
-                                iop[(p, 1), (q, 1), (r, 0), (s, 0)]))
+
+    # Handle one-body terms.
+    p, q = _one_body_indices(iop).T
+    edge_matrix[p, q] = 1.
+
+    # Handle the two-body terms.
+    p, q, r, s = _two_body_indices(iop).T
+    n_unique = 4 - numpy.sum([p == r, p == s, q == r, q == s], axis=0)
+
+    # Handle case of four unique indices.
+    four = (n_unique == 4) & (p > q)
+    edge_matrix[p[four], q[four]] = 1.
+    edge_matrix[numpy.maximum(r, s)[four], numpy.minimum(r, s)[four]] = 1.
+
+    # Handle case of three unique indices. Identify equal tensor factors.
+    three = n_unique == 3
+    a = numpy.where((p == r) | (p == s), q, p)
+    b = numpy.where(p == r, s, numpy.where(p == s, r,
+                                           numpy.where(q == r, s, r)))
+    edge_matrix[numpy.maximum(a, b)[three], numpy.minimum(a, b)[three]] = 1.
+
+    # Handle case of two unique indices.
+    two = n_unique == 2
+    edge_matrix[numpy.maximum(p, q)[two], numpy.minimum(p, q)[two]] = 1.
 
     return edge_matrix.transpose()
 
@@ -220,18 +190,23 @@ def one_body(edge_matrix_indices, p, q):
     Return:
         An instance of QubitOperator()
     """
+    return _one_body(_EdgeOperators(edge_matrix_indices), p, q)
+
+
+def _one_body(edge_operators, p, q):
+    """Map a^\dagger_p a_q + a^\dagger_q a_p using cached edge operators."""
     # Handle off-diagonal terms.
     qubit_operator = QubitOperator()
     if p != q:
         a, b = sorted([p, q])
-        B_a = edge_operator_b(edge_matrix_indices, a)
-        B_b = edge_operator_b(edge_matrix_indices, b)
-        A_ab = edge_operator_aij(edge_matrix_indices, a, b)
+        B_a = edge_operators.b(a)
+        B_b = edge_operators.b(b)
+        A_ab = edge_operators.aij(a, b)
         qubit_operator += (-1j/2.) * (A_ab * B_b + B_a * A_ab)
 
     # Handle diagonal terms.
     else:
-        B_p = edge_operator_b(edge_matrix_indices, p)
+        B_p = edge_operators.b(p)
         qubit_operator += (QubitOperator((), 1) - B_p) / 2.
 
     return qubit_operator
@@ -250,17 +225,23 @@ def two_body(edge_matrix_indices, p, q, r, s):
     Return:
         An instance of QubitOperator()
     """
+    return _two_body(_EdgeOperators(edge_matrix_indices), p, q, r, s)
+
+
+def _two_body(edge_operators, p, q, r, s):
+    """Map a^\dagger_p a^\dagger_q a_r a_s + h.c. using cached edge
+    operators."""
     # Initialize qubit operator.
     qubit_operator = QubitOperator()
 
     # Handle case of four unique indices.
     if len(set([p, q, r, s])) == 4:
-        B_p = edge_operator_b(edge_matrix_indices, p)
-        B_q = edge_operator_b(edge_matrix_indices, q)
-        B_r = edge_operator_b(edge_matrix_indices, r)
-        B_s = edge_operator_b(edge_matrix_indices, s)
-        A_pq = edge_operator_aij(edge_matrix_indices, p, q)
-        A_rs = edge_operator_aij(edge_matrix_indices, r, s)
+        B_p = edge_operators.b(p)
+        B_q = edge_operators.b(q)
+        B_r = edge_operators.b(r)
+        B_s = edge_operators.b(s)
+        A_pq = edge_operators.aij(p, q)
+        A_rs = edge_operators.aij(r, s)
         qubit_operator += (1/8.)*A_pq*A_rs*(-1*QubitOperator(()) - B_p*B_q +
                                             B_p*B_r + B_p*B_s + B_q*B_r +
                                             B_q*B_s - B_r*B_s +
@@ -272,34 +253,34 @@ def two_body(edge_matrix_indices, p, q, r, s):
 
         # Identify equal tensor factors.
         if p == r:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
-            B_s = edge_operator_b(edge_matrix_indices, s)
-            A_qs = edge_operator_aij(edge_matrix_indices, q, s)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
+            B_s = edge_operators.b(s)
+            A_qs = edge_operators.aij(q, s)
             qubit_operator += (1j/2.)*(A_qs*B_s + B_q*A_qs)*(
                                         QubitOperator(()) - B_p)/2.
 
         elif p == s:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
-            B_r = edge_operator_b(edge_matrix_indices, r)
-            A_qr = edge_operator_aij(edge_matrix_indices, q, r)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
+            B_r = edge_operators.b(r)
+            A_qr = edge_operators.aij(q, r)
             qubit_operator += (-1j/2.)*(A_qr*B_r +
                                         B_q*A_qr)*(QubitOperator(()) - B_p)/2.
 
         elif q == r:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
-            B_s = edge_operator_b(edge_matrix_indices, s)
-            A_ps = edge_operator_aij(edge_matrix_indices, p, s)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
+            B_s = edge_operators.b(s)
+            A_ps = edge_operators.aij(p, s)
             qubit_operator += (-1j/2.)*(A_ps*B_s +
                                         B_p*A_ps)*(QubitOperator(()) - B_q)/2.
 
         elif q == s:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
-            B_r = edge_operator_b(edge_matrix_indices, r)
-            A_pr = edge_operator_aij(edge_matrix_indices, p, r)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
+            B_r = edge_operators.b(r)
+            A_pr = edge_operators.aij(p, r)
             qubit_operator += (1j/2.)*(A_pr*B_r +
                                        B_p*A_pr)*(QubitOperator(()) - B_q)/2.
 
@@ -308,14 +289,14 @@ def two_body(edge_matrix_indices, p, q, r, s):
 
         # Get coefficient.
         if p == s:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
             qubit_operator += (QubitOperator((), 1) -
                                B_p)*(QubitOperator((), 1) - B_q)/4.
 
         else:
-            B_p = edge_operator_b(edge_matrix_indices, p)
-            B_q = edge_operator_b(edge_matrix_indices, q)
+            B_p = edge_operators.b(p)
+            B_q = edge_operators.b(q)
             qubit_operator += -1*(QubitOperator((), 1) -
                                   B_p)*(QubitOperator((), 1) - B_q)/4.
 
@@ -333,15 +314,9 @@ def edge_operator_b(edge_matrix_indices, i):
     Returns:
         An instance of QubitOperator
     """
-    B_i = QubitOperator()
-    qubit_position_matrix = numpy.array(numpy.where(edge_matrix_indices == i))
-    qubit_position = qubit_position_matrix[1][:]
-    qubit_position = numpy.sort(qubit_position)
-    operator = tuple()
-    for d1 in qubit_position:
-        operator += ((int(d1), 'Z'),)
-    B_i += QubitOperator(operator, 1)
-    return B_i
+    qubit_position = numpy.sort(numpy.nonzero(edge_matrix_indices == i)[1])
+    operator = tuple((int(d1), 'Z') for d1 in qubit_position)
+    return QubitOperator(operator, 1)
 
 
 def edge_operator_aij(edge_matrix_indices, i, j):
@@ -355,30 +330,46 @@ def edge_operator_aij(edge_matrix_indices, i, j):
     Returns:
         An instance of QubitOperator
     """
-    a_ij = QubitOperator()
-    operator = tuple()
-    position_ij = -1
-    qubit_position_i = numpy.array(numpy.where(edge_matrix_indices == i))
-    for edge_index in range(numpy.size(edge_matrix_indices[0, :])):
-        if set((i, j)) == set(edge_matrix_indices[:, edge_index]):
-            position_ij = edge_index
-    operator += ((int(position_ij), 'X'),)
-
-    for edge_index in range(numpy.size(qubit_position_i[0, :])):
-        if edge_matrix_indices[int(not(qubit_position_i[0, edge_index]))][
-                qubit_position_i[1, edge_index]] < j:
-            operator += ((int(qubit_position_i[1, edge_index]), 'Z'),)
-    qubit_position_j = numpy.array(numpy.where(edge_matrix_indices == j))
-    for edge_index in range(numpy.size(qubit_position_j[0, :])):
-        if edge_matrix_indices[int(not(qubit_position_j[0, edge_index]))][
-                              qubit_position_j[1, edge_index]] < i:
-            operator += ((int(qubit_position_j[1, edge_index]), 'Z'),)
-    a_ij += QubitOperator(operator, 1)
+    # Find the edge between i and j.
+    start_vertices, end_vertices = edge_matrix_indices
+    edge_ij = numpy.flatnonzero(((start_vertices == i) & (end_vertices == j)) |
+                                ((start_vertices == j) & (end_vertices == i)))
+    position_ij = edge_ij[-1] if edge_ij.size else -1
+    operator = ((int(position_ij), 'X'),)
+
+    # Add Z on the edges from i to vertices below j and from j to vertices
+    # below i.
+    for vertex, bound in ((i, j), (j, i)):
+        endpoint, edge_index = numpy.nonzero(edge_matrix_indices == vertex)
+        other_vertex = edge_matrix_indices[1 - endpoint, edge_index]
+        operator += tuple((int(d1), 'Z') for
+                          d1 in edge_index[other_vertex < bound])
+    a_ij = QubitOperator(operator, 1)
     if j < i:
         a_ij = -1*a_ij
     return a_ij
 
 
+class _EdgeOperators(object):
+    """Cache of the edge operators B_i and A_ij of a fixed edge graph."""
+
+    def __init__(self, edge_matrix_indices):
+        self.edge_matrix_indices = edge_matrix_indices
+        self._b = {}
+        self._aij = {}
+
+    def b(self, i):
+        if i not in self._b:
+            self._b[i] = edge_operator_b(self.edge_matrix_indices, i)
+        return self._b[i]
+
+    def aij(self, i, j):
+        if (i, j) not in self._aij:
+            self._aij[i, j] = edge_operator_aij(self.edge_matrix_indices,
+                                                i, j)
+        return self._aij[i, j]
+
+
 def vacuum_operator(edge_matrix_indices):
     """Use the stabilizers to find the vacuum state in bravyi_kitaev_fast.
 
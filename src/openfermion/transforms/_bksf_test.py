@@ -16,10 +16,11 @@ import os
 import unittest
 
 from openfermion.config import (THIS_DIRECTORY)
-from openfermion.hamiltonians import MolecularData
+from openfermion.hamiltonians import fermi_hubbard, MolecularData
 from openfermion.ops import (FermionOperator, InteractionOperator,
                              normal_ordered, QubitOperator)
 from openfermion.transforms._conversion import (get_fermion_operator,
+                                                get_interaction_operator,
                                                 get_sparse_operator)
 from openfermion.transforms._jordan_wigner import (jordan_wigner,
                                                    jordan_wigner_one_body)
@@ -295,5 +296,60 @@ class bravyi_kitaev_fastTransformTest(unittest.TestCase):
         self.assertEqual(evensector_H, 2**(n_qubits - 1))
         self.assertEqual(evensector_n, 2**(n_qubits - 1))
 
+    def test_bravyi_kitaev_fast_edge_matrix(self):
+        # one term of each kind: one-body, and two-body with four, three
+        # and two unique indices.
+        one_body = numpy.zeros((6, 6))
+        one_body[2, 1] = one_body[1, 2] = .3
+        two_body = numpy.zeros((6, 6, 6, 6))
+        two_body[3, 0, 4, 5] = two_body[5, 4, 0, 3] = .2
+        two_body[1, 4, 1, 3] = two_body[3, 1, 4, 1] = .1
+        two_body[0, 5, 5, 0] = .4
+        two_body[2, 3, 2, 3] = .5
+        iop = InteractionOperator(0., one_body, two_body)
+        edge_matrix = _bksf.bravyi_kitaev_fast_edge_matrix(iop)
+
+        expected = numpy.zeros((6, 6))
+        for a, b in [(1, 2), (0, 3), (4, 5), (3, 4), (0, 5), (2, 3)]:
+            expected[a, b] = 1.
+        self.assertTrue(numpy.array_equal(edge_matrix, expected))
+
+    def test_bravyi_kitaev_fast_hubbard(self):
+        # the density-density terms of the Hubbard model are normal ordered
+        # as p^ q^ p q and must contribute edges.
+        hubbard = normal_ordered(fermi_hubbard(2, 1, 1., 4.))
+        n_qubits = count_qubits(hubbard)
+        bravyi_kitaev_fast_H = _bksf.bravyi_kitaev_fast(
+            get_interaction_operator(hubbard))
+        jw_H = jordan_wigner(hubbard)
+        bravyi_kitaev_fast_H_eig = eigenspectrum(bravyi_kitaev_fast_H)
+        jw_H_eig = eigenspectrum(jw_H)
+        bravyi_kitaev_fast_H_eig = bravyi_kitaev_fast_H_eig.round(5)
+        jw_H_eig = jw_H_eig.round(5)
+        evensector = 0
+        for i in range(numpy.size(jw_H_eig)):
+            if bool(numpy.size(numpy.where(jw_H_eig[i] ==
+                                           bravyi_kitaev_fast_H_eig))):
+                evensector += 1
+        self.assertEqual(evensector, 2**(n_qubits - 1))
+
+    def test_bravyi_kitaev_fast_edge_operators_cached(self):
+        edge_matrix = _bksf.bravyi_kitaev_fast_edge_matrix(
+            self.molecular_hamiltonian)
+        edge_matrix_indices = numpy.array(numpy.nonzero(
+            numpy.triu(edge_matrix) - numpy.diag(numpy.diag(edge_matrix))))
+        edge_operators = _bksf._EdgeOperators(edge_matrix_indices)
+        for i in range(4):
+            self.assertIs(edge_operators.b(i), edge_operators.b(i))
+            self.assertTrue(edge_operators.b(i).isclose(
+                _bksf.edge_operator_b(edge_matrix_indices, i)))
+            for j in range(4):
+                if i == j:
+                    continue
+                self.assertIs(edge_operators.aij(i, j),
+                              edge_operators.aij(i, j))
+                self.assertTrue(edge_operators.aij(i, j).isclose(
+                    _bksf.edge_operator_aij(edge_matrix_indices, i, j)))
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,7 @@
 from __future__ import absolute_import
 
 from openfermion.ops import QubitOperator
+from openfermion.transforms._encoding import encode_fermion_operator
 from openfermion.transforms._fenwick_tree import FenwickTree
 
 
@@ -40,102 +41,41 @@ def bravyi_kitaev(operator, n_qubits=None):
     if n_qubits < count_qubits(operator):
         raise ValueError('Invalid number of qubits specified.')
 
-    # Build the Fenwick tree.
-    fenwick_tree = FenwickTree(n_qubits)
+    # Map through the images of the Majoranas.
+    return encode_fermion_operator(
+        operator, _bravyi_kitaev_majoranas(FenwickTree(n_qubits), n_qubits))
 
-    # Compute transformed operator.
-    transformed_terms = (
-        _transform_operator_term(term=term,
-                                 coefficient=operator.terms[term],
-                                 fenwick_tree=fenwick_tree)
-        for term in operator.terms
-    )
-    return inline_sum(seed=QubitOperator(), summands=transformed_terms)
 
-
-def _transform_operator_term(term, coefficient, fenwick_tree):
+def _bravyi_kitaev_majoranas(fenwick_tree, n_qubits):
     """
     Args:
-        term (list[tuple[int, int]]):
-            A list of (mode, raising-vs-lowering) ladder operator terms.
-        coefficient (float):
         fenwick_tree (FenwickTree):
+        n_qubits (int):
     Returns:
-        QubitOperator:
-    """
-
-    # Build the Bravyi-Kitaev transformed operators.
-    transformed_ladder_ops = (
-        _transform_ladder_operator(ladder_operator, fenwick_tree)
-        for ladder_operator in term
-    )
-    return inline_product(seed=QubitOperator((), coefficient),
-                          factors=transformed_ladder_ops)
-
-
-def _transform_ladder_operator(ladder_operator, fenwick_tree):
-    """
-    Args:
-        ladder_operator (tuple[int, int]):
-        fenwick_tree (FenwickTree):
-    Returns:
-        QubitOperator:
-    """
-    index = ladder_operator[0]
-
-    # Parity set. Set of nodes to apply Z to.
-    parity_set = [node.index for node in
-                  fenwick_tree.get_parity_set(index)]
-
-    # Update set. Set of ancestors to apply X to.
-    ancestors = [node.index for node in
-                 fenwick_tree.get_update_set(index)]
-
-    # The C(j) set.
-    ancestor_children = [node.index for node in
-                         fenwick_tree.get_remainder_set(index)]
-
-    # Switch between lowering/raising operators.
-    d_coefficient = -.5j if ladder_operator[1] else .5j
-
-    # The fermion lowering operator is given by
-    # a = (c+id)/2 where c, d are the majoranas.
-    d_majorana_component = QubitOperator(
-        (((ladder_operator[0], 'Y'),) +
-         tuple((index, 'Z') for index in ancestor_children) +
-         tuple((index, 'X') for index in ancestors)),
-        d_coefficient)
-
-    c_majorana_component = QubitOperator(
-        (((ladder_operator[0], 'X'),) +
-         tuple((index, 'Z') for index in parity_set) +
-         tuple((index, 'X') for index in ancestors)),
-        0.5)
-
-    return c_majorana_component + d_majorana_component
-
-
-def inline_sum(seed, summands):
-    """Computes a sum, using the __iadd__ operator.
-    Args:
-        seed (T): The starting total. The zero value.
-        summands (iterable[T]): Values to add (with +=) into the total.
-    Returns:
-        T: The result of adding all the factors into the zero value.
-    """
-    for r in summands:
-        seed += r
-    return seed
-
-
-def inline_product(seed, factors):
-    """Computes a product, using the __imul__ operator.
-    Args:
-        seed (T): The starting total. The unit value.
-        factors (iterable[T]): Values to multiply (with *=) into the total.
-    Returns:
-        T: The result of multiplying all the factors into the unit value.
+        list[QubitOperator]: The images of the Majoranas c_j and d_j, where
+            the fermion lowering operator is given by a_j = (c_j + i d_j)/2.
     """
-    for r in factors:
-        seed *= r
-    return seed
+    majorana_images = []
+    for index in range(n_qubits):
+
+        # Parity set. Set of nodes to apply Z to.
+        parity_set = [node.index for node in
+                      fenwick_tree.get_parity_set(index)]
+
+        # Update set. Set of ancestors to apply X to.
+        ancestors = [node.index for node in
+                     fenwick_tree.get_update_set(index)]
+
+        # The C(j) set.
+        ancestor_children = [node.index for node in
+                             fenwick_tree.get_remainder_set(index)]
+
+        majorana_images.append(QubitOperator(
+            ((index, 'X'),) +
+            tuple((node, 'Z') for node in parity_set) +
+            tuple((node, 'X') for node in ancestors)))
+        majorana_images.append(QubitOperator(
+            ((index, 'Y'),) +
+            tuple((node, 'Z') for node in ancestor_children) +
+            tuple((node, 'X') for node in ancestors)))
+    return majorana_images
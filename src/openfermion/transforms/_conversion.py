@@ -13,9 +13,11 @@
 """Transformations acting on operators and RDMs."""
 from __future__ import absolute_import
 
+import collections
 import itertools
 
 import numpy
+import scipy.sparse
 from future.utils import iteritems
 
 from openfermion.config import EQ_TOLERANCE
@@ -26,8 +28,10 @@ from openfermion.ops import (FermionOperator,
                              InteractionRDM,
                              PolynomialTensor,
                              QuadraticHamiltonian,
-                             QubitOperator)
+                             QubitOperator,
+                             SparseTensor)
 from openfermion.ops._interaction_operator import InteractionOperatorError
+from openfermion.ops._polynomial_tensor import _nonzero_indices
 from openfermion.ops._quadratic_hamiltonian import QuadraticHamiltonianError
 from openfermion.utils import (count_qubits,
                                jordan_wigner_sparse,
@@ -52,37 +56,103 @@ def get_sparse_polynomial_tensor(polynomial_tensor):
     return sparse_operator
 
 
-def get_interaction_rdm(qubit_operator, n_qubits=None):
-    """Build an InteractionRDM from measured qubit operators.
+# Maps from RDM elements to Pauli expectations, keyed by number of qubits.
+# Each map has of order n_qubits ** 4 entries, so only the most recently
+# used ones are kept.
+_INTERACTION_RDM_MAPS = collections.OrderedDict()
+_MAX_INTERACTION_RDM_MAPS = 4
 
-    Returns: An InteractionRDM object.
+
+def _interaction_rdm_map(n_qubits):
+    """Return the linear map from Pauli expectations to RDM elements.
+
+    The maps for the last _MAX_INTERACTION_RDM_MAPS numbers of qubits used
+    are cached.
+    Jordan-Wigner transforms are computed only for the two-body elements
+    [i, j, k, l] with i > j, k > l and (i, j) <= (k, l). The other elements
+    follow from antisymmetry and Hermitian conjugation.
+
+    Returns:
+        rdm_map: A sparse matrix with a row for every one-RDM element and
+            then every two-RDM element, in C order, and a column for every
+            Pauli string.
+        pauli_columns(dict): The column of each Pauli string.
     """
+    if n_qubits in _INTERACTION_RDM_MAPS:
+        # Reinsert to mark the map as most recently used.
+        _INTERACTION_RDM_MAPS[n_qubits] = _INTERACTION_RDM_MAPS.pop(n_qubits)
+        return _INTERACTION_RDM_MAPS[n_qubits]
+
     # Avoid circular import.
     from openfermion.transforms import jordan_wigner
-    if n_qubits is None:
-        n_qubits = count_qubits(qubit_operator)
-    one_rdm = numpy.zeros((n_qubits,) * 2, dtype=complex)
-    two_rdm = numpy.zeros((n_qubits,) * 4, dtype=complex)
+    pauli_columns = {}
+    rows, columns, values = [], [], []
+
+    def add_entries(term, related_rows):
+        transformed_operator = jordan_wigner(FermionOperator(term))
+        for pauli_term, coefficient in iteritems(transformed_operator.terms):
+            column = pauli_columns.setdefault(pauli_term, len(pauli_columns))
+            for row, sign, conjugate in related_rows:
+                rows.append(row)
+                columns.append(column)
+                values.append(sign * (coefficient.conjugate() if conjugate
+                                      else coefficient))
 
     # One-RDM.
     for i, j in itertools.product(range(n_qubits), repeat=2):
-        transformed_operator = jordan_wigner(FermionOperator(((i, 1), (j, 0))))
-        for term, coefficient in iteritems(transformed_operator.terms):
-            if term in qubit_operator.terms:
-                one_rdm[i, j] += coefficient * qubit_operator.terms[term]
+        if i <= j:
+            related_rows = [(i * n_qubits + j, 1, False)]
+            if i != j:
+                related_rows.append((j * n_qubits + i, 1, True))
+            add_entries(((i, 1), (j, 0)), related_rows)
 
     # Two-RDM.
-    for i, j, k, l in itertools.product(range(n_qubits), repeat=4):
-        transformed_operator = jordan_wigner(FermionOperator(((i, 1), (j, 1),
-                                                              (k, 0), (l, 0))))
-        for term, coefficient in iteritems(transformed_operator.terms):
-            if term in qubit_operator.terms:
-                two_rdm[i, j, k, l] += coefficient * qubit_operator.terms[term]
+    def two_body_rows(i, j, k, l, conjugate):
+        return [(n_qubits ** 2 + numpy.ravel_multi_index(
+                     index, (n_qubits,) * 4), sign, conjugate) for
+                index, sign in (((i, j, k, l), 1), ((j, i, k, l), -1),
+                                ((i, j, l, k), -1), ((j, i, l, k), 1))]
+
+    pairs = [(i, j) for i, j in itertools.product(range(n_qubits), repeat=2)
+             if i > j]
+    for (i, j), (k, l) in itertools.combinations_with_replacement(pairs, 2):
+        related_rows = two_body_rows(i, j, k, l, False)
+        if (i, j) != (k, l):
+            related_rows += two_body_rows(k, l, i, j, True)
+        add_entries(((i, 1), (j, 1), (k, 0), (l, 0)), related_rows)
+
+    rdm_map = scipy.sparse.csr_matrix(
+        (values, (rows, columns)),
+        shape=(n_qubits ** 2 + n_qubits ** 4, len(pauli_columns)))
+    _INTERACTION_RDM_MAPS[n_qubits] = rdm_map, pauli_columns
+    if len(_INTERACTION_RDM_MAPS) > _MAX_INTERACTION_RDM_MAPS:
+        _INTERACTION_RDM_MAPS.popitem(last=False)
+    return rdm_map, pauli_columns
+
+
+def get_interaction_rdm(qubit_operator, n_qubits=None):
+    """Build an InteractionRDM from measured qubit operators.
 
+    Returns: An InteractionRDM object.
+    """
+    if n_qubits is None:
+        n_qubits = count_qubits(qubit_operator)
+    rdm_map, pauli_columns = _interaction_rdm_map(n_qubits)
+
+    # Collect the measured expectations of the Pauli strings in the map.
+    expectations = numpy.zeros(rdm_map.shape[1], dtype=complex)
+    for term, expectation in iteritems(qubit_operator.terms):
+        column = pauli_columns.get(term)
+        if column is not None:
+            expectations[column] = expectation
+
+    rdm = rdm_map.dot(expectations)
+    one_rdm = rdm[:n_qubits ** 2].reshape((n_qubits,) * 2)
+    two_rdm = rdm[n_qubits ** 2:].reshape((n_qubits,) * 4)
     return InteractionRDM(one_rdm, two_rdm)
 
 
-def get_interaction_operator(fermion_operator, n_qubits=None):
+def get_interaction_operator(fermion_operator, n_qubits=None, sparse=False):
     """Convert a 2-body fermionic operator to InteractionOperator.
 
     This function should only be called on fermionic operators which
@@ -90,6 +160,14 @@ def get_interaction_operator(fermion_operator, n_qubits=None):
     terms. The one-body terms are stored in a matrix, one_body[p, q], and
     the two-body terms are stored in a tensor, two_body[p, q, r, s].
 
+    Args:
+        fermion_operator(FermionOperator): The operator to convert.
+        n_qubits(int): Number of qubits. Default is the number of qubits
+            the operator acts on.
+        sparse(bool): Whether to store the tensors as SparseTensors holding
+            only the nonzero coefficients. Use this for operators on many
+            modes with few terms, such as lattice Hamiltonians.
+
     Returns:
        interaction_operator: An instance of the InteractionOperator class.
 
@@ -110,52 +188,111 @@ def get_interaction_operator(fermion_operator, n_qubits=None):
     if n_qubits < count_qubits(fermion_operator):
         raise ValueError('Invalid number of qubits specified.')
 
-    # Normal order the terms and initialize.
-    fermion_operator = normal_ordered(fermion_operator)
-    constant = 0.
-    one_body = numpy.zeros((n_qubits, n_qubits), complex)
-    two_body = numpy.zeros((n_qubits, n_qubits,
-                            n_qubits, n_qubits), complex)
-
-    # Loop through terms and assign to matrix.
-    for term in fermion_operator.terms:
-        coefficient = fermion_operator.terms[term]
-        # Ignore this term if the coefficient is zero
-        if abs(coefficient) < EQ_TOLERANCE:
-            continue
-
-        # Handle constant shift.
-        if len(term) == 0:
-            constant = coefficient
-
-        elif len(term) == 2:
-            # Handle one-body terms.
-            if [operator[1] for operator in term] == [1, 0]:
-                p, q = [operator[0] for operator in term]
-                one_body[p, q] = coefficient
-            else:
-                raise InteractionOperatorError('FermionOperator does not map '
-                                               'to InteractionOperator.')
-
-        elif len(term) == 4:
-            # Handle two-body terms.
-            if [operator[1] for operator in term] == [1, 1, 0, 0]:
-                p, q, r, s = [operator[0] for operator in term]
-                two_body[p, q, r, s] = coefficient
-            else:
-                raise InteractionOperatorError('FermionOperator does not map '
-                                               'to InteractionOperator.')
-
-        else:
+    # Collect the terms which are already one- or two-body terms, and
+    # normal order only the remaining ones.
+    constant, one_body_entries, two_body_entries, remainder = (
+        _interaction_entries(fermion_operator.terms))
+    if remainder:
+        remainder_operator = FermionOperator()
+        remainder_operator.terms = remainder
+        remainder = normal_ordered(remainder_operator).terms
+        remainder = {term: coefficient for term, coefficient in
+                     remainder.items() if abs(coefficient) >= EQ_TOLERANCE}
+        (remainder_constant, remainder_one_body_entries,
+         remainder_two_body_entries, remainder) = _interaction_entries(
+             remainder)
+        if remainder:
             # Handle non-molecular Hamiltonian.
             raise InteractionOperatorError('FermionOperator does not map '
                                            'to InteractionOperator.')
+        constant += remainder_constant
+        one_body_entries = [numpy.concatenate(entries) for entries in
+                            zip(one_body_entries, remainder_one_body_entries)]
+        two_body_entries = [numpy.concatenate(entries) for entries in
+                            zip(two_body_entries, remainder_two_body_entries)]
+
+    # Ignore coefficients which are zero.
+    if abs(constant) < EQ_TOLERANCE:
+        constant = 0.
+
+    # Assign to tensors.
+    one_body = _coefficient_tensor((n_qubits,) * 2, one_body_entries, sparse)
+    two_body = _coefficient_tensor((n_qubits,) * 4, two_body_entries, sparse)
 
     # Form InteractionOperator and return.
     interaction_operator = InteractionOperator(constant, one_body, two_body)
     return interaction_operator
 
 
+def _interaction_entries(terms):
+    """Sort the terms of a FermionOperator into InteractionOperator entries.
+
+    Two-body terms a^\dagger_p a^\dagger_q a_r a_s are normal ordered on
+    the fly by swapping p, q and r, s as needed, which only changes signs.
+
+    Args:
+        terms(dict): The terms of a FermionOperator.
+
+    Returns:
+        constant: The sum of the coefficients of the constant terms.
+        one_body_entries(list): An (n_terms, 2) array of the indices and an
+            array of the coefficients of the one-body terms.
+        two_body_entries(list): An (n_terms, 4) array of the indices and an
+            array of the coefficients of the normal ordered two-body terms.
+        remainder(dict): The terms of other kinds.
+    """
+    constant = 0.
+    remainder = {}
+    grouped_terms = {2: ([], []), 4: ([], [])}
+    for term, coefficient in terms.items():
+        if not term:
+            constant += coefficient
+        elif len(term) in grouped_terms:
+            grouped_terms[len(term)][0].append(term)
+            grouped_terms[len(term)][1].append(coefficient)
+        else:
+            remainder[term] = coefficient
+
+    entries = {}
+    for length, actions in ((2, (1, 0)), (4, (1, 1, 0, 0))):
+        group_terms, group_coefficients = grouped_terms[length]
+        operators = numpy.array(group_terms, dtype=int).reshape(
+            -1, length, 2)
+        matching = numpy.all(operators[:, :, 1] == actions, axis=1)
+        for index in numpy.flatnonzero(~matching).tolist():
+            remainder[group_terms[index]] = group_coefficients[index]
+        indices = operators[matching, :, 0]
+        coefficients = numpy.array(group_coefficients, complex)[matching]
+
+        if length == 4:
+            # Normal order by sorting the creation and the annihilation
+            # operators in descending order. Repeated indices give zero.
+            swapped = (indices[:, [0, 2]] < indices[:, [1, 3]])
+            coefficients = coefficients * (-1) ** numpy.sum(swapped, axis=1)
+            indices[:, :2] = -numpy.sort(-indices[:, :2], axis=1)
+            indices[:, 2:] = -numpy.sort(-indices[:, 2:], axis=1)
+            distinct = ((indices[:, 0] != indices[:, 1]) &
+                        (indices[:, 2] != indices[:, 3]))
+            indices = indices[distinct]
+            coefficients = coefficients[distinct]
+        entries[length] = [indices, coefficients]
+
+    return constant, entries[2], entries[4], remainder
+
+
+def _coefficient_tensor(shape, entries, sparse):
+    """Sum the coefficients into a complex tensor, dropping tiny entries."""
+    indices, values = entries
+    if sparse:
+        tensor = SparseTensor(shape, indices, values)
+        large = numpy.absolute(tensor.values) >= EQ_TOLERANCE
+        return SparseTensor(shape, tensor.indices[large], tensor.values[large])
+    tensor = numpy.zeros(shape, complex)
+    numpy.add.at(tensor, tuple(indices.T), values)
+    tensor[numpy.absolute(tensor) < EQ_TOLERANCE] = 0.
+    return tensor
+
+
 def get_quadratic_hamiltonian(fermion_operator,
                               chemical_potential=None, n_qubits=None):
     """Convert a quadratic fermionic operator to QuadraticHamiltonian.
@@ -282,14 +419,18 @@ def get_fermion_operator(polynomial_tensor):
     Returns:
         fermion_operator: An instance of the FermionOperator class.
     """
-    fermion_operator = FermionOperator()
-    n_qubits = count_qubits(polynomial_tensor)
-
-    for term in polynomial_tensor:
-        fermion_operator += FermionOperator(
-                term, coefficient=polynomial_tensor[term])
+    terms = []
+    coefficients = []
+    for key, n_body_tensor in polynomial_tensor.n_body_tensors.items():
+        if key == ():
+            terms.append(())
+            coefficients.append(n_body_tensor)
+            continue
+        indices = _nonzero_indices(n_body_tensor)
+        terms.extend(tuple(zip(index, key)) for index in indices.tolist())
+        coefficients.extend(n_body_tensor[tuple(indices.T)].tolist())
 
-    return fermion_operator
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
 
 
 def get_molecular_data(interaction_operator,
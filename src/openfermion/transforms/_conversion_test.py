@@ -14,6 +14,7 @@
 from __future__ import absolute_import
 
 import copy
+import itertools
 import numpy
 import unittest
 
@@ -21,10 +22,13 @@ from openfermion.ops import (FermionOperator,
                              InteractionOperator,
                              normal_ordered,
                              number_operator,
-                             QubitOperator)
+                             QubitOperator,
+                             SparseTensor)
 from openfermion.ops._interaction_operator import InteractionOperatorError
 from openfermion.ops._quadratic_hamiltonian import QuadraticHamiltonianError
 from openfermion.transforms import *
+from openfermion.transforms._conversion import (_INTERACTION_RDM_MAPS,
+                                                _MAX_INTERACTION_RDM_MAPS)
 from openfermion.utils import *
 
 
@@ -40,6 +44,38 @@ class GetInteractionOperatorTest(unittest.TestCase):
         fermion_operator = normal_ordered(fermion_operator)
         self.assertTrue(normal_ordered(op).isclose(fermion_operator))
 
+    def test_get_interaction_operator_sparse(self):
+        op = (FermionOperator('', 1.5) + FermionOperator('2^ 3', 3.) +
+              FermionOperator('3^ 2^ 1 0', -2.j))
+        sparse_operator = get_interaction_operator(op, 6, sparse=True)
+        self.assertIsInstance(sparse_operator.two_body_tensor, SparseTensor)
+        self.assertEqual(sparse_operator.n_qubits, 6)
+        self.assertEqual(sparse_operator.two_body_tensor.nnz, 1)
+        self.assertEqual(sparse_operator, get_interaction_operator(op, 6))
+        self.assertTrue(get_fermion_operator(sparse_operator).isclose(op))
+
+    def test_get_interaction_operator_normal_orders(self):
+        op = (FermionOperator('2^ 3^ 1 0', 1.j) +
+              FermionOperator('3^ 2^ 1 0', 0.5) +
+              FermionOperator('1^ 1^ 2 0', 7.) +
+              FermionOperator('0^ 2^ 0 3', -2.) +
+              FermionOperator('1 1^', 3.) +
+              FermionOperator('0^ 0^ 1 0', 1e-12) +
+              FermionOperator('', 2.))
+        for sparse in (False, True):
+            interaction_operator = get_interaction_operator(op, sparse=sparse)
+            self.assertAlmostEqual(interaction_operator.constant, 5.)
+            self.assertAlmostEqual(
+                interaction_operator[(1, 1), (1, 0)], -3.)
+            self.assertAlmostEqual(
+                interaction_operator[(3, 1), (2, 1), (1, 0), (0, 0)],
+                0.5 - 1.j)
+            self.assertAlmostEqual(
+                interaction_operator[(2, 1), (0, 1), (3, 0), (0, 0)], -2.)
+            self.assertEqual(len(list(interaction_operator)), 4)
+            self.assertTrue(normal_ordered(op).isclose(
+                get_fermion_operator(interaction_operator)))
+
     def test_get_interaction_operator_bad_input(self):
         with self.assertRaises(TypeError):
             get_interaction_operator('3')
@@ -64,6 +100,50 @@ class GetInteractionOperatorTest(unittest.TestCase):
         """Test conversion to MolecularData from InteractionOperator"""
 
 
+class GetInteractionRDMTest(unittest.TestCase):
+
+    def test_get_interaction_rdm(self):
+        n_qubits = 3
+        qubit_operator = QubitOperator()
+        for paulis in itertools.product('IXYZ', repeat=n_qubits):
+            term = tuple((qubit, pauli) for qubit, pauli in enumerate(paulis)
+                         if pauli != 'I')
+            qubit_operator += QubitOperator(
+                term, numpy.random.randn() + 1.j * numpy.random.randn())
+
+        interaction_rdm = get_interaction_rdm(qubit_operator)
+        for i, j in itertools.product(range(n_qubits), repeat=2):
+            fermion_term = ((i, 1), (j, 0))
+            expectation = sum(
+                coefficient * qubit_operator.terms[term] for term, coefficient
+                in jordan_wigner(FermionOperator(fermion_term)).terms.items())
+            self.assertAlmostEqual(interaction_rdm[fermion_term],
+                                   expectation)
+        for i, j, k, l in itertools.product(range(n_qubits), repeat=4):
+            fermion_term = ((i, 1), (j, 1), (k, 0), (l, 0))
+            expectation = sum(
+                coefficient * qubit_operator.terms[term] for term, coefficient
+                in jordan_wigner(FermionOperator(fermion_term)).terms.items())
+            self.assertAlmostEqual(interaction_rdm[fermion_term],
+                                   expectation)
+
+    def test_get_interaction_rdm_unmeasured_terms(self):
+        interaction_rdm = get_interaction_rdm(QubitOperator('Z0', 0.5), 2)
+        self.assertAlmostEqual(interaction_rdm[(0, 1), (0, 0)], -0.25)
+        self.assertAlmostEqual(interaction_rdm[(1, 1), (1, 0)], 0.)
+        self.assertAlmostEqual(
+            interaction_rdm[(1, 1), (0, 1), (0, 0), (1, 0)], -0.125)
+        self.assertEqual(interaction_rdm.n_qubits, 2)
+
+    def test_interaction_rdm_map_cache_size(self):
+        for n_qubits in range(1, _MAX_INTERACTION_RDM_MAPS + 3):
+            get_interaction_rdm(QubitOperator('Z0'), n_qubits)
+            get_interaction_rdm(QubitOperator('Z0'), 1)
+        self.assertEqual(len(_INTERACTION_RDM_MAPS),
+                         _MAX_INTERACTION_RDM_MAPS)
+        self.assertIn(1, _INTERACTION_RDM_MAPS)
+
+
 class GetQuadraticHamiltonianTest(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,210 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Fermion-to-qubit encodings through Majorana monomials."""
+from __future__ import absolute_import
+
+import itertools
+
+import numpy
+
+from openfermion.config import EQ_TOLERANCE
+from openfermion.ops import FermionOperator, QubitOperator
+
+
+# Number of set bits in every byte.
+_POPCOUNT = numpy.array([bin(byte).count('1') for byte in range(256)],
+                        dtype=numpy.uint8)
+
+# Pauli labels indexed by x + 2 * z.
+_PAULI_LABELS = numpy.array(['I', 'X', 'Z', 'Y'])
+
+# Powers of i.
+_I_POWERS = numpy.array([1., 1.j, -1., -1.j])
+
+
+def encode_fermion_operator(operator, majorana_images):
+    """Map a FermionOperator to qubits with a table of Majorana images.
+
+    Every encoding in which each Majorana operator becomes a single Pauli
+    string can be applied this way. The ladder operators are
+    a_j = (c_j + i d_j) / 2 and a^\dagger_j = (c_j - i d_j) / 2 with
+    Majoranas c_j = a_j + a^\dagger_j and d_j = -i (a_j - a^\dagger_j).
+    The operator is first expanded into Majorana monomials. The images of
+    each monomial are then multiplied as packed binary (x, z) vectors, for
+    all monomials of the same length at once.
+
+    Args:
+        operator (FermionOperator): The operator to transform.
+        majorana_images (list): 2 * n_modes QubitOperators, each a single
+            Pauli string. Entries 2 * j and 2 * j + 1 are the images of
+            c_j and d_j respectively.
+
+    Returns:
+        transformed_operator: An instance of the QubitOperator class.
+
+    Raises:
+        TypeError: Operator must be a FermionOperator.
+        ValueError: Invalid Majorana images.
+    """
+    if not isinstance(operator, FermionOperator):
+        raise TypeError('operator must be a FermionOperator.')
+    x_table, z_table, image_coefficients, n_qubits = _majorana_table(
+        majorana_images)
+
+    x_blocks = []
+    z_blocks = []
+    coefficient_blocks = []
+    for majoranas, coefficients in _majorana_monomials(
+            operator, len(majorana_images) // 2):
+        x = numpy.zeros((len(majoranas), x_table.shape[1]), numpy.uint8)
+        z = numpy.zeros_like(x)
+        sign = numpy.zeros(len(majoranas), dtype=int)
+        coefficients = coefficients * numpy.prod(
+            image_coefficients[majoranas], axis=1)
+
+        # X^x1 Z^z1 X^x2 Z^z2 = (-1)^(z1 . x2) X^(x1 + x2) Z^(z1 + z2).
+        for column in majoranas.T:
+            sign += numpy.sum(_POPCOUNT[z & x_table[column]], axis=1,
+                              dtype=int)
+            x ^= x_table[column]
+            z ^= z_table[column]
+
+        # Convert to Pauli strings with X Z = -i Y.
+        n_y = numpy.sum(_POPCOUNT[x & z], axis=1, dtype=int)
+        x_blocks.append(x)
+        z_blocks.append(z)
+        coefficient_blocks.append(
+            coefficients * _I_POWERS[(2 * sign - n_y) % 4])
+
+    if not coefficient_blocks:
+        return QubitOperator()
+
+    # Sum repeated Pauli strings.
+    x = numpy.concatenate(x_blocks)
+    z = numpy.concatenate(z_blocks)
+    strings, first, inverse = numpy.unique(
+        numpy.concatenate([x, z], axis=1), axis=0,
+        return_index=True, return_inverse=True)
+    contributions = numpy.concatenate(coefficient_blocks)
+    coefficients = numpy.zeros(len(strings), dtype=complex)
+    numpy.add.at(coefficients, inverse.ravel(), contributions)
+
+    # Drop the strings whose contributions cancel, which summing in bulk
+    # leaves as rounding residues. EQ_TOLERANCE is chosen for this here;
+    # QubitOperator += only drops exact zeros. Strings which only ever had
+    # negligible contributions are kept, as adding them term by term would.
+    largest_contributions = numpy.zeros(len(strings))
+    numpy.maximum.at(largest_contributions, inverse.ravel(),
+                     numpy.absolute(contributions))
+    keep = ((numpy.absolute(coefficients) >= EQ_TOLERANCE) |
+            (largest_contributions < EQ_TOLERANCE))
+    x = numpy.unpackbits(x[first[keep]], axis=1)[:, :n_qubits]
+    z = numpy.unpackbits(z[first[keep]], axis=1)[:, :n_qubits]
+
+    return QubitOperator.from_terms(_pauli_terms(x, z),
+                                    coefficients[keep], validate=False)
+
+
+def _majorana_table(majorana_images):
+    """Pack the images of the Majorana operators.
+
+    Args:
+        majorana_images (list): Single-string QubitOperators.
+
+    Returns:
+        x_table, z_table (numpy arrays): The packed x and z bits of the
+            image of each Majorana in the form X^x Z^z.
+        coefficients (numpy array): The coefficient of each image in that
+            form.
+        n_qubits (int): The number of qubits of the encoding.
+    """
+    images = []
+    for image in majorana_images:
+        if not (isinstance(image, QubitOperator) and
+                len(image.terms) == 1):
+            raise ValueError('Each Majorana image must be a single '
+                             'Pauli string.')
+        images.append(next(iter(image.terms.items())))
+    if len(images) % 2:
+        raise ValueError('There must be two Majorana images per mode.')
+
+    n_qubits = max([term[-1][0] + 1 for term, _ in images if term] + [0])
+    x_table = numpy.zeros((len(images), n_qubits), dtype=bool)
+    z_table = numpy.zeros((len(images), n_qubits), dtype=bool)
+    coefficients = numpy.zeros(len(images), dtype=complex)
+    for majorana, (term, coefficient) in enumerate(images):
+        for qubit, pauli in term:
+            x_table[majorana, qubit] = pauli in 'XY'
+            z_table[majorana, qubit] = pauli in 'YZ'
+
+        # Y = i X Z.
+        n_y = sum(pauli == 'Y' for _, pauli in term)
+        coefficients[majorana] = coefficient * _I_POWERS[n_y % 4]
+
+    return (numpy.packbits(x_table, axis=1), numpy.packbits(z_table, axis=1),
+            coefficients, n_qubits)
+
+
+def _majorana_monomials(operator, n_modes):
+    """Expand a FermionOperator into Majorana monomials.
+
+    Majorana 2 * j is c_j and Majorana 2 * j + 1 is d_j. A term with k
+    ladder operators expands into 2^k monomials of length k.
+
+    Args:
+        operator (FermionOperator): The operator to expand.
+        n_modes (int): The number of modes which may appear.
+
+    Yields:
+        Pairs of an (n_monomials, k) array of Majorana indices and the
+        array of their coefficients, one pair for each term length k.
+
+    Raises:
+        ValueError: Operator acts on more modes than n_modes.
+    """
+    terms_by_length = {}
+    for term, coefficient in operator.terms.items():
+        terms_by_length.setdefault(len(term), ([], []))
+        terms_by_length[len(term)][0].append(term)
+        terms_by_length[len(term)][1].append(coefficient)
+
+    for length, (terms, coefficients) in sorted(terms_by_length.items()):
+        ladder_operators = numpy.array(terms, dtype=int).reshape(
+            len(terms), length, 2)
+        modes = ladder_operators[:, :, 0]
+        raising = ladder_operators[:, :, 1].astype(bool)
+        if modes.size and modes.max() >= n_modes:
+            raise ValueError('Majorana images must cover every mode of '
+                             'the operator.')
+
+        # a_j = (c_j + i d_j) / 2 and a^\dagger_j = (c_j - i d_j) / 2.
+        choices = numpy.array(list(itertools.product((0, 1), repeat=length)),
+                              dtype=int).reshape(2 ** length, length)
+        majoranas = 2 * modes[:, None, :] + choices
+        factors = numpy.where(choices, numpy.where(
+            raising[:, None, :], -.5j, .5j), .5)
+        yield (majoranas.reshape(len(terms) * 2 ** length, length),
+               (numpy.array(coefficients)[:, None] *
+                numpy.prod(factors, axis=2)).ravel())
+
+
+def _pauli_terms(x, z):
+    """Return the Pauli string terms with the given rows of x and z bits."""
+    support = (x | z).astype(bool)
+    rows, qubits = numpy.nonzero(support)
+    labels = _PAULI_LABELS[x + 2 * z][rows, qubits]
+    local_operators = list(zip(qubits.tolist(), labels.tolist()))
+    bounds = numpy.concatenate([[0], numpy.cumsum(numpy.sum(support,
+                                                            axis=1))])
+    return [tuple(local_operators[start:end]) for
+            start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
@@ -0,0 +1,105 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Tests for _encoding.py."""
+from __future__ import absolute_import
+
+import unittest
+
+from openfermion.ops import FermionOperator, QubitOperator
+from openfermion.transforms import (bravyi_kitaev, encode_fermion_operator,
+                                    jordan_wigner)
+from openfermion.transforms._bravyi_kitaev import _bravyi_kitaev_majoranas
+from openfermion.transforms._fenwick_tree import FenwickTree
+from openfermion.transforms._jordan_wigner import _jordan_wigner_majoranas
+
+
+class EncodeFermionOperatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.operator = (FermionOperator('3^ 1 0^ 0', 1. + 2.j) +
+                         FermionOperator('2^ 2 1^ 0', -.7) +
+                         FermionOperator('1 1^ 1 2^', .3) +
+                         FermionOperator((), 1.5))
+
+    def test_ladder_operators_jordan_wigner(self):
+        images = _jordan_wigner_majoranas(3)
+        lowering = encode_fermion_operator(FermionOperator('2'), images)
+        raising = encode_fermion_operator(FermionOperator('2^'), images)
+        self.assertTrue(lowering.isclose(
+            QubitOperator('Z0 Z1 X2', .5) + QubitOperator('Z0 Z1 Y2', .5j)))
+        self.assertTrue(raising.isclose(
+            QubitOperator('Z0 Z1 X2', .5) + QubitOperator('Z0 Z1 Y2', -.5j)))
+
+    def test_majorana_squares_to_identity(self):
+        images = _jordan_wigner_majoranas(2)
+        number = encode_fermion_operator(FermionOperator('1^ 1'), images)
+        self.assertTrue(number.isclose(
+            QubitOperator((), .5) + QubitOperator('Z1', -.5)))
+        anticommutator = encode_fermion_operator(
+            FermionOperator('1^ 1') + FermionOperator('1 1^'), images)
+        self.assertTrue(anticommutator.isclose(QubitOperator(())))
+
+    def test_matches_transforms(self):
+        self.assertTrue(encode_fermion_operator(
+            self.operator, _jordan_wigner_majoranas(4)).isclose(
+                jordan_wigner(self.operator)))
+        images = _bravyi_kitaev_majoranas(FenwickTree(6), 6)
+        self.assertTrue(encode_fermion_operator(
+            self.operator, images).isclose(bravyi_kitaev(self.operator, 6)))
+
+    def test_custom_encoding(self):
+        # Jordan-Wigner with the order of the qubits reversed.
+        images = []
+        for index in range(4):
+            z_factors = tuple((qubit, 'Z') for qubit in range(4 - index, 4))
+            images.append(QubitOperator(z_factors + ((3 - index, 'X'),)))
+            images.append(QubitOperator(z_factors + ((3 - index, 'Y'),)))
+        reversed_operator = FermionOperator()
+        for term, coefficient in self.operator.terms.items():
+            reversed_operator += FermionOperator(
+                tuple((3 - index, action) for index, action in term),
+                coefficient)
+        self.assertTrue(encode_fermion_operator(self.operator, images).isclose(
+            jordan_wigner(reversed_operator)))
+
+    def test_negligible_strings(self):
+        # XX and YY cancel up to rounding and are dropped, while the strings
+        # of the zero coefficient term are kept as they would be by +=.
+        images = _jordan_wigner_majoranas(2)
+        operator = (FermionOperator('0^ 1') -
+                    FermionOperator('1^ 0', 1. - 1e-15) +
+                    FermionOperator('1^ 1', 0.))
+        transformed_operator = encode_fermion_operator(operator, images)
+        self.assertEqual(set(transformed_operator.terms),
+                         {((0, 'X'), (1, 'Y')), ((0, 'Y'), (1, 'X')),
+                          (), ((1, 'Z'),)})
+        self.assertEqual(transformed_operator.terms[((1, 'Z'),)], 0.)
+
+    def test_empty_operator(self):
+        self.assertEqual(encode_fermion_operator(
+            FermionOperator(), _jordan_wigner_majoranas(2)).terms, {})
+
+    def test_bad_input(self):
+        with self.assertRaises(TypeError):
+            encode_fermion_operator(QubitOperator('X0'),
+                                    _jordan_wigner_majoranas(1))
+        with self.assertRaises(ValueError):
+            encode_fermion_operator(FermionOperator('3^ 0'),
+                                    _jordan_wigner_majoranas(2))
+        with self.assertRaises(ValueError):
+            encode_fermion_operator(FermionOperator('0^ 0'),
+                                    [QubitOperator('X0') + QubitOperator('Y0'),
+                                     QubitOperator('Y0')])
+        with self.assertRaises(ValueError):
+            encode_fermion_operator(FermionOperator('0^ 0'),
+                                    [QubitOperator('X0')])
@@ -17,6 +17,7 @@ import itertools
 
 from openfermion.ops import (FermionOperator, InteractionOperator,
                              QubitOperator)
+from openfermion.transforms._encoding import encode_fermion_operator
 
 
 def jordan_wigner(operator):
@@ -39,27 +40,23 @@ def jordan_wigner(operator):
     if not isinstance(operator, FermionOperator):
         raise TypeError("operator must be a FermionOperator or "
                         "InteractionOperator.")
-    transformed_operator = QubitOperator()
-    for term in operator.terms:
-
-        # Initialize identity matrix.
-        transformed_term = QubitOperator((), operator.terms[term])
-
-        # Loop through operators, transform and multiply.
-        for ladder_operator in term:
-            z_factors = tuple((index, 'Z') for
-                              index in range(ladder_operator[0]))
-            pauli_x_component = QubitOperator(
-                z_factors + ((ladder_operator[0], 'X'),), 0.5)
-            if ladder_operator[1]:
-                pauli_y_component = QubitOperator(
-                    z_factors + ((ladder_operator[0], 'Y'),), -0.5j)
-            else:
-                pauli_y_component = QubitOperator(
-                    z_factors + ((ladder_operator[0], 'Y'),), 0.5j)
-            transformed_term *= pauli_x_component + pauli_y_component
-        transformed_operator += transformed_term
-    return transformed_operator
+    from openfermion.utils import count_qubits
+    return encode_fermion_operator(
+        operator, _jordan_wigner_majoranas(count_qubits(operator)))
+
+
+def _jordan_wigner_majoranas(n_qubits):
+    """Return the images of the Majoranas c_j and d_j under JW.
+
+    c_j -> Z_0 .. Z_{j-1} X_j
+    d_j -> Z_0 .. Z_{j-1} Y_j
+    """
+    majorana_images = []
+    for index in range(n_qubits):
+        z_factors = tuple((qubit, 'Z') for qubit in range(index))
+        majorana_images.append(QubitOperator(z_factors + ((index, 'X'),)))
+        majorana_images.append(QubitOperator(z_factors + ((index, 'Y'),)))
+    return majorana_images
 
 
 def jordan_wigner_interaction_op(iop, n_qubits=None):
@@ -0,0 +1,95 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Apply transforms to operators streamed from file."""
+from __future__ import absolute_import
+
+import inspect
+
+
+def _accepts_n_qubits(transform):
+    """Return whether a transform takes an n_qubits argument.
+
+    Returns None if this cannot be determined from the signature, e.g. for
+    a wrapper taking only *args and **kwargs.
+    """
+    try:
+        parameters = inspect.signature(transform).parameters
+    except AttributeError:  # pragma: no cover
+        # Python 2 has no inspect.signature.
+        try:
+            argspec = inspect.getargspec(transform)
+        except TypeError:
+            return None
+        if 'n_qubits' in argspec.args:
+            return True
+        return None if argspec.varargs or argspec.keywords else False
+    except (TypeError, ValueError):
+        return None
+    if 'n_qubits' in parameters:
+        return True
+    if any(parameter.kind in (parameter.VAR_POSITIONAL,
+                              parameter.VAR_KEYWORD)
+           for parameter in parameters.values()):
+        return None
+    return False
+
+
+def transform_operator_stream(transform, operator_stream, writer,
+                              n_qubits=None, pass_n_qubits=None):
+    """Apply a transform to a streamed operator one chunk at a time.
+
+    Since jordan_wigner, bravyi_kitaev and reverse_jordan_wigner act on each
+    term independently, the transformed chunks sum to the transform of the
+    whole operator, which is never held in memory.
+
+    Example:
+        .. code-block:: python
+
+            operator_stream = OperatorStreamReader('hamiltonian')
+            with OperatorStreamWriter(QubitOperator, 'qubit_hamiltonian') as (
+                    writer):
+                transform_operator_stream(bravyi_kitaev, operator_stream,
+                                          writer)
+
+    Args:
+        transform: A function mapping an operator to its transformed
+            operator, such as jordan_wigner or bravyi_kitaev.
+        operator_stream(OperatorStreamReader): The operator to transform.
+        writer(OperatorStreamWriter): Stream to which the transformed chunks
+            are written. It is not closed.
+        n_qubits(int): The number of qubits passed to transforms taking an
+            n_qubits argument, such as bravyi_kitaev and
+            reverse_jordan_wigner. Defaults to the number of qubits of the
+            streamed operator, since these transforms must not infer it
+            from each chunk.
+        pass_n_qubits(bool): Whether to pass n_qubits to the transform as
+            a keyword argument. By default, it is passed if the signature
+            of the transform has an n_qubits argument.
+
+    Raises:
+        ValueError: pass_n_qubits is not given and the signature of the
+            transform does not show whether it takes n_qubits.
+    """
+    if pass_n_qubits is None:
+        pass_n_qubits = _accepts_n_qubits(transform)
+        if pass_n_qubits is None:
+            raise ValueError('Cannot tell whether the transform takes '
+                             'n_qubits; specify pass_n_qubits.')
+    if n_qubits is None:
+        n_qubits = operator_stream.n_qubits
+
+    for chunk in operator_stream:
+        if pass_n_qubits:
+            writer.write(transform(chunk, n_qubits=n_qubits))
+        else:
+            writer.write(transform(chunk))
@@ -0,0 +1,108 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Tests for _operator_stream.py."""
+from __future__ import absolute_import
+
+import functools
+import os
+import unittest
+
+from openfermion.config import DATA_DIRECTORY
+from openfermion.hamiltonians import fermi_hubbard
+from openfermion.ops import FermionOperator, QubitOperator
+from openfermion.transforms import (bravyi_kitaev, jordan_wigner,
+                                    reverse_jordan_wigner,
+                                    transform_operator_stream)
+from openfermion.utils import (load_operator,
+                               OperatorStreamReader,
+                               OperatorStreamWriter)
+
+
+class TransformOperatorStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.hamiltonian = fermi_hubbard(2, 2, 1., 4.)
+        self.input_name = 'test_stream_input'
+        self.output_name = 'test_stream_output'
+        self.output_path = os.path.join(DATA_DIRECTORY,
+                                        self.output_name + '.data')
+
+        # Write small chunks so that not every chunk touches every qubit.
+        with OperatorStreamWriter(FermionOperator, self.input_name,
+                                  chunk_size=2) as writer:
+            for term in self.hamiltonian.terms:
+                writer.write(FermionOperator(term,
+                                             self.hamiltonian.terms[term]))
+
+    def tearDown(self):
+        for file_name in (self.input_name, self.output_name):
+            file_path = os.path.join(DATA_DIRECTORY, file_name + '.data')
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+    def transform_stream(self, transform, input_name, operator_type,
+                         **kwargs):
+        with OperatorStreamWriter(operator_type, self.output_name) as writer:
+            transform_operator_stream(transform,
+                                      OperatorStreamReader(input_name),
+                                      writer, **kwargs)
+        return load_operator(self.output_name)
+
+    def test_jordan_wigner(self):
+        qubit_operator = self.transform_stream(
+            jordan_wigner, self.input_name, QubitOperator)
+        self.assertTrue(qubit_operator.isclose(
+            jordan_wigner(self.hamiltonian)))
+
+    def test_bravyi_kitaev(self):
+        qubit_operator = self.transform_stream(
+            bravyi_kitaev, self.input_name, QubitOperator)
+        self.assertTrue(qubit_operator.isclose(
+            bravyi_kitaev(self.hamiltonian)))
+
+    def test_reverse_jordan_wigner(self):
+        qubit_operator = self.transform_stream(
+            jordan_wigner, self.input_name, QubitOperator)
+        os.rename(os.path.join(DATA_DIRECTORY, self.output_name + '.data'),
+                  os.path.join(DATA_DIRECTORY, self.input_name + '.data'))
+        fermion_operator = self.transform_stream(
+            reverse_jordan_wigner, self.input_name, FermionOperator)
+        self.assertTrue(jordan_wigner(fermion_operator).isclose(
+            qubit_operator))
+
+    def test_wrapped_transforms(self):
+        def decorated(transform):
+            @functools.wraps(transform)
+            def wrapper(*args, **kwargs):
+                return transform(*args, **kwargs)
+            return wrapper
+
+        for transform in (functools.partial(bravyi_kitaev),
+                          decorated(bravyi_kitaev)):
+            qubit_operator = self.transform_stream(
+                transform, self.input_name, QubitOperator)
+            self.assertTrue(qubit_operator.isclose(
+                bravyi_kitaev(self.hamiltonian)))
+            os.remove(self.output_path)
+
+    def test_opaque_transform(self):
+        def transform(*args, **kwargs):
+            return bravyi_kitaev(*args, **kwargs)
+
+        with self.assertRaises(ValueError):
+            self.transform_stream(transform, self.input_name, QubitOperator)
+        os.remove(self.output_path)
+        qubit_operator = self.transform_stream(
+            transform, self.input_name, QubitOperator, pass_n_qubits=True)
+        self.assertTrue(qubit_operator.isclose(
+            bravyi_kitaev(self.hamiltonian)))
@@ -13,11 +13,9 @@
 """Reverse Jordan-Wigner transform on QubitOperators."""
 from __future__ import absolute_import
 
-import copy
+import itertools
 
-from openfermion.ops import (FermionOperator,
-                             number_operator,
-                             QubitOperator)
+from openfermion.ops import FermionOperator, QubitOperator
 from openfermion.utils import count_qubits
 
 
@@ -51,51 +49,68 @@ def reverse_jordan_wigner(qubit_operator, n_qubits=None):
         raise ValueError('Invalid number of qubits specified.')
 
     # Loop through terms.
-    transformed_operator = FermionOperator()
+    terms = []
+    coefficients = []
     for term in qubit_operator.terms:
-        transformed_term = FermionOperator(())
-        if term:
-            working_term = QubitOperator(term)
-            pauli_operator = term[-1]
-            while pauli_operator is not None:
-
-                # Handle Pauli Z.
-                if pauli_operator[1] == 'Z':
-                    transformed_pauli = FermionOperator(
-                        ()) + number_operator(n_qubits, pauli_operator[0], -2.)
-
-                # Handle Pauli X and Y.
-                else:
-                    raising_term = FermionOperator(((pauli_operator[0], 1),))
-                    lowering_term = FermionOperator(((pauli_operator[0], 0),))
-                    if pauli_operator[1] == 'Y':
-                        raising_term *= 1.j
-                        lowering_term *= -1.j
-
-                    transformed_pauli = raising_term + lowering_term
-
-                    # Account for the phase terms.
-                    for j in reversed(range(pauli_operator[0])):
-                        z_term = QubitOperator(((j, 'Z'),))
-                        working_term = z_term * working_term
-                    term_key = list(working_term.terms)[0]
-                    transformed_pauli *= working_term.terms[term_key]
-                    working_term.terms[list(working_term.terms)[0]] = 1.
-
-                # Get next non-identity operator acting below 'working_qubit'.
-                assert len(working_term.terms) == 1
-                working_qubit = pauli_operator[0] - 1
-                for working_operator in reversed(list(working_term.terms)[0]):
-                    if working_operator[0] <= working_qubit:
-                        pauli_operator = working_operator
-                        break
-                    else:
-                        pauli_operator = None
-
-                # Multiply term by transformed operator.
-                transformed_term *= transformed_pauli
-
-        # Account for overall coefficient
-        transformed_term *= qubit_operator.terms[term]
-        transformed_operator += transformed_term
-    return transformed_operator
+        coefficient = qubit_operator.terms[term]
+        for ladder_operators, factor in _reverse_jordan_wigner_term(term):
+            terms.append(ladder_operators)
+            coefficients.append(factor * coefficient)
+    return FermionOperator.from_terms(terms, coefficients, validate=False)
+
+
+def _reverse_jordan_wigner_term(term):
+    """Expand the fermionic image of a single Pauli string.
+
+    The qubits are visited from the highest down. Each X or Y multiplies
+    the Jordan-Wigner parity string Z_{j-1} .. Z_0 into the operators
+    below it, which flips their z bit, so the Pauli acting on a qubit is
+    found from the parity of the x bits above it. The images of the
+    resulting Paulis are multiplied from the highest qubit to the lowest.
+
+    Args:
+        term: A tuple of (qubit, Pauli) tuples.
+
+    Yields:
+        Pairs of a term of ladder operators and its coefficient.
+    """
+    x_mask = z_mask = 0
+    for qubit, pauli in term:
+        if pauli in 'XY':
+            x_mask |= 1 << qubit
+        if pauli in 'YZ':
+            z_mask |= 1 << qubit
+    n_qubits = max(x_mask.bit_length(), z_mask.bit_length())
+
+    phase = 1.
+    x_parity = 0
+    factors = []
+    for qubit in reversed(range(n_qubits)):
+        x_bit = (x_mask >> qubit) & 1
+        z_bit = (z_mask >> qubit) & 1
+
+        # Multiply in the parity strings of higher X and Y operators:
+        # Z X = i Y and Z Y = -i X.
+        if x_parity:
+            if x_bit:
+                phase *= -1.j if z_bit else 1.j
+            z_bit ^= 1
+
+        # Z_j -> I - 2 a^\dagger_j a_j
+        if x_bit == 0 and z_bit:
+            factors.append((((), 1.), (((qubit, 1), (qubit, 0)), -2.)))
+        # X_j -> a^\dagger_j + a_j
+        elif x_bit and not z_bit:
+            factors.append(((((qubit, 1),), 1.), (((qubit, 0),), 1.)))
+        # Y_j -> i a^\dagger_j - i a_j
+        elif x_bit:
+            factors.append(((((qubit, 1),), 1.j), (((qubit, 0),), -1.j)))
+        x_parity ^= x_bit
+
+    for choice in itertools.product(*factors):
+        ladder_operators = ()
+        coefficient = phase
+        for operators, factor in choice:
+            ladder_operators += operators
+            coefficient *= factor
+        yield ladder_operators, coefficient
@@ -13,6 +13,7 @@
 """Tests  _reverse_jordan_wigner.py."""
 from __future__ import absolute_import
 
+import itertools
 import unittest
 
 from openfermion.ops import (FermionOperator, normal_ordered,
@@ -186,3 +187,22 @@ class ReverseJWTest(unittest.TestCase):
         expected_op = FermionOperator('1^')
         expected_op += FermionOperator('1')
         self.assertTrue(transformed_op.isclose(expected_op))
+
+    def test_round_trip_all_pauli_strings(self):
+        for paulis in itertools.product('IXYZ', repeat=4):
+            qubit_op = QubitOperator(
+                tuple((qubit, pauli) for qubit, pauli in enumerate(paulis)
+                      if pauli != 'I'), 0.5 - 1.j)
+            transformed_op = reverse_jordan_wigner(qubit_op)
+            self.assertTrue(jordan_wigner(transformed_op).isclose(qubit_op))
+
+    def test_parity_string_phases(self):
+        # The parity string of Y4 turns X2 into i Y2 and adds Z3. The
+        # parity strings of Y4 and Y2 cancel on qubits 0 and 1.
+        qubit_op = QubitOperator('X2 Y4')
+        transformed_op = reverse_jordan_wigner(qubit_op)
+        expected_op = 1.j * (
+            FermionOperator('4^', 1.j) + FermionOperator('4', -1.j)) * (
+            FermionOperator('') + FermionOperator('3^ 3', -2.)) * (
+            FermionOperator('2^', 1.j) + FermionOperator('2', -1.j))
+        self.assertTrue(transformed_op.isclose(expected_op))
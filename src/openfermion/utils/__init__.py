@@ -10,15 +10,26 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from ._channel_state import (amplitude_damping_channel, dephasing_channel,
-                             depolarizing_channel)
+from ._channel_state import (amplitude_damping_channel, ChannelPipeline,
+                             dephasing_channel, depolarizing_channel)
+
+from ._gaussian_states import (correlation_matrix_expectation,
+                               covariance_matrix_expectation,
+                               evolve_correlation_matrix,
+                               evolve_covariance_matrix,
+                               gaussian_correlation_matrix,
+                               gaussian_covariance_matrix,
+                               rotate_correlation_matrix,
+                               rotate_covariance_matrix)
 
 from ._grid import Grid
 
 from ._operator_utils import (commutator, count_qubits,
                               eigenspectrum, fourier_transform,
                               get_file_path, inverse_fourier_transform,
-                              is_identity, load_operator, save_operator)
+                              is_identity, load_operator,
+                              OperatorStreamReader, OperatorStreamWriter,
+                              save_operator)
 
 from ._slater_determinants import (fermionic_gaussian_decomposition,
                                    givens_decomposition,
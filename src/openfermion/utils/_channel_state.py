@@ -12,53 +12,139 @@
 
 """Module to manipulate basic models of quantum channels"""
 
-from functools import reduce
-from itertools import chain
-from numpy import array, conj, dot, eye, kron, log2, sqrt
+from numpy import array, dot, einsum, empty, eye, log2, result_type, sqrt
 
 
 def _verify_channel_inputs(density_matrix, probability, target_qubit):
     """Verifies input parameters for channels
 
     Args:
-        density_matrix (numpy.ndarray): Density matrix of the system
+        density_matrix (numpy.ndarray): Density matrix of the system, or a
+            stack of density matrices along the first axis.
         probability (float): Probability error is applied p \in [0, 1]
-        target_qubit (int): target for the channel error.
+        target_qubit (int or list): target, or list of targets, for the
+            channel error.
 
     Returns:
-        new_density_matrix(numpy.ndarray): Density matrix with the channel
-            applied.
+        target_qubits(list): The targets for the channel error.
     """
-    n_qubits = int(log2(density_matrix.shape[0]))
+    n_qubits = int(log2(density_matrix.shape[-1]))
 
-    if (len(density_matrix.shape) != 2 or
-            density_matrix.shape[0] != density_matrix.shape[1]):
+    if (len(density_matrix.shape) not in (2, 3) or
+            density_matrix.shape[-2] != density_matrix.shape[-1]):
         raise ValueError("Error in input of density matrix to channel.")
     if (probability < 0) or (probability > 1):
         raise ValueError("Channel probability must be between 0 and 1.")
-    if (target_qubit < 0) or (target_qubit >= n_qubits):
-        raise ValueError("Target qubits must be within number of qubits.")
+    if isinstance(target_qubit, (list, tuple)):
+        target_qubits = list(target_qubit)
+    else:
+        target_qubits = [target_qubit]
+    for qubit in target_qubits:
+        if (qubit < 0) or (qubit >= n_qubits):
+            raise ValueError("Target qubits must be within number of qubits.")
+    return target_qubits
+
+
+def _kraus_superoperator(kraus_operators, transpose_right=True):
+    """Sum single qubit Kraus operators into a superoperator
+
+    Args:
+        kraus_operators (list): The 2 x 2 Kraus operators E_k.
+        transpose_right (bool): Whether the channel is the sum over k of
+            E_k rho E_k^T rather than of E_k rho E_k.
+
+    Returns:
+        superoperator (numpy.ndarray): Tensor S of shape (2, 2, 2, 2) such
+            that the new rho[a, b] is the sum of S[a, b, i, j] rho[i, j].
+    """
+    return sum(einsum('ai,bj->abij' if transpose_right else 'ai,jb->abij',
+                      operator, operator) for operator in kraus_operators)
+
+
+def _amplitude_damping_superoperator(probability, transpose=False):
+    """Return the superoperator of a single qubit amplitude damping channel"""
+    E0 = array([[1.0, 0.0],
+                [0.0, sqrt(1.0 - probability)]], dtype=complex)
+    E1 = array([[0.0, sqrt(probability)],
+                [0.0, 0.0]], dtype=complex)
+
+    if transpose:
+        E0 = E0.T
+        E1 = E1.T
 
+    return _kraus_superoperator([E0, E1])
 
-def _lift_operator(operator, n_qubits, target_qubit):
-    """Lift a single qubit operator into the n_qubit space by kron product
+
+def _dephasing_superoperator(probability, transpose=False):
+    """Return the superoperator of a single qubit dephasing channel"""
+    E0 = sqrt(1.0 - probability/2.) * eye(2)
+    E1 = sqrt(probability/2.) * array([[1.0, 0.0], [1.0, -1.0]])
+
+    if transpose:
+        E0 = E0.T
+        E1 = E1.T
+
+    return _kraus_superoperator([E0, E1])
+
+
+def _depolarizing_superoperator(probability, transpose=False):
+    """Return the superoperator of a single qubit depolarizing channel
+
+    The transpose argument is ignored, since the channel is symmetric under
+    conjugate transpose.
+    """
+    E0 = sqrt(1.0 - probability) * eye(2)
+    E1 = sqrt(probability / 3.) * array([[0.0, 1.0],
+                                         [1.0, 0.0]])
+    E2 = sqrt(probability / 3.) * array([[0.0, -1.0j],
+                                         [1.0j, 0.0]])
+    E3 = sqrt(probability / 3.) * array([[1.0, 0.0],
+                                         [0.0, -1.0]])
+
+    return _kraus_superoperator([E0, E1, E2, E3], transpose_right=False)
+
+
+def _apply_local_superoperator(density_matrix, superoperator, target_qubit,
+                               out=None):
+    """Apply a single qubit superoperator to the target qubit
+
+    The superoperator is contracted only with the axes of the density
+    matrix that belong to the target qubit, so the Kraus operators are
+    never lifted into the full space.
 
     Args:
-        operator (ndarray): Single qubit operator to lift into full space
-        n_qubits (int): Number of total qubits in the space
-        target_qubit (int): Qubit to act on
+        density_matrix (numpy.ndarray): Density matrix of the system, or a
+            stack of density matrices along the first axis.
+        superoperator (numpy.ndarray): Tensor of shape (2, 2, 2, 2) as
+            returned by _kraus_superoperator.
+        target_qubit (int): Qubit to act on.
+        out (numpy.ndarray): Optional contiguous array of the same shape
+            as density_matrix to write the result to.
 
-    Return:
-        new_operator(Sparse Operator): Operator representing the embedding in
-            the full space.
+    Returns:
+        new_density_matrix(numpy.ndarray): Density matrix with the channel
+            applied.
     """
-    new_operator = (
-        reduce(kron,
-               chain(
-                   (eye(2) for i in range(0, target_qubit)),
-                   [operator],
-                   (eye(2) for i in range(target_qubit + 1, n_qubits)))))
-    return new_operator
+    n_qubits = int(log2(density_matrix.shape[-1]))
+    left = 2 ** target_qubit
+    right = 2 ** (n_qubits - target_qubit - 1)
+    shape = (-1, left, 2, right, left, 2, right)
+    if out is None:
+        new_density_matrix = einsum('abij,xlirmjs->xlarmbs', superoperator,
+                                    density_matrix.reshape(shape))
+        return new_density_matrix.reshape(density_matrix.shape)
+    einsum('abij,xlirmjs->xlarmbs', superoperator,
+           density_matrix.reshape(shape), out=out.reshape(shape))
+    return out
+
+
+def _apply_channel(density_matrix, superoperator, target_qubits):
+    """Apply a single qubit superoperator to each target qubit in turn"""
+    new_density_matrix = density_matrix
+    for target_qubit in target_qubits:
+        new_density_matrix = _apply_local_superoperator(
+            new_density_matrix, superoperator, target_qubit)
+    return new_density_matrix
 
 
 def amplitude_damping_channel(density_matrix, probability, target_qubit,
@@ -69,9 +155,11 @@ def amplitude_damping_channel(density_matrix, probability, target_qubit,
     qubit in the density_matrix.
 
     Args:
-        density_matrix (numpy.ndarray): Density matrix of the system
+        density_matrix (numpy.ndarray): Density matrix of the system, or a
+            stack of density matrices along the first axis.
         probability (float): Probability error is applied p \in [0, 1]
-        target_qubit (int): target for the channel error.
+        target_qubit (int or list): target for the channel error. If a
+            list is given, the channel is applied to each target in turn.
         transpose (bool): Conjugate transpose channel operators, useful for
             acting on Hamiltonians in variational channel state models
 
@@ -79,25 +167,13 @@ def amplitude_damping_channel(density_matrix, probability, target_qubit,
         new_density_matrix(numpy.ndarray): Density matrix with the channel
             applied.
     """
-    _verify_channel_inputs(density_matrix, probability, target_qubit)
-    n_qubits = int(log2(density_matrix.shape[0]))
-
-    E0 = _lift_operator(array([[1.0, 0.0],
-                               [0.0, sqrt(1.0 - probability)]], dtype=complex),
-                        n_qubits, target_qubit)
+    target_qubits = _verify_channel_inputs(density_matrix, probability,
+                                           target_qubit)
 
-    E1 = _lift_operator(array([[0.0, sqrt(probability)],
-                               [0.0, 0.0]], dtype=complex),
-                        n_qubits, target_qubit)
-
-    if transpose:
-        E0 = E0.T
-        E1 = E1.T
-
-    new_density_matrix = (dot(E0, dot(density_matrix, E0.T)) +
-                          dot(E1, dot(density_matrix, E1.T)))
-
-    return new_density_matrix
+    return _apply_channel(
+        density_matrix,
+        _amplitude_damping_superoperator(probability, transpose),
+        target_qubits)
 
 
 def dephasing_channel(density_matrix, probability, target_qubit,
@@ -108,9 +184,11 @@ def dephasing_channel(density_matrix, probability, target_qubit,
     qubit in the density_matrix.
 
     Args:
-        density_matrix (numpy.ndarray): Density matrix of the system
+        density_matrix (numpy.ndarray): Density matrix of the system, or a
+            stack of density matrices along the first axis.
         probability (float): Probability error is applied p \in [0, 1]
-        target_qubit (int): target for the channel error.
+        target_qubit (int or list): target for the channel error. If a
+            list is given, the channel is applied to each target in turn.
         transpose (bool): Conjugate transpose channel operators, useful for
             acting on Hamiltonians in variational channel state models
 
@@ -118,23 +196,12 @@ def dephasing_channel(density_matrix, probability, target_qubit,
         new_density_matrix (numpy.ndarray): Density matrix with the channel
             applied.
     """
-    _verify_channel_inputs(density_matrix, probability, target_qubit)
-    n_qubits = int(log2(density_matrix.shape[0]))
-
-    E0 = _lift_operator(sqrt(1.0 - probability/2.) * eye(2),
-                        n_qubits, target_qubit)
-    E1 = _lift_operator(sqrt(probability/2.) *
-                        array([[1.0, 0.0], [1.0, -1.0]]),
-                        n_qubits, target_qubit)
-
-    if transpose:
-        E0 = E0.T
-        E1 = E1.T
-
-    new_density_matrix = (dot(E0, dot(density_matrix, E0.T)) +
-                          dot(E1, dot(density_matrix, E1.T)))
+    target_qubits = _verify_channel_inputs(density_matrix, probability,
+                                           target_qubit)
 
-    return new_density_matrix
+    return _apply_channel(density_matrix,
+                          _dephasing_superoperator(probability, transpose),
+                          target_qubits)
 
 
 def depolarizing_channel(density_matrix, probability, target_qubit,
@@ -145,10 +212,13 @@ def depolarizing_channel(density_matrix, probability, target_qubit,
     qubit in the density_matrix.
 
     Args:
-        density_matrix (numpy.ndarray): Density matrix of the system
+        density_matrix (numpy.ndarray): Density matrix of the system, or a
+            stack of density matrices along the first axis.
         probability (float): Probability error is applied p \in [0, 1]
-        target_qubit (int/str): target for the channel error, if given special
-            value "all", then a total depolarizing channel is applied.
+        target_qubit (int/list/str): target for the channel error, if given
+            special value "all", then a total depolarizing channel is
+            applied. If a list is given, the channel is applied to each
+            target in turn.
         transpose (bool): Dummy parameter to match signature of other
             channels but depolarizing channel is symmetric under
             conjugate transpose.
@@ -157,33 +227,139 @@ def depolarizing_channel(density_matrix, probability, target_qubit,
         new_density_matrix (numpy.ndarray): Density matrix with the channel
             applied.
     """
-    n_qubits = int(log2(density_matrix.shape[0]))
-
     # Toggle depolarizing channel on all qubits
     if isinstance(target_qubit, str) and target_qubit.lower() == "all":
-        dimension = density_matrix.shape[0]
+        dimension = density_matrix.shape[-1]
         new_density_matrix = ((1.0 - probability) * density_matrix +
                               probability * eye(dimension) / float(dimension))
         return new_density_matrix
 
-    # For any other case, depolarize only the target qubit
-    _verify_channel_inputs(density_matrix, probability, target_qubit)
-
-    E0 = _lift_operator(sqrt(1.0 - probability) * eye(2),
-                        n_qubits, target_qubit)
-    E1 = _lift_operator(sqrt(probability / 3.) * array([[0.0, 1.0],
-                                                        [1.0, 0.0]]),
-                        n_qubits, target_qubit)
-    E2 = _lift_operator(sqrt(probability / 3.) * array([[0.0, -1.0j],
-                                                        [1.0j, 0.0]]),
-                        n_qubits, target_qubit)
-    E3 = _lift_operator(sqrt(probability / 3.) * array([[1.0, 0.0],
-                                                        [0.0, -1.0]]),
-                        n_qubits, target_qubit)
-
-    new_density_matrix = (dot(E0, dot(density_matrix, E0)) +
-                          dot(E1, dot(density_matrix, E1)) +
-                          dot(E2, dot(density_matrix, E2)) +
-                          dot(E3, dot(density_matrix, E3)))
+    # For any other case, depolarize only the target qubits
+    target_qubits = _verify_channel_inputs(density_matrix, probability,
+                                           target_qubit)
 
-    return new_density_matrix
+    return _apply_channel(density_matrix,
+                          _depolarizing_superoperator(probability),
+                          target_qubits)
+
+
+_CHANNEL_SUPEROPERATORS = {'amplitude_damping':
+                           _amplitude_damping_superoperator,
+                           'dephasing': _dephasing_superoperator,
+                           'depolarizing': _depolarizing_superoperator}
+
+
+class ChannelPipeline(object):
+    """A schedule of noise channels applied to density matrices
+
+    The schedule is a list of tuples (channel, probability, target_qubits),
+    where channel is 'amplitude_damping', 'dephasing' or 'depolarizing'
+    and target_qubits is an int or a list of ints. A depolarizing channel
+    may also target "all" qubits, as in depolarizing_channel.
+
+    Channels acting on different qubits commute, so all single qubit
+    channels on the same qubit are fused into one superoperator, up to the
+    next total depolarizing channel. Applying the schedule then costs one
+    contraction per qubit, performed in place with a single working buffer
+    which is kept between calls.
+
+    Attributes:
+        schedule (list): The schedule of channels.
+        transpose (bool): Whether the channel operators are transposed, as
+            in the channel functions.
+    """
+
+    def __init__(self, schedule, transpose=False):
+        """Initialize and fuse the schedule
+
+        Args:
+            schedule (list): Tuples (channel, probability, target_qubits).
+            transpose (bool): Conjugate transpose channel operators, useful
+                for acting on Hamiltonians in variational channel state
+                models
+
+        Raises:
+            ValueError: Unknown channel.
+            ValueError: Channel probability must be between 0 and 1.
+        """
+        self.schedule = list(schedule)
+        self.transpose = transpose
+        self._buffer = None
+
+        # Each step is either a dict of fused superoperators by qubit or
+        # the probability of a total depolarizing channel
+        self._steps = []
+        superoperators = {}
+        for channel, probability, target_qubits in self.schedule:
+            if channel not in _CHANNEL_SUPEROPERATORS:
+                raise ValueError("Unknown channel {}.".format(channel))
+            if (probability < 0) or (probability > 1):
+                raise ValueError(
+                    "Channel probability must be between 0 and 1.")
+
+            if (channel == 'depolarizing' and
+                    isinstance(target_qubits, str) and
+                    target_qubits.lower() == "all"):
+                if superoperators:
+                    self._steps.append(superoperators)
+                    superoperators = {}
+                self._steps.append(probability)
+                continue
+
+            superoperator = _CHANNEL_SUPEROPERATORS[channel](
+                probability, transpose).reshape(4, 4)
+            if not isinstance(target_qubits, (list, tuple)):
+                target_qubits = [target_qubits]
+            for qubit in target_qubits:
+                if qubit in superoperators:
+                    superoperators[qubit] = dot(superoperator,
+                                                superoperators[qubit])
+                else:
+                    superoperators[qubit] = superoperator
+        if superoperators:
+            self._steps.append(superoperators)
+
+    def apply(self, density_matrix):
+        """Apply the schedule to a density matrix
+
+        Args:
+            density_matrix (numpy.ndarray): Density matrix of the system,
+                or a stack of density matrices along the first axis.
+
+        Returns:
+            new_density_matrix (numpy.ndarray): Density matrix with the
+                channels applied.
+
+        Raises:
+            ValueError: Error in input of density matrix to channel.
+            ValueError: Target qubits must be within number of qubits.
+        """
+        target_qubits = set()
+        for step in self._steps:
+            if isinstance(step, dict):
+                target_qubits.update(step)
+        _verify_channel_inputs(density_matrix, 0., sorted(target_qubits))
+
+        dtype = result_type(density_matrix, complex)
+        new_density_matrix = array(density_matrix, dtype=dtype)
+        buffer = self._buffer
+        if (buffer is None or buffer.shape != density_matrix.shape or
+                buffer.dtype != dtype):
+            buffer = empty(density_matrix.shape, dtype=dtype)
+
+        dimension = density_matrix.shape[-1]
+        for step in self._steps:
+            if isinstance(step, dict):
+                for qubit in sorted(step):
+                    _apply_local_superoperator(
+                        new_density_matrix, step[qubit].reshape(2, 2, 2, 2),
+                        qubit, out=buffer)
+                    new_density_matrix, buffer = buffer, new_density_matrix
+            else:
+                new_density_matrix *= 1.0 - step
+                for matrix in new_density_matrix.reshape(-1, dimension,
+                                                         dimension):
+                    matrix.flat[::dimension + 1] += step / float(dimension)
+
+        self._buffer = buffer
+        return new_density_matrix
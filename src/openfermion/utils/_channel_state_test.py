@@ -12,7 +12,7 @@
 
 from __future__ import absolute_import
 
-from numpy import dot, zeros
+from numpy import array, dot, eye, kron, sqrt, zeros
 from scipy.linalg import norm
 
 import unittest
@@ -143,6 +143,71 @@ class ChannelTest(unittest.TestCase):
         self.assertAlmostEquals(norm(correct_density_matrix -
                                      test_density_matrix), 0.0, places=6)
 
+    def test_batch(self):
+        """Test applying channels to several qubits and density matrices"""
+        density_matrices = array([self.density_matrix, self.cat_matrix])
+        for channel in (amplitude_damping_channel, dephasing_channel,
+                        depolarizing_channel):
+            test_density_matrices = channel(density_matrices, 0.3, [0, 1])
+            for density_matrix, test_density_matrix in zip(
+                    density_matrices, test_density_matrices):
+                correct_density_matrix = channel(
+                    channel(density_matrix, 0.3, 0), 0.3, 1)
+                self.assertAlmostEquals(norm(correct_density_matrix -
+                                             test_density_matrix), 0.0)
+
+        # Total depolarization acts on each density matrix
+        test_density_matrices = depolarizing_channel(density_matrices, 1,
+                                                     'All')
+        for test_density_matrix in test_density_matrices:
+            self.assertAlmostEquals(norm(eye(4) / 4.0 -
+                                         test_density_matrix), 0.0)
+
+    def test_pipeline(self):
+        """Test that a pipeline matches applying its channels in turn"""
+        schedule = [('amplitude_damping', 0.3, 1),
+                    ('dephasing', 0.2, [0, 1]),
+                    ('depolarizing', 0.4, 0),
+                    ('amplitude_damping', 0.5, [1, 0]),
+                    ('depolarizing', 0.1, 'all'),
+                    ('dephasing', 0.6, 1)]
+        channels = {'amplitude_damping': amplitude_damping_channel,
+                    'dephasing': dephasing_channel,
+                    'depolarizing': depolarizing_channel}
+        for transpose in (False, True):
+            pipeline = ChannelPipeline(schedule, transpose=transpose)
+            for density_matrix in (self.density_matrix, self.cat_matrix):
+                correct_density_matrix = density_matrix
+                for channel, probability, target_qubits in schedule:
+                    correct_density_matrix = channels[channel](
+                        correct_density_matrix, probability, target_qubits,
+                        transpose)
+                test_density_matrix = pipeline.apply(density_matrix)
+                self.assertAlmostEquals(norm(correct_density_matrix -
+                                             test_density_matrix), 0.0)
+
+                # A stack of density matrices
+                test_density_matrices = pipeline.apply(
+                    array([density_matrix, density_matrix]))
+                for test_density_matrix in test_density_matrices:
+                    self.assertAlmostEquals(norm(correct_density_matrix -
+                                                 test_density_matrix), 0.0)
+
+    def test_pipeline_fuses_channels(self):
+        """Test that channels on the same qubit are fused"""
+        pipeline = ChannelPipeline([('dephasing', 0.2, 0),
+                                    ('amplitude_damping', 0.3, 1),
+                                    ('depolarizing', 0.4, 0)])
+        self.assertEqual(len(pipeline._steps), 1)
+        self.assertEqual(sorted(pipeline._steps[0]), [0, 1])
+
+        # The input is left untouched and results are not overwritten
+        density_matrix = self.cat_matrix.copy()
+        first_result = pipeline.apply(density_matrix)
+        second_result = pipeline.apply(density_matrix)
+        self.assertAlmostEquals(norm(self.cat_matrix - density_matrix), 0.0)
+        self.assertAlmostEquals(norm(first_result - second_result), 0.0)
+
     def test_verification(self):
         """Verify basic sanity checking on inputs"""
         with self.assertRaises(ValueError):
@@ -154,3 +219,16 @@ class ChannelTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             bad_density = zeros((3, 4))
             _ = amplitude_damping_channel(bad_density, 0.5, 3)
+
+        with self.assertRaises(ValueError):
+            _ = dephasing_channel(self.density_matrix, 0.5, [0, 2])
+
+        with self.assertRaises(ValueError):
+            _ = ChannelPipeline([('bit_flip', 0.5, 0)])
+
+        with self.assertRaises(ValueError):
+            _ = ChannelPipeline([('dephasing', 1.5, 0)])
+
+        with self.assertRaises(ValueError):
+            _ = ChannelPipeline([('dephasing', 0.5, 2)]).apply(
+                self.density_matrix)
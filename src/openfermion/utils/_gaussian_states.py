@@ -0,0 +1,405 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Simulation of fermionic Gaussian states by their correlation matrices.
+
+A Gaussian state on n modes is determined by its quadratic expectation
+values, so it can be simulated in polynomial time. A state which conserves
+particle number is stored as its n x n one-body correlation matrix::
+
+    Q_{pq} = <a^\dagger_p a_q>.
+
+A general state is stored as its (2 * n) x (2 * n) real antisymmetric
+covariance matrix::
+
+    Gamma_{jk} = i <[gamma_j, gamma_k]>,
+
+where the gamma_j are the Majorana operators in the order used by
+QuadraticHamiltonian.majorana_form: gamma_j = (a^\dagger_j + a_j) / sqrt(2)
+and gamma_{n + j} = i (a^\dagger_j - a_j) / sqrt(2).
+"""
+from __future__ import absolute_import
+
+import numpy
+from scipy.linalg import expm
+
+from openfermion.config import EQ_TOLERANCE
+from openfermion.ops import PolynomialTensor, QuadraticHamiltonian
+from openfermion.ops._quadratic_hamiltonian import _majorana_basis_change
+
+
+def gaussian_correlation_matrix(quadratic_hamiltonian,
+                                occupied_orbitals=None):
+    """Compute the correlation matrix of an eigenstate of a quadratic
+    Hamiltonian that conserves particle number.
+
+    Args:
+        quadratic_hamiltonian(QuadraticHamiltonian):
+            The Hamiltonian whose eigenstate is desired.
+        occupied_orbitals(list):
+            A list of integers representing the indices of the occupied
+            orbitals in the desired Gaussian state. If this is None
+            (the default), then it is assumed that the ground state is
+            desired, i.e., the orbitals with negative energies are filled.
+
+    Returns:
+        correlation_matrix(ndarray): The n_qubits x n_qubits matrix Q with
+            Q_{pq} = <a^\dagger_p a_q>.
+
+    Raises:
+        ValueError: Input must be an instance of QuadraticHamiltonian.
+        ValueError: Hamiltonian must conserve particle number.
+    """
+    _check_quadratic_hamiltonian(quadratic_hamiltonian, True)
+    orbital_energies, constant = quadratic_hamiltonian.orbital_energies()
+    if occupied_orbitals is None:
+        occupied_orbitals = numpy.flatnonzero(
+                orbital_energies < -EQ_TOLERANCE)
+
+    # a_p = sum_j U_{pj} b_j, where b_j annihilates orbital j
+    diagonalizing_unitary = quadratic_hamiltonian.diagonalizing_unitary()
+    occupied = diagonalizing_unitary[:, list(occupied_orbitals)]
+    return occupied.conj().dot(occupied.T)
+
+
+def gaussian_covariance_matrix(quadratic_hamiltonian,
+                               occupied_orbitals=None):
+    """Compute the covariance matrix of an eigenstate of a quadratic
+    Hamiltonian.
+
+    Args:
+        quadratic_hamiltonian(QuadraticHamiltonian):
+            The Hamiltonian whose eigenstate is desired.
+        occupied_orbitals(list):
+            A list of integers representing the indices of the occupied
+            orbitals in the desired Gaussian state. If this is None
+            (the default), then it is assumed that the ground state is
+            desired. Orbitals are numbered as in
+            QuadraticHamiltonian.orbital_energies.
+
+    Returns:
+        covariance_matrix(ndarray): The (2 * n_qubits) x (2 * n_qubits)
+            real antisymmetric matrix Gamma.
+
+    Raises:
+        ValueError: Input must be an instance of QuadraticHamiltonian.
+    """
+    _check_quadratic_hamiltonian(quadratic_hamiltonian, False)
+    n_qubits = quadratic_hamiltonian.n_qubits
+    orbital_energies, constant = quadratic_hamiltonian.orbital_energies()
+    if occupied_orbitals is None:
+        if quadratic_hamiltonian.conserves_particle_number:
+            occupied_orbitals = numpy.flatnonzero(
+                    orbital_energies < -EQ_TOLERANCE)
+        else:
+            occupied_orbitals = []
+
+    # Express the orbitals in the Majorana basis
+    if quadratic_hamiltonian.conserves_particle_number:
+        diagonalizing_unitary = numpy.zeros((2 * n_qubits, 2 * n_qubits),
+                                            dtype=complex)
+        unitary = quadratic_hamiltonian.diagonalizing_unitary()
+        diagonalizing_unitary[:n_qubits, :n_qubits] = unitary.T
+        diagonalizing_unitary[n_qubits:, n_qubits:] = unitary.T.conj()
+    else:
+        diagonalizing_unitary = quadratic_hamiltonian.diagonalizing_unitary()
+    basis_change = _majorana_basis_change(n_qubits)
+    orthogonal = basis_change.dot(diagonalizing_unitary).dot(
+            basis_change.T.conj()).real
+
+    covariance_matrix = _basis_state_covariance_matrix(occupied_orbitals,
+                                                       n_qubits)
+    return orthogonal.T.dot(covariance_matrix).dot(orthogonal)
+
+
+def evolve_correlation_matrix(correlation_matrix, quadratic_hamiltonian,
+                              time):
+    """Evolve a correlation matrix in time under a quadratic Hamiltonian
+    that conserves particle number.
+
+    Args:
+        correlation_matrix(ndarray): The correlation matrix of the state.
+        quadratic_hamiltonian(QuadraticHamiltonian): The Hamiltonian H.
+        time(float): The evolution time t; the state evolves by
+            exp(-i H t).
+
+    Returns:
+        correlation_matrix(ndarray): The evolved correlation matrix.
+
+    Raises:
+        ValueError: Input must be an instance of QuadraticHamiltonian.
+        ValueError: Hamiltonian must conserve particle number.
+    """
+    _check_quadratic_hamiltonian(quadratic_hamiltonian, True)
+    _check_matrix(correlation_matrix, quadratic_hamiltonian.n_qubits)
+
+    # Heisenberg picture: a_p -> sum_q V_{pq} a_q with V = exp(-i M t)
+    orbital_energies, constant = quadratic_hamiltonian.orbital_energies()
+    unitary = quadratic_hamiltonian.diagonalizing_unitary()
+    propagator = (unitary * numpy.exp(-1.j * orbital_energies * time)).dot(
+            unitary.T.conj())
+    return propagator.conj().dot(correlation_matrix).dot(propagator.T)
+
+
+def evolve_covariance_matrix(covariance_matrix, quadratic_hamiltonian, time):
+    """Evolve a covariance matrix in time under a quadratic Hamiltonian.
+
+    Args:
+        covariance_matrix(ndarray): The covariance matrix of the state.
+        quadratic_hamiltonian(QuadraticHamiltonian): The Hamiltonian H.
+        time(float): The evolution time t; the state evolves by
+            exp(-i H t).
+
+    Returns:
+        covariance_matrix(ndarray): The evolved covariance matrix.
+
+    Raises:
+        ValueError: Input must be an instance of QuadraticHamiltonian.
+    """
+    _check_quadratic_hamiltonian(quadratic_hamiltonian, False)
+    _check_matrix(covariance_matrix, 2 * quadratic_hamiltonian.n_qubits)
+
+    # Heisenberg picture: gamma -> exp(A t) gamma
+    majorana_matrix, majorana_constant = quadratic_hamiltonian.majorana_form()
+    orthogonal = expm(majorana_matrix * time)
+    return orthogonal.dot(covariance_matrix).dot(orthogonal.T)
+
+
+def rotate_correlation_matrix(correlation_matrix, circuit_description):
+    """Apply layers of Givens rotations to a correlation matrix.
+
+    Args:
+        correlation_matrix(ndarray): The correlation matrix of the state.
+        circuit_description(list): A list of tuples of Givens rotations
+            (i, j, theta, phi) of disjoint pairs of adjacent modes, as
+            returned by gaussian_state_preparation_circuit for a
+            Hamiltonian that conserves particle number. The tuples are
+            applied in order.
+
+    Returns:
+        correlation_matrix(ndarray): The transformed correlation matrix.
+
+    Raises:
+        ValueError: Particle-hole transformations do not conserve
+            particle number.
+    """
+    n_modes = correlation_matrix.shape[0]
+    _check_matrix(correlation_matrix, n_modes)
+    correlation_matrix = numpy.array(correlation_matrix, dtype=complex)
+    for parallel_ops in circuit_description:
+        if 'pht' in parallel_ops:
+            raise ValueError('Particle-hole transformations can only be '
+                             'applied to a covariance matrix.')
+        if not parallel_ops:
+            continue
+        modes, rotations = _givens_rotation_matrices(parallel_ops, n_modes)
+        _rotate(correlation_matrix, modes, rotations)
+    return correlation_matrix
+
+
+def rotate_covariance_matrix(covariance_matrix, circuit_description):
+    """Apply layers of Givens rotations and particle-hole transformations
+    on the last mode to a covariance matrix.
+
+    Args:
+        covariance_matrix(ndarray): The covariance matrix of the state.
+        circuit_description(list): A list of tuples of Givens rotations
+            (i, j, theta, phi) of disjoint pairs of adjacent modes and the
+            string 'pht', as returned by gaussian_state_preparation_circuit.
+            The tuples are applied in order.
+
+    Returns:
+        covariance_matrix(ndarray): The transformed covariance matrix.
+    """
+    n_modes = covariance_matrix.shape[0] // 2
+    _check_matrix(covariance_matrix, 2 * n_modes)
+    covariance_matrix = numpy.array(covariance_matrix, dtype=float)
+    for parallel_ops in circuit_description:
+        # Apply each run of rotations at once, keeping the order of the
+        # particle-hole transformations
+        givens_rotations = []
+        for op in tuple(parallel_ops) + (None,):
+            if op is not None and op != 'pht':
+                givens_rotations.append(op)
+                continue
+            if givens_rotations:
+                modes, rotations = _givens_rotation_matrices(
+                        givens_rotations, n_modes)
+                _rotate(covariance_matrix,
+                        numpy.concatenate([modes, modes + n_modes], axis=1),
+                        _majorana_rotation_matrices(rotations))
+                givens_rotations = []
+            if op == 'pht':
+                # Exchanging a_{n - 1} and a^\dagger_{n - 1} negates
+                # gamma_{2 n - 1}
+                covariance_matrix[2 * n_modes - 1] *= -1.
+                covariance_matrix[:, 2 * n_modes - 1] *= -1.
+    return covariance_matrix
+
+
+def correlation_matrix_expectation(operator, correlation_matrix):
+    """Compute the expectation value of an operator in a Gaussian state
+    with the given correlation matrix by Wick's theorem.
+
+    Args:
+        operator(PolynomialTensor): An operator with terms of the form
+            a^\dagger_p a_q, a^\dagger_p a^\dagger_q, a_p a_q and
+            a^\dagger_p a^\dagger_q a_r a_s, such as an InteractionOperator
+            or a QuadraticHamiltonian.
+        correlation_matrix(ndarray): The correlation matrix of the state.
+
+    Returns:
+        expectation(complex): The expectation value.
+    """
+    _check_matrix(correlation_matrix, correlation_matrix.shape[0])
+    return _wick_expectation(operator, correlation_matrix, None)
+
+
+def covariance_matrix_expectation(operator, covariance_matrix):
+    """Compute the expectation value of an operator in a Gaussian state
+    with the given covariance matrix by Wick's theorem.
+
+    Args:
+        operator(PolynomialTensor): An operator with terms of the form
+            a^\dagger_p a_q, a^\dagger_p a^\dagger_q, a_p a_q and
+            a^\dagger_p a^\dagger_q a_r a_s, such as an InteractionOperator
+            or a QuadraticHamiltonian.
+        covariance_matrix(ndarray): The covariance matrix of the state.
+
+    Returns:
+        expectation(complex): The expectation value.
+    """
+    n_modes = covariance_matrix.shape[0] // 2
+    _check_matrix(covariance_matrix, 2 * n_modes)
+
+    # <gamma_j gamma_k> = (delta_{jk} - i Gamma_{jk}) / 2
+    majorana_correlations = (numpy.eye(2 * n_modes) -
+                             1.j * covariance_matrix) / 2.
+    x_x = majorana_correlations[:n_modes, :n_modes]
+    x_y = majorana_correlations[:n_modes, n_modes:]
+    y_x = majorana_correlations[n_modes:, :n_modes]
+    y_y = majorana_correlations[n_modes:, n_modes:]
+    correlation_matrix = (x_x + 1.j * x_y - 1.j * y_x + y_y) / 2.
+    pairing_matrix = (x_x + 1.j * x_y + 1.j * y_x - y_y) / 2.
+    return _wick_expectation(operator, correlation_matrix, pairing_matrix)
+
+
+def _wick_expectation(operator, correlation_matrix, pairing_matrix):
+    """Compute an expectation value from the correlation matrix
+    <a^\dagger_p a_q> and the pairing matrix <a_p a_q>, which is zero if
+    pairing_matrix is None."""
+    if not isinstance(operator, PolynomialTensor):
+        raise ValueError('Operator must be a PolynomialTensor.')
+    n_modes = correlation_matrix.shape[0]
+    if operator.n_qubits != n_modes:
+        raise ValueError('Operator acts on {} modes but the state has '
+                         '{}.'.format(operator.n_qubits, n_modes))
+
+    expectation = 0.
+    for key, tensor in operator.n_body_tensors.items():
+        if key == ():
+            expectation += tensor
+        elif key == (1, 0):
+            expectation += numpy.sum(tensor * correlation_matrix)
+        elif key == (1, 1):
+            if pairing_matrix is not None:
+                expectation += numpy.sum(tensor * pairing_matrix.T.conj())
+        elif key == (0, 0):
+            if pairing_matrix is not None:
+                expectation += numpy.sum(tensor * pairing_matrix)
+        elif key == (1, 1, 0, 0):
+            # <p^ q^ r s> = <p^ q^> <r s> - <p^ r> <q^ s> + <p^ s> <q^ r>
+            expectation += (
+                numpy.einsum('pqrs,ps,qr', tensor, correlation_matrix,
+                             correlation_matrix, optimize=True) -
+                numpy.einsum('pqrs,pr,qs', tensor, correlation_matrix,
+                             correlation_matrix, optimize=True))
+            if pairing_matrix is not None:
+                expectation += numpy.einsum(
+                    'pqrs,qp,rs', tensor, pairing_matrix.conj(),
+                    pairing_matrix, optimize=True)
+        else:
+            raise ValueError('Terms of the form {} are not '
+                             'supported.'.format(key))
+    return expectation
+
+
+def _check_quadratic_hamiltonian(quadratic_hamiltonian,
+                                 conserves_particle_number):
+    """Check that the input is a QuadraticHamiltonian which conserves
+    particle number if required."""
+    if not isinstance(quadratic_hamiltonian, QuadraticHamiltonian):
+        raise ValueError('Input must be an instance of QuadraticHamiltonian.')
+    if (conserves_particle_number and
+            not quadratic_hamiltonian.conserves_particle_number):
+        raise ValueError('Hamiltonian must conserve particle number.')
+
+
+def _check_matrix(matrix, dimension):
+    """Check that a correlation or covariance matrix has the right shape."""
+    if matrix.shape != (dimension, dimension):
+        raise ValueError('Expected a {0} x {0} matrix.'.format(dimension))
+
+
+def _basis_state_covariance_matrix(occupied_orbitals, n_modes):
+    """Return the covariance matrix of a computational basis state."""
+    occupations = numpy.zeros(n_modes)
+    occupations[list(occupied_orbitals)] = 1.
+    covariance_matrix = numpy.zeros((2 * n_modes, 2 * n_modes))
+    covariance_matrix[range(n_modes), range(n_modes, 2 * n_modes)] = (
+            2. * occupations - 1.)
+    covariance_matrix[range(n_modes, 2 * n_modes), range(n_modes)] = (
+            1. - 2. * occupations)
+    return covariance_matrix
+
+
+def _givens_rotation_matrices(givens_rotations, n_modes):
+    """Return the modes of Givens rotations (i, j, theta, phi) and the
+    2 x 2 matrices T with U a^\dagger_p U^\dagger = sum_q T_{pq}
+    a^\dagger_q, where U is the rotation of jw_sparse_givens_rotation."""
+    modes = numpy.array([op[:2] for op in givens_rotations], dtype=int)
+    if numpy.any(modes[:, 1] != modes[:, 0] + 1):
+        raise ValueError('Only adjacent modes can be rotated.')
+    if numpy.any(modes[:, 1] > n_modes - 1):
+        raise ValueError('Too few modes.')
+
+    theta, phi = numpy.array([op[2:] for op in givens_rotations]).T
+    cosine = numpy.cos(theta)
+    sine = numpy.sin(theta)
+    phase = numpy.exp(1.j * phi)
+    rotations = numpy.empty((len(givens_rotations), 2, 2), dtype=complex)
+    rotations[:, 0, 0] = cosine
+    rotations[:, 0, 1] = -phase * sine
+    rotations[:, 1, 0] = sine
+    rotations[:, 1, 1] = phase * cosine
+    return modes, rotations
+
+
+def _majorana_rotation_matrices(rotations):
+    """Express transformations of the ladder operators by the matrices T of
+    _givens_rotation_matrices as orthogonal transformations of the
+    Majorana operators."""
+    real = rotations.real
+    imaginary = rotations.imag
+    return numpy.concatenate([
+        numpy.concatenate([real, imaginary], axis=2),
+        numpy.concatenate([-imaginary, real], axis=2)], axis=1)
+
+
+def _rotate(matrix, indices, blocks):
+    """Replace matrix by B^\dagger matrix B in place, where B acts on each
+    row of indices by the corresponding block and as the identity
+    elsewhere."""
+    columns = matrix[:, indices].transpose(1, 0, 2)
+    matrix[:, indices] = numpy.matmul(columns, blocks).transpose(1, 0, 2)
+    matrix[indices] = numpy.matmul(blocks.conj().transpose(0, 2, 1),
+                                   matrix[indices])
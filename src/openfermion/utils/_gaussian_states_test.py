@@ -0,0 +1,207 @@
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Tests for _gaussian_states.py."""
+from __future__ import absolute_import
+
+import numpy
+import unittest
+from scipy.sparse.linalg import expm_multiply
+
+from openfermion.ops import FermionOperator, InteractionOperator
+from openfermion.ops._quadratic_hamiltonian import majorana_operator
+from openfermion.transforms import get_sparse_operator
+from openfermion.utils import (correlation_matrix_expectation,
+                               covariance_matrix_expectation,
+                               evolve_correlation_matrix,
+                               evolve_covariance_matrix,
+                               gaussian_correlation_matrix,
+                               gaussian_covariance_matrix,
+                               gaussian_state_preparation_circuit,
+                               jw_get_gaussian_state,
+                               rotate_correlation_matrix,
+                               rotate_covariance_matrix)
+from openfermion.utils._gaussian_states import _basis_state_covariance_matrix
+from openfermion.utils._slater_determinants_test import (
+        random_quadratic_hamiltonian)
+
+
+def state_correlation_matrix(state, n_modes):
+    """Compute the correlation matrix of a wavefunction."""
+    correlation_matrix = numpy.zeros((n_modes, n_modes), dtype=complex)
+    for p, q in numpy.ndindex(correlation_matrix.shape):
+        operator = get_sparse_operator(FermionOperator(((p, 1), (q, 0))),
+                                       n_modes)
+        correlation_matrix[p, q] = state.conj().dot(operator.dot(state))
+    return correlation_matrix
+
+
+def state_covariance_matrix(state, n_modes):
+    """Compute the covariance matrix of a wavefunction."""
+    majoranas = ([majorana_operator((p, 1)) for p in range(n_modes)] +
+                 [majorana_operator((p, 0)) for p in range(n_modes)])
+    covariance_matrix = numpy.zeros((2 * n_modes, 2 * n_modes))
+    for j, k in numpy.ndindex(covariance_matrix.shape):
+        commutator = get_sparse_operator(
+            majoranas[j] * majoranas[k] - majoranas[k] * majoranas[j],
+            n_modes)
+        covariance_matrix[j, k] = (
+            1.j * state.conj().dot(commutator.dot(state))).real
+    return covariance_matrix
+
+
+def random_interaction_operator(n_modes):
+    """Generate a random InteractionOperator which need not be Hermitian."""
+    return InteractionOperator(
+        numpy.random.randn(),
+        numpy.random.randn(n_modes, n_modes) +
+        1.j * numpy.random.randn(n_modes, n_modes),
+        numpy.random.randn(n_modes, n_modes, n_modes, n_modes) +
+        1.j * numpy.random.randn(n_modes, n_modes, n_modes, n_modes))
+
+
+class GaussianStatesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.n_modes = 4
+        self.quad_ham_pc = random_quadratic_hamiltonian(
+            self.n_modes, conserves_particle_number=True)
+        self.quad_ham_npc = random_quadratic_hamiltonian(self.n_modes)
+        self.occupied_orbitals = [0, 2]
+
+    def test_gaussian_correlation_matrix(self):
+        for occupied_orbitals in [None, self.occupied_orbitals]:
+            energy, state = jw_get_gaussian_state(self.quad_ham_pc,
+                                                  occupied_orbitals)
+            state = state.toarray().ravel()
+            correlation_matrix = gaussian_correlation_matrix(
+                self.quad_ham_pc, occupied_orbitals)
+            self.assertTrue(numpy.allclose(
+                correlation_matrix,
+                state_correlation_matrix(state, self.n_modes)))
+            self.assertAlmostEqual(energy, correlation_matrix_expectation(
+                self.quad_ham_pc, correlation_matrix))
+
+    def test_gaussian_covariance_matrix(self):
+        for quadratic_hamiltonian in [self.quad_ham_pc, self.quad_ham_npc]:
+            for occupied_orbitals in [None, self.occupied_orbitals]:
+                energy, state = jw_get_gaussian_state(quadratic_hamiltonian,
+                                                      occupied_orbitals)
+                state = state.toarray().ravel()
+                covariance_matrix = gaussian_covariance_matrix(
+                    quadratic_hamiltonian, occupied_orbitals)
+                self.assertTrue(numpy.allclose(
+                    covariance_matrix,
+                    state_covariance_matrix(state, self.n_modes)))
+                self.assertAlmostEqual(energy, covariance_matrix_expectation(
+                    quadratic_hamiltonian, covariance_matrix))
+
+    def test_interaction_operator_expectation(self):
+        operator = random_interaction_operator(self.n_modes)
+        sparse_operator = get_sparse_operator(operator)
+
+        energy, state = jw_get_gaussian_state(self.quad_ham_pc,
+                                              self.occupied_orbitals)
+        state = state.toarray().ravel()
+        self.assertAlmostEqual(
+            state.conj().dot(sparse_operator.dot(state)),
+            correlation_matrix_expectation(
+                operator, gaussian_correlation_matrix(
+                    self.quad_ham_pc, self.occupied_orbitals)))
+
+        energy, state = jw_get_gaussian_state(self.quad_ham_npc,
+                                              self.occupied_orbitals)
+        state = state.toarray().ravel()
+        self.assertAlmostEqual(
+            state.conj().dot(sparse_operator.dot(state)),
+            covariance_matrix_expectation(
+                operator, gaussian_covariance_matrix(
+                    self.quad_ham_npc, self.occupied_orbitals)))
+
+    def test_evolution(self):
+        # Evolve an eigenstate of one Hamiltonian under another
+        time = .7
+        quad_ham = random_quadratic_hamiltonian(
+            self.n_modes, conserves_particle_number=True)
+        energy, state = jw_get_gaussian_state(quad_ham,
+                                              self.occupied_orbitals)
+        state = state.toarray().ravel()
+        evolved_state = expm_multiply(
+            -1.j * time * get_sparse_operator(self.quad_ham_pc), state)
+        self.assertTrue(numpy.allclose(
+            evolve_correlation_matrix(
+                gaussian_correlation_matrix(quad_ham, self.occupied_orbitals),
+                self.quad_ham_pc, time),
+            state_correlation_matrix(evolved_state, self.n_modes)))
+
+        energy, state = jw_get_gaussian_state(self.quad_ham_npc)
+        state = state.toarray().ravel()
+        evolved_state = expm_multiply(
+            -1.j * time * get_sparse_operator(quad_ham), state)
+        self.assertTrue(numpy.allclose(
+            evolve_covariance_matrix(
+                gaussian_covariance_matrix(self.quad_ham_npc), quad_ham,
+                time),
+            state_covariance_matrix(evolved_state, self.n_modes)))
+
+    def test_rotate_correlation_matrix(self):
+        circuit_description, start_orbitals = (
+            gaussian_state_preparation_circuit(self.quad_ham_pc,
+                                               self.occupied_orbitals))
+        start = numpy.zeros(self.n_modes)
+        start[list(start_orbitals)] = 1.
+        self.assertTrue(numpy.allclose(
+            rotate_correlation_matrix(numpy.diag(start), circuit_description),
+            gaussian_correlation_matrix(self.quad_ham_pc,
+                                        self.occupied_orbitals)))
+
+    def test_rotate_covariance_matrix(self):
+        for quadratic_hamiltonian in [self.quad_ham_pc, self.quad_ham_npc]:
+            for occupied_orbitals in [None, self.occupied_orbitals]:
+                circuit_description, start_orbitals = (
+                    gaussian_state_preparation_circuit(quadratic_hamiltonian,
+                                                       occupied_orbitals))
+                start = _basis_state_covariance_matrix(start_orbitals,
+                                                       self.n_modes)
+                self.assertTrue(numpy.allclose(
+                    rotate_covariance_matrix(start, circuit_description),
+                    gaussian_covariance_matrix(quadratic_hamiltonian,
+                                               occupied_orbitals)))
+
+    def test_bad_input(self):
+        correlation_matrix = numpy.eye(self.n_modes)
+        covariance_matrix = _basis_state_covariance_matrix([], self.n_modes)
+        with self.assertRaises(ValueError):
+            gaussian_correlation_matrix(FermionOperator('0^ 0'))
+        with self.assertRaises(ValueError):
+            gaussian_correlation_matrix(self.quad_ham_npc)
+        with self.assertRaises(ValueError):
+            evolve_correlation_matrix(correlation_matrix, self.quad_ham_npc,
+                                      1.)
+        with self.assertRaises(ValueError):
+            evolve_covariance_matrix(correlation_matrix, self.quad_ham_npc,
+                                     1.)
+        with self.assertRaises(ValueError):
+            rotate_correlation_matrix(correlation_matrix, [('pht',)])
+        with self.assertRaises(ValueError):
+            rotate_covariance_matrix(covariance_matrix, [((0, 2, 1., 1.),)])
+        with self.assertRaises(ValueError):
+            rotate_covariance_matrix(covariance_matrix,
+                                     [((self.n_modes - 1, self.n_modes,
+                                        1., 1.),)])
+        with self.assertRaises(ValueError):
+            correlation_matrix_expectation(FermionOperator('0^ 0'),
+                                           correlation_matrix)
+        with self.assertRaises(ValueError):
+            covariance_matrix_expectation(
+                random_interaction_operator(self.n_modes + 1),
+                covariance_matrix)
@@ -16,7 +16,9 @@ from __future__ import absolute_import
 import marshal
 import numpy
 import os
+import struct
 import time
+import zipfile
 
 from openfermion.config import *
 from openfermion.hamiltonians._jellium import (grid_indices,
@@ -238,22 +240,106 @@ def inverse_fourier_transform(hamiltonian, grid, spinless):
                                      vec_func_2=momentum_vector)
 
 
-def load_operator(file_name=None, data_directory=None):
-    """Load FermionOperator or QubitOperator from file.
+# Version of the binary format written by save_operator.
+_OPERATOR_FILE_VERSION = 1
+
+# Version of files holding a SparseTensor, which older releases cannot read.
+_SPARSE_OPERATOR_FILE_VERSION = 2
+
+# Integer codes of the Pauli operators in the binary format.
+_PAULI_CODES = {'X': 1, 'Y': 2, 'Z': 3}
+_PAULI_LETTERS = numpy.array(['I', 'X', 'Y', 'Z'])
+
+
+def _pack_terms(terms):
+    """Convert the terms of a FermionOperator or QubitOperator to arrays.
 
     Args:
-        file_name: The name of the saved file.
-        data_directory: Optional data directory to change from default data
-                        directory specified in config file.
+        terms(dict): The terms dictionary of an operator.
 
     Returns:
-        operator: The stored FermionOperator or QubitOperator
+        arrays(dict): The 'term_offsets', 'modes', 'actions' and
+            'coefficients' arrays describing the terms.
+    """
+    terms = list(terms.items())
+    factors = [factor for term, coefficient in terms for factor in term]
+    actions = [_PAULI_CODES.get(action, action) for mode, action in factors]
+    return {'term_offsets': numpy.cumsum(
+                [0] + [len(term) for term, coefficient in terms],
+                dtype=numpy.int64),
+            'modes': numpy.array([mode for mode, action in factors],
+                                 dtype=numpy.int64),
+            'actions': numpy.array(actions, dtype=numpy.int8),
+            'coefficients': numpy.array(
+                [coefficient for term, coefficient in terms], dtype=complex)}
+
+
+def _unpack_terms(operator_type, arrays):
+    """Build a FermionOperator or QubitOperator from the arrays of its terms.
 
-    Raises:
-        TypeError: Operator of invalid type.
+    Args:
+        operator_type(str): Either 'FermionOperator' or 'QubitOperator'.
+        arrays(dict): The arrays returned by _pack_terms.
+
+    Returns:
+        operator: The FermionOperator or QubitOperator.
     """
-    file_path = get_file_path(file_name, data_directory)
+    if operator_type == 'FermionOperator':
+        operator_class = FermionOperator
+        actions = arrays['actions'].tolist()
+    else:
+        operator_class = QubitOperator
+        actions = _PAULI_LETTERS[arrays['actions']].tolist()
+    factors = list(zip(arrays['modes'].tolist(), actions))
+    offsets = arrays['term_offsets'].tolist()
+    terms = [tuple(factors[start:end]) for
+             start, end in zip(offsets[:-1], offsets[1:])]
+    return operator_class.from_terms(terms, arrays['coefficients'],
+                                     validate=False)
+
+
+def _memory_map_npz(file_path, mmap_mode):
+    """Memory-map the arrays of an uncompressed .npz archive.
 
+    Args:
+        file_path(str): Path of an archive written with numpy.savez.
+        mmap_mode(str): Mode passed to numpy.memmap, e.g. 'r' or 'c'.
+
+    Returns:
+        arrays(dict): Maps the name of each array to its memory map.
+    """
+    arrays = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, 'rb') as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise OperatorUtilsError(
+                    'Cannot memory-map compressed array {}.'.format(
+                        info.filename))
+
+            # Skip the local file header to reach the .npy data.
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack('<HH', f.read(4))
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = numpy.lib.format.read_magic(f)
+            if version == (1, 0):
+                header = numpy.lib.format.read_array_header_1_0(f)
+            else:
+                header = numpy.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+
+            name = info.filename[:-4]
+            if numpy.prod(shape) == 0:
+                arrays[name] = numpy.zeros(shape, dtype)
+            else:
+                arrays[name] = numpy.memmap(
+                    file_path, dtype=dtype, mode=mmap_mode,
+                    offset=f.tell(), shape=shape,
+                    order='F' if fortran_order else 'C')
+    return arrays
+
+
+def _load_marshal_operator(file_path):
+    """Load an operator stored in the legacy marshal format."""
     with open(file_path, 'rb') as f:
         data = marshal.load(f)
         operator_type = data[0]
@@ -261,12 +347,100 @@ def load_operator(file_name=None, data_directory=None):
 
     if operator_type == 'FermionOperator':
         operator = FermionOperator()
-        for term in operator_terms:
-            operator += FermionOperator(term, operator_terms[term])
     elif operator_type == 'QubitOperator':
         operator = QubitOperator()
-        for term in operator_terms:
-            operator += QubitOperator(term, operator_terms[term])
+    else:
+        raise TypeError('Operator of invalid type.')
+    operator.terms = dict(operator_terms)
+    return operator
+
+
+def load_operator(file_name=None, data_directory=None, mmap_mode=None):
+    """Load an operator from file.
+
+    Files written by save_operator are uncompressed .npz archives which
+    can also be read directly with numpy.load. Files written by an
+    OperatorStreamWriter are summed into a single operator. Files in the
+    earlier marshal format are still supported.
+
+    Args:
+        file_name: The name of the saved file.
+        data_directory: Optional data directory to change from default data
+                        directory specified in config file.
+        mmap_mode: Optional mode, such as 'r' or 'c', with which to
+                   memory-map the stored arrays instead of reading them.
+                   The tensors of a PolynomialTensor are then backed by
+                   the file.
+
+    Returns:
+        operator: The stored FermionOperator, QubitOperator,
+            InteractionOperator, InteractionRDM, QuadraticHamiltonian or
+            PolynomialTensor.
+
+    Raises:
+        TypeError: Operator of invalid type.
+        OperatorUtilsError: Unsupported file version.
+    """
+    file_path = get_file_path(file_name, data_directory)
+
+    if not zipfile.is_zipfile(file_path):
+        with open(file_path, 'rb') as f:
+            is_stream = f.read(len(numpy.lib.format.MAGIC_PREFIX)) == (
+                numpy.lib.format.MAGIC_PREFIX)
+        if not is_stream:
+            return _load_marshal_operator(file_path)
+        operator_stream = OperatorStreamReader(file_name, data_directory)
+        operator = operator_stream.operator_type()
+        for chunk in operator_stream:
+            operator += chunk
+        return operator
+
+    if mmap_mode is None:
+        with numpy.load(file_path) as npz_file:
+            data = dict(npz_file.items())
+    else:
+        data = _memory_map_npz(file_path, mmap_mode)
+
+    if int(data['version']) > _SPARSE_OPERATOR_FILE_VERSION:
+        raise OperatorUtilsError('Unsupported file version {}.'.format(
+            int(data['version'])))
+    operator_type = str(data['operator_type'])
+
+    if operator_type in ('FermionOperator', 'QubitOperator'):
+        return _unpack_terms(operator_type, data)
+
+    # Rebuild the tensors of a PolynomialTensor.
+    n_body_tensors = {}
+    for name in data:
+        if name.startswith('tensor'):
+            key = tuple(int(action) for action in name.split('_')[1:])
+            n_body_tensors[key] = data[name]
+        elif name.startswith('sparse') and name.endswith('_shape'):
+            name = name[:-len('_shape')]
+            key = tuple(int(action) for action in name.split('_')[1:])
+            n_body_tensors[key] = SparseTensor._from_keys(
+                tuple(data[name + '_shape']), data[name + '_keys'],
+                data[name + '_values'], canonical=True)
+    if 'constant' in data:
+        n_body_tensors[()] = data['constant'][()]
+
+    if operator_type == 'InteractionOperator':
+        operator = InteractionOperator(n_body_tensors[()],
+                                       n_body_tensors[1, 0],
+                                       n_body_tensors[1, 1, 0, 0])
+    elif operator_type == 'InteractionRDM':
+        operator = InteractionRDM(n_body_tensors[1, 0],
+                                  n_body_tensors[1, 1, 0, 0])
+    elif operator_type == 'QuadraticHamiltonian':
+        chemical_potential = float(data['chemical_potential'])
+        operator = QuadraticHamiltonian(
+            n_body_tensors[()],
+            n_body_tensors[1, 0] + chemical_potential *
+            numpy.eye(n_body_tensors[1, 0].shape[0]),
+            2. * n_body_tensors[1, 1] if (1, 1) in n_body_tensors else None,
+            chemical_potential)
+    elif operator_type == 'PolynomialTensor':
+        operator = PolynomialTensor(n_body_tensors)
     else:
         raise TypeError('Operator of invalid type.')
 
@@ -274,10 +448,22 @@ def load_operator(file_name=None, data_directory=None):
 
 
 def save_operator(operator, file_name=None, data_directory=None):
-    """Save FermionOperator or QubitOperator to file.
+    """Save an operator to file.
+
+    The operator is stored as an uncompressed .npz archive with a 'version'
+    and an 'operator_type' entry. The terms of a FermionOperator or
+    QubitOperator are stored as flat integer arrays: 'modes' holds the
+    mode of every ladder or Pauli operator, 'actions' holds its action
+    (0 or 1) or Pauli code (1, 2, 3 for X, Y, Z), 'term_offsets' holds
+    where each term starts and 'coefficients' holds the complex
+    coefficients. The tensors of a PolynomialTensor are stored as raw
+    arrays named after their keys, e.g. 'tensor_1_0', along with the
+    'constant'. A SparseTensor is stored as its 'keys', 'values' and
+    'shape' arrays, e.g. 'sparse_1_0_keys', and such files have version 2.
 
     Args:
-        operator: An instance of FermionOperator or QubitOperator.
+        operator: An instance of FermionOperator, QubitOperator or
+            PolynomialTensor, e.g. an InteractionOperator.
         file_name: The name of the saved file.
         data_directory: Optional data directory to change from default data
                         directory specified in config file.
@@ -291,18 +477,190 @@ def save_operator(operator, file_name=None, data_directory=None):
     if os.path.isfile(file_path):
         raise OperatorUtilsError("Not saved, file already exists.")
 
-    if isinstance(operator, FermionOperator):
-        operator_type = "FermionOperator"
-    elif isinstance(operator, QubitOperator):
-        operator_type = "QubitOperator"
-    elif (isinstance(operator, InteractionOperator) or
-          isinstance(operator, InteractionRDM)):
-        raise NotImplementedError('Not yet implemented for InteractionOperator'
-                                  ' or InteractionRDM.')
+    data = {'version': numpy.array(_OPERATOR_FILE_VERSION)}
+    if isinstance(operator, (FermionOperator, QubitOperator)):
+        operator_type = type(operator).__name__
+        data.update(_pack_terms(operator.terms))
+    elif isinstance(operator, PolynomialTensor):
+        operator_type = type(operator).__name__
+        if not isinstance(operator, (InteractionOperator, InteractionRDM,
+                                     QuadraticHamiltonian)):
+            operator_type = 'PolynomialTensor'
+        for key, tensor in operator.n_body_tensors.items():
+            if key == ():
+                data['constant'] = numpy.array(tensor)
+            elif isinstance(tensor, SparseTensor):
+                name = 'sparse_' + '_'.join(str(action) for action in key)
+                data[name + '_keys'] = tensor.keys
+                data[name + '_values'] = tensor.values
+                data[name + '_shape'] = numpy.array(tensor.shape)
+                data['version'] = numpy.array(_SPARSE_OPERATOR_FILE_VERSION)
+            else:
+                name = 'tensor_' + '_'.join(str(action) for action in key)
+                data[name] = numpy.asarray(tensor)
+        if isinstance(operator, QuadraticHamiltonian):
+            data['chemical_potential'] = numpy.array(
+                operator.chemical_potential)
     else:
         raise TypeError('Operator of invalid type.')
+    data['operator_type'] = numpy.array(operator_type)
 
-    tm = operator.terms
     with open(file_path, 'wb') as f:
-        marshal.dump((operator_type, dict(zip(tm.keys(),
-                                          map(complex, tm.values())))), f)
+        numpy.savez(f, **data)
+
+
+class OperatorStreamWriter(object):
+    """Write a FermionOperator or QubitOperator to file in chunks of terms.
+
+    This allows an operator to be saved while it is being generated without
+    ever holding all of its terms in memory. The stored operator is the sum
+    of everything passed to write, so the same term may be written more
+    than once. The file is read back with OperatorStreamReader, or as a
+    whole with load_operator.
+
+    The file is a sequence of .npy arrays: a header holding the format
+    version and the number of qubits, the operator type, and then the
+    'term_offsets', 'modes', 'actions' and 'coefficients' arrays of each
+    chunk in the layout used by save_operator.
+
+    Example:
+        .. code-block:: python
+
+            with OperatorStreamWriter(FermionOperator, 'ham') as writer:
+                for term, coefficient in generate_terms():
+                    writer.write(FermionOperator(term, coefficient))
+
+    Attributes:
+        operator_type: The class of the operator, FermionOperator or
+            QubitOperator.
+        n_qubits(int): The number of qubits of the terms written so far.
+        chunk_size(int): The number of terms buffered before writing.
+    """
+
+    def __init__(self, operator_type, file_name=None, data_directory=None,
+                 chunk_size=100000):
+        """Create the file and write its header.
+
+        Args:
+            operator_type: FermionOperator or QubitOperator.
+            file_name: The name of the saved file.
+            data_directory: Optional data directory to change from default
+                data directory specified in config file.
+            chunk_size(int): The number of terms buffered before writing.
+
+        Raises:
+            OperatorUtilsError: File already exists.
+            TypeError: Operator of invalid type.
+        """
+        if operator_type not in (FermionOperator, QubitOperator):
+            raise TypeError('Operator of invalid type.')
+        file_path = get_file_path(file_name, data_directory)
+        if os.path.isfile(file_path):
+            raise OperatorUtilsError("Not saved, file already exists.")
+
+        self.operator_type = operator_type
+        self.n_qubits = 0
+        self.chunk_size = chunk_size
+        self._buffer = operator_type()
+
+        # The number of qubits is patched into the header upon closing.
+        self._file = open(file_path, 'wb')
+        header = numpy.array([_OPERATOR_FILE_VERSION, 0], dtype=numpy.int64)
+        numpy.lib.format.write_array(self._file, header)
+        self._header_offset = self._file.tell() - header.nbytes
+        numpy.lib.format.write_array(self._file,
+                                     numpy.array(operator_type.__name__))
+
+    def write(self, operator):
+        """Add the terms of an operator to the stream.
+
+        Args:
+            operator: An operator of the type given upon construction.
+
+        Raises:
+            TypeError: Operator of invalid type.
+        """
+        if not isinstance(operator, self.operator_type):
+            raise TypeError('Operator of invalid type.')
+        self.n_qubits = max(self.n_qubits, count_qubits(operator))
+        self._buffer += operator
+        if len(self._buffer.terms) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered terms to file as one chunk."""
+        if not self._buffer.terms:
+            return
+        arrays = _pack_terms(self._buffer.terms)
+        for name in ('term_offsets', 'modes', 'actions', 'coefficients'):
+            numpy.lib.format.write_array(self._file, arrays[name])
+        self._file.flush()
+        self._buffer = self.operator_type()
+
+    def close(self):
+        """Write the remaining terms and the number of qubits."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.seek(self._header_offset)
+        self._file.write(numpy.array([_OPERATOR_FILE_VERSION, self.n_qubits],
+                                     dtype=numpy.int64).tobytes())
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+
+class OperatorStreamReader(object):
+    """Iterate over an operator written by an OperatorStreamWriter.
+
+    Iterating yields one FermionOperator or QubitOperator per stored chunk,
+    so only a single chunk of terms is in memory at a time. The sum of all
+    chunks is the stored operator.
+
+    Attributes:
+        operator_type: The class of the operator, FermionOperator or
+            QubitOperator.
+        n_qubits(int): The number of qubits on which the operator acts.
+    """
+
+    def __init__(self, file_name=None, data_directory=None):
+        """Read the header of the file.
+
+        Args:
+            file_name: The name of the saved file.
+            data_directory: Optional data directory to change from default
+                data directory specified in config file.
+
+        Raises:
+            OperatorUtilsError: Unsupported file version.
+            TypeError: Operator of invalid type.
+        """
+        self._file_path = get_file_path(file_name, data_directory)
+        with open(self._file_path, 'rb') as f:
+            version, self.n_qubits = (
+                int(value) for value in numpy.lib.format.read_array(f))
+            operator_type = str(numpy.lib.format.read_array(f))
+            self._data_offset = f.tell()
+        if version > _OPERATOR_FILE_VERSION:
+            raise OperatorUtilsError(
+                'Unsupported file version {}.'.format(version))
+        if operator_type == 'FermionOperator':
+            self.operator_type = FermionOperator
+        elif operator_type == 'QubitOperator':
+            self.operator_type = QubitOperator
+        else:
+            raise TypeError('Operator of invalid type.')
+
+    def __iter__(self):
+        with open(self._file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            f.seek(self._data_offset)
+            while f.tell() < file_size:
+                arrays = {name: numpy.lib.format.read_array(f) for name in
+                          ('term_offsets', 'modes', 'actions',
+                           'coefficients')}
+                yield _unpack_terms(self.operator_type.__name__, arrays)
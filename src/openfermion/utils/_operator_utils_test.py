@@ -13,6 +13,7 @@
 """Tests for operator_utils."""
 from __future__ import absolute_import
 
+import marshal
 import numpy
 import os
 import unittest
@@ -130,7 +131,7 @@ class SaveLoadOperatorTest(unittest.TestCase):
     def test_basic_save(self):
         save_operator(self.fermion_operator, self.file_name)
 
-    def test_save_interaction_operator_not_implemented(self):
+    def test_save_and_load_interaction_operator(self):
         constant = 100.0
         one_body = numpy.zeros((self.n_qubits, self.n_qubits), float)
         two_body = numpy.zeros((self.n_qubits, self.n_qubits,
@@ -139,8 +140,83 @@ class SaveLoadOperatorTest(unittest.TestCase):
         two_body[1, 2, 3, 4] = 12.0
         interaction_operator = InteractionOperator(
             constant, one_body, two_body)
-        with self.assertRaises(NotImplementedError):
-            save_operator(interaction_operator, self.file_name)
+        save_operator(interaction_operator, self.file_name)
+        loaded_operator = load_operator(self.file_name)
+        self.assertTrue(isinstance(loaded_operator, InteractionOperator))
+        self.assertEqual(interaction_operator, loaded_operator)
+        self.assertAlmostEqual(loaded_operator.constant, constant)
+
+    def test_save_and_load_interaction_rdm(self):
+        one_body = numpy.arange(4.).reshape((2, 2))
+        two_body = numpy.arange(16.).reshape((2, 2, 2, 2))
+        rdm = InteractionRDM(one_body, two_body)
+        save_operator(rdm, self.file_name)
+        loaded_rdm = load_operator(self.file_name)
+        self.assertTrue(isinstance(loaded_rdm, InteractionRDM))
+        self.assertEqual(rdm, loaded_rdm)
+
+    def test_save_and_load_quadratic_hamiltonian(self):
+        hermitian_part = numpy.array([[1., 2.j], [-2.j, 3.]])
+        antisymmetric_part = numpy.array([[0., 1.], [-1., 0.]])
+        quadratic_hamiltonian = QuadraticHamiltonian(
+            -1., hermitian_part, antisymmetric_part, 0.5)
+        save_operator(quadratic_hamiltonian, self.file_name)
+        loaded_hamiltonian = load_operator(self.file_name)
+        self.assertTrue(isinstance(loaded_hamiltonian, QuadraticHamiltonian))
+        self.assertEqual(quadratic_hamiltonian, loaded_hamiltonian)
+        self.assertAlmostEqual(loaded_hamiltonian.chemical_potential, 0.5)
+
+    def test_save_and_load_sparse_interaction_operator(self):
+        one_body = SparseTensor((self.n_qubits, self.n_qubits),
+                                [(1, 1)], [10.])
+        two_body = SparseTensor((self.n_qubits,) * 4,
+                                [(1, 2, 3, 4), (4, 3, 2, 1)], [12., 12.])
+        interaction_operator = InteractionOperator(100., one_body, two_body)
+        save_operator(interaction_operator, self.file_name)
+        loaded_operator = load_operator(self.file_name)
+        self.assertTrue(isinstance(loaded_operator, InteractionOperator))
+        self.assertTrue(isinstance(loaded_operator.two_body_tensor,
+                                   SparseTensor))
+        self.assertEqual(interaction_operator, loaded_operator)
+        self.assertAlmostEqual(loaded_operator.constant, 100.)
+
+        os.remove(os.path.join(DATA_DIRECTORY, self.file_name + '.data'))
+        save_operator(interaction_operator, self.file_name)
+        loaded_operator = load_operator(self.file_name, mmap_mode='r')
+        self.assertEqual(interaction_operator, loaded_operator)
+
+    def test_load_memory_mapped(self):
+        interaction_operator = get_interaction_operator(self.fermion_operator)
+        save_operator(interaction_operator, self.file_name)
+        loaded_operator = load_operator(self.file_name, mmap_mode='c')
+        self.assertTrue(isinstance(loaded_operator.two_body_tensor,
+                                   numpy.memmap))
+        self.assertEqual(interaction_operator, loaded_operator)
+
+        os.remove(os.path.join(DATA_DIRECTORY, self.file_name + '.data'))
+        save_operator(self.qubit_operator, self.file_name)
+        loaded_qubit_operator = load_operator(self.file_name, mmap_mode='r')
+        self.assertEqual(self.qubit_operator.terms,
+                         loaded_qubit_operator.terms)
+
+    def test_load_with_numpy(self):
+        save_operator(self.qubit_operator, self.file_name)
+        file_path = os.path.join(DATA_DIRECTORY, self.file_name + '.data')
+        with numpy.load(file_path) as data:
+            self.assertEqual(str(data['operator_type']), 'QubitOperator')
+            self.assertEqual(len(data['coefficients']),
+                             len(self.qubit_operator.terms))
+            self.assertEqual(data['term_offsets'][-1], len(data['modes']))
+
+    def test_load_marshal_format(self):
+        file_path = os.path.join(DATA_DIRECTORY, self.file_name + '.data')
+        with open(file_path, 'wb') as f:
+            terms = self.fermion_operator.terms
+            marshal.dump(('FermionOperator',
+                          {term: complex(terms[term]) for term in terms}), f)
+        loaded_fermion_operator = load_operator(self.file_name)
+        self.assertEqual(self.fermion_operator.terms,
+                         loaded_fermion_operator.terms)
 
     def test_save_on_top_of_existing_operator_utils_error(self):
         save_operator(self.fermion_operator, self.file_name)
@@ -156,6 +232,60 @@ class SaveLoadOperatorTest(unittest.TestCase):
             save_operator('ping', 'somewhere')
 
 
+class OperatorStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.fermion_operator = FermionOperator('1^ 2^ 3 4', -3.17)
+        self.fermion_operator += hermitian_conjugated(self.fermion_operator)
+        self.fermion_operator += FermionOperator('0^ 6', 2.j)
+        self.qubit_operator = jordan_wigner(self.fermion_operator)
+        self.file_name = "test_stream"
+        self.file_path = os.path.join(DATA_DIRECTORY,
+                                      self.file_name + '.data')
+
+    def tearDown(self):
+        if os.path.isfile(self.file_path):
+            os.remove(self.file_path)
+
+    def test_write_and_read_chunks(self):
+        with OperatorStreamWriter(QubitOperator, self.file_name,
+                                  chunk_size=3) as writer:
+            for term in self.qubit_operator.terms:
+                writer.write(QubitOperator(term,
+                                           self.qubit_operator.terms[term]))
+        self.assertEqual(writer.n_qubits, 7)
+
+        operator_stream = OperatorStreamReader(self.file_name)
+        self.assertEqual(operator_stream.operator_type, QubitOperator)
+        self.assertEqual(operator_stream.n_qubits, 7)
+        chunks = list(operator_stream)
+        self.assertEqual(len(chunks),
+                         (len(self.qubit_operator.terms) + 2) // 3)
+        self.assertTrue(max(len(chunk.terms) for chunk in chunks) <= 3)
+        total = QubitOperator()
+        for chunk in chunks:
+            total += chunk
+        self.assertTrue(total.isclose(self.qubit_operator))
+
+    def test_load_stream(self):
+        with OperatorStreamWriter(FermionOperator, self.file_name) as writer:
+            writer.write(self.fermion_operator)
+            writer.write(self.fermion_operator)
+        loaded_operator = load_operator(self.file_name)
+        self.assertTrue(loaded_operator.isclose(2 * self.fermion_operator))
+
+    def test_write_bad_type(self):
+        with self.assertRaises(TypeError):
+            OperatorStreamWriter(InteractionOperator, self.file_name)
+        with OperatorStreamWriter(FermionOperator, self.file_name) as writer:
+            with self.assertRaises(TypeError):
+                writer.write(self.qubit_operator)
+
+    def test_write_on_top_of_existing_operator_utils_error(self):
+        save_operator(self.fermion_operator, self.file_name)
+        with self.assertRaises(OperatorUtilsError):
+            OperatorStreamWriter(FermionOperator, self.file_name)
+
+
 class CommutatorTest(unittest.TestCase):
 
     def setUp(self):
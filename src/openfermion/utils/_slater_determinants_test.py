@@ -36,8 +36,11 @@ from openfermion.utils._slater_determinants import (
         double_givens_rotate,
         givens_rotate,
         givens_matrix_elements,
+        _jw_givens_rotation,
+        _jw_particle_hole_transformation_last_mode,
         jw_sparse_givens_rotation,
         jw_sparse_particle_hole_transformation_last_mode)
+from openfermion.utils._sparse_tools import jw_number_indices
 
 
 class GaussianStatePreparationCircuitTest(unittest.TestCase):
@@ -263,10 +266,46 @@ class JWGetGaussianStateTest(unittest.TestCase):
 
             self.assertTrue(discrepancy < EQ_TOLERANCE)
 
+    def test_fixed_particle_number(self):
+        """Test computing Slater determinants from determinants of the
+        occupied orbitals."""
+        for n_qubits in self.n_qubits_range:
+            quadratic_hamiltonian = random_quadratic_hamiltonian(
+                    n_qubits, True)
+            num_occupied_orbitals = numpy.random.randint(1, n_qubits + 1)
+            occupied_orbitals = numpy.random.choice(
+                    range(n_qubits), num_occupied_orbitals, False)
+
+            circuit_energy, circuit_state = jw_get_gaussian_state(
+                    quadratic_hamiltonian, occupied_orbitals)
+            energy, state = jw_get_gaussian_state(
+                    quadratic_hamiltonian, occupied_orbitals,
+                    fixed_particle_number=True)
+            restricted_energy, restricted_state = jw_get_gaussian_state(
+                    quadratic_hamiltonian, occupied_orbitals,
+                    restricted=True)
+            self.assertAlmostEqual(energy, circuit_energy)
+            self.assertAlmostEqual(restricted_energy, circuit_energy)
+
+            # Check that the states agree up to a global phase
+            circuit_state = circuit_state.toarray().ravel()
+            state = state.toarray().ravel()
+            overlap = numpy.vdot(state, circuit_state)
+            self.assertAlmostEqual(abs(overlap), 1.)
+            self.assertTrue(numpy.allclose(overlap * state, circuit_state))
+
+            # Check the restricted state
+            indices = jw_number_indices(num_occupied_orbitals, n_qubits)
+            self.assertTrue(numpy.allclose(restricted_state, state[indices]))
+
     def test_bad_input(self):
         """Test bad input."""
         with self.assertRaises(ValueError):
             energy, state = jw_get_gaussian_state('a')
+        with self.assertRaises(ValueError):
+            energy, state = jw_get_gaussian_state(
+                    random_quadratic_hamiltonian(3, False), [0],
+                    restricted=True)
 
 
 class GivensDecompositionTest(unittest.TestCase):
@@ -424,6 +463,33 @@ class GivensDecompositionTest(unittest.TestCase):
             for j in range(n):
                 self.assertAlmostEqual(D[i, j], W[i, j])
 
+    def test_batch(self):
+        m, n = 3, 7
+        unitaries = []
+        for _ in range(4):
+            x = numpy.random.randn(n, n)
+            y = numpy.random.randn(n, n)
+            Q, R = qr(x + 1.j * y)
+            unitaries.append(Q[:m, :])
+        # A matrix needing no rotations in its first layers
+        unitaries.append(numpy.eye(n, dtype=complex)[:m])
+
+        results = givens_decomposition(numpy.array(unitaries))
+        self.assertEqual(len(results), len(unitaries))
+        for Q, (givens_rotations, V, diagonal) in zip(unitaries, results):
+            expected_rotations, expected_V, expected_diagonal = (
+                    givens_decomposition(Q))
+            self.assertEqual(len(givens_rotations), len(expected_rotations))
+            for layer, expected_layer in zip(givens_rotations,
+                                             expected_rotations):
+                self.assertEqual(len(layer), len(expected_layer))
+                for op, expected_op in zip(layer, expected_layer):
+                    self.assertEqual(op[:2], expected_op[:2])
+                    self.assertAlmostEqual(op[2], expected_op[2])
+                    self.assertAlmostEqual(op[3], expected_op[3])
+            self.assertTrue(numpy.allclose(V, expected_V))
+            self.assertTrue(numpy.allclose(diagonal, expected_diagonal))
+
 
 class FermionicGaussianDecompositionTest(unittest.TestCase):
 
@@ -516,6 +582,36 @@ class FermionicGaussianDecompositionTest(unittest.TestCase):
             decomposition, left_unitary, antidiagonal = (
                     fermionic_gaussian_decomposition(ones_mat))
 
+    def test_batch(self):
+        n = 4
+        lower_unitaries = []
+        for _ in range(3):
+            antisymmetric_mat = random_antisymmetric_matrix(2 * n, real=True)
+            lower_unitaries.append(diagonalizing_fermionic_unitary(
+                    antisymmetric_mat)[n:])
+
+        results = fermionic_gaussian_decomposition(
+                numpy.array(lower_unitaries))
+        self.assertEqual(len(results), len(lower_unitaries))
+        for lower_unitary, result in zip(lower_unitaries, results):
+            expected = fermionic_gaussian_decomposition(lower_unitary)
+            for decomposition, expected_decomposition in zip(result[:2],
+                                                             expected[:2]):
+                self.assertEqual(len(decomposition),
+                                 len(expected_decomposition))
+                for layer, expected_layer in zip(decomposition,
+                                                 expected_decomposition):
+                    self.assertEqual(len(layer), len(expected_layer))
+                    for op, expected_op in zip(layer, expected_layer):
+                        if op == 'pht':
+                            self.assertEqual(expected_op, 'pht')
+                        else:
+                            self.assertEqual(op[:2], expected_op[:2])
+                            self.assertAlmostEqual(op[2], expected_op[2])
+                            self.assertAlmostEqual(op[3], expected_op[3])
+            self.assertTrue(numpy.allclose(result[2], expected[2]))
+            self.assertTrue(numpy.allclose(result[3], expected[3]))
+
 
 class DiagonalizingFermionicUnitaryTest(unittest.TestCase):
 
@@ -626,6 +722,32 @@ class AntisymmetricCanonicalFormTest(unittest.TestCase):
         for i in range(n - 1):
             self.assertTrue(diagonal[i] <= diagonal[i + 1])
 
+    def test_degenerate(self):
+        """Test a matrix with zero and repeated eigenvalues."""
+        n = 5
+        antisymmetric_matrix = numpy.zeros((2 * n, 2 * n))
+        antisymmetric_matrix[0, 3] = antisymmetric_matrix[6, 9] = 2.
+        antisymmetric_matrix[3, 0] = antisymmetric_matrix[9, 6] = -2.
+        orthogonal = numpy.linalg.qr(numpy.random.randn(2 * n, 2 * n))[0]
+        antisymmetric_matrix = orthogonal.dot(
+                antisymmetric_matrix.dot(orthogonal.T))
+        canonical, orthogonal = antisymmetric_canonical_form(
+                antisymmetric_matrix, debug=True)
+        diagonal = canonical[range(n), range(n, 2 * n)]
+        for i, value in enumerate([0., 0., 0., 2., 2.]):
+            self.assertAlmostEqual(value, diagonal[i])
+
+    def test_debug(self):
+        """Test the optional verification of the result."""
+        n = 4
+        rand_mat = numpy.random.randn(2 * n, 2 * n)
+        antisymmetric_matrix = rand_mat - rand_mat.T
+        canonical, orthogonal = antisymmetric_canonical_form(
+                antisymmetric_matrix, debug=True)
+        result_matrix = orthogonal.dot(antisymmetric_matrix.dot(orthogonal.T))
+        for i in numpy.ndindex(result_matrix.shape):
+            self.assertAlmostEqual(result_matrix[i], canonical[i])
+
 
 class GivensMatrixElementsTest(unittest.TestCase):
 
@@ -699,6 +821,36 @@ class JWSparseGivensRotationTest(unittest.TestCase):
             givens_matrix = jw_sparse_givens_rotation(4, 5, 1., 1., 5)
 
 
+class JWGivensRotationTest(unittest.TestCase):
+
+    def test_matches_sparse_givens_rotation(self):
+        n_qubits = 5
+        for i in range(n_qubits - 1):
+            theta, phi = numpy.random.randn(2)
+            state = (numpy.random.randn(2 ** n_qubits) +
+                     1.j * numpy.random.randn(2 ** n_qubits))
+            expected = jw_sparse_givens_rotation(
+                i, i + 1, theta, phi, n_qubits).dot(state)
+            _jw_givens_rotation(state, i, i + 1, theta, phi, n_qubits)
+            self.assertTrue(numpy.allclose(state, expected))
+
+    def test_matches_sparse_particle_hole_transformation(self):
+        n_qubits = 4
+        state = (numpy.random.randn(2 ** n_qubits) +
+                 1.j * numpy.random.randn(2 ** n_qubits))
+        expected = jw_sparse_particle_hole_transformation_last_mode(
+            n_qubits).dot(state)
+        _jw_particle_hole_transformation_last_mode(state)
+        self.assertTrue(numpy.allclose(state, expected))
+
+    def test_bad_input(self):
+        state = numpy.zeros(2 ** 5, dtype=complex)
+        with self.assertRaises(ValueError):
+            _jw_givens_rotation(state, 0, 2, 1., 1., 5)
+        with self.assertRaises(ValueError):
+            _jw_givens_rotation(state, 4, 5, 1., 1., 5)
+
+
 def random_quadratic_hamiltonian(n_qubits,
                                  conserves_particle_number=False,
                                  real=False):
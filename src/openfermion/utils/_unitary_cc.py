@@ -48,7 +48,8 @@ def uccsd_operator(single_amplitudes, double_amplitudes, anti_hermitian=True):
         is the generator for the uccsd wavefunction.
     """
 
-    uccsd_generator = FermionOperator()
+    terms = []
+    coefficients = []
 
     # Re-format inputs (ndarrays to lists) if necessary
     if (isinstance(single_amplitudes, numpy.ndarray) or
@@ -60,19 +61,21 @@ def uccsd_operator(single_amplitudes, double_amplitudes, anti_hermitian=True):
     # Add single excitations
     for (i, j), t_ij in single_amplitudes:
         i, j = int(i), int(j)
-        uccsd_generator += FermionOperator(((i, 1), (j, 0)), t_ij)
+        terms.append(((i, 1), (j, 0)))
+        coefficients.append(t_ij)
         if anti_hermitian:
-            uccsd_generator += FermionOperator(((j, 1), (i, 0)), -t_ij)
+            terms.append(((j, 1), (i, 0)))
+            coefficients.append(-t_ij)
 
     # Add double excitations
     for (i, j, k, l), t_ijkl in double_amplitudes:
         i, j, k, l = int(i), int(j), int(k), int(l)
-        uccsd_generator += FermionOperator(
-            ((i, 1), (j, 0), (k, 1), (l, 0)), t_ijkl)
+        terms.append(((i, 1), (j, 0), (k, 1), (l, 0)))
+        coefficients.append(t_ijkl)
         if anti_hermitian:
-            uccsd_generator += FermionOperator(
-                ((l, 1), (k, 0), (j, 1), (i, 0)), -t_ijkl)
-    return uccsd_generator
+            terms.append(((l, 1), (k, 0), (j, 1), (i, 0)))
+            coefficients.append(-t_ijkl)
+    return FermionOperator.from_terms(terms, coefficients)
 
 
 def uccsd_convert_amplitude_format(single_amplitudes, double_amplitudes):
@@ -162,7 +165,8 @@ def uccsd_singlet_operator(packed_amplitudes,
                 k * n_occupied +
                 l)
 
-    uccsd_generator = FermionOperator()
+    terms = []
+    coefficients = []
 
     # Define a compound space that is partitioned into occupied, virtual, spins
     # the spin component assumes alpha spins are even, beta spins are odd
@@ -170,30 +174,30 @@ def uccsd_singlet_operator(packed_amplitudes,
 
     # Generate all spin-conserving single excitations between occupied-virtual
     for i, j, s in itertools.product(*spaces):
-        uccsd_generator += FermionOperator((
+        terms.append((
             (2 * (i + n_occupied) + s, 1),
-            (2 * j + s, 0)),
-            t1[t1_ind(i, j)])
+            (2 * j + s, 0)))
+        coefficients.append(t1[t1_ind(i, j)])
 
-        uccsd_generator += FermionOperator((
+        terms.append((
             (2 * j + s, 1),
-            (2 * (i + n_occupied) + s, 0)),
-            -t1[t1_ind(i, j)])
+            (2 * (i + n_occupied) + s, 0)))
+        coefficients.append(-t1[t1_ind(i, j)])
 
     # Generate all spin-conserving double excitations between occupied-virtual
     for i, j, s, i2, j2, s2 in itertools.product(*spaces, repeat=2):
-        uccsd_generator += FermionOperator((
+        terms.append((
             (2 * (i + n_occupied) + s, 1),
             (2 * j + s, 0),
             (2 * (i2 + n_occupied) + s2, 1),
-            (2 * j2 + s2, 0)),
-            t2[t2_ind(i, j, i2, j2)])
+            (2 * j2 + s2, 0)))
+        coefficients.append(t2[t2_ind(i, j, i2, j2)])
 
-        uccsd_generator += FermionOperator((
+        terms.append((
             (2 * j2 + s2, 1),
             (2 * (i2 + n_occupied) + s2, 0),
             (2 * j + s, 1),
-            (2 * (i + n_occupied) + s, 0)),
-            -t2[t2_ind(i, j, i2, j2)])
+            (2 * (i + n_occupied) + s, 0)))
+        coefficients.append(-t2[t2_ind(i, j, i2, j2)])
 
-    return uccsd_generator
+    return FermionOperator.from_terms(terms, coefficients)